@@ -91,13 +91,13 @@ class BackToLifeCLI:
         print("=" * 60)
         print()
 
-        category = quest[1].replace('_', ' ').title()
+        category = quest.category.replace('_', ' ').title()
         print(f"Category: {category}")
         print()
 
-        print(f"📋 {quest[2]}")  # title
+        print(f"📋 {quest.title}")
         print()
-        print(f"Description: {quest[3]}")  # description
+        print(f"Description: {quest.description}")
         print()
 
         time_of_day = self.context_engine.get_time_of_day()
@@ -106,10 +106,10 @@ class BackToLifeCLI:
         print()
 
         print(f"Instructions:")
-        print(f"  {quest[9]}")  # instructions (index 9)
+        print(f"  {quest.instructions}")
         print()
 
-        print(f"XP Reward: {quest[5]} XP")
+        print(f"XP Reward: {quest.xp_value} XP")
         print()
 
         print("-" * 60)
@@ -126,8 +126,8 @@ class BackToLifeCLI:
 
     def complete_quest(self, quest):
         """Mark quest as complete"""
-        quest_id = quest[0]
-        xp_earned = quest[5]
+        quest_id = quest.id
+        xp_earned = quest.xp_value
 
         leveled_up = self.db.complete_quest(quest_id, xp_earned, was_primary=True)
 
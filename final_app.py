@@ -12,16 +12,54 @@ from src.services.database import Database
 from src.data.quest_database import initialize_quest_database
 from src.utils.context_engine import ContextEngine
 from src.services.audio_service import get_audio_service
-
-# Import all tab screens
-from src.screens.final.home_tab import HomeTab
-from src.screens.final.learn_tab import LearnTab
-from src.screens.final.tools_tab import ToolsTab
-from src.screens.final.guides_tab import GuidesTab
-from src.screens.final.progress_tab import ProgressTab
-from src.screens.final.reflection_tab import ReflectionTab
-from src.screens.final.shield_tab import ShieldTab
-from src.screens.final.settings_tab import SettingsTab
+from src.services.prefetch import Prefetcher
+from src.data.audio_scripts import ANNOUNCEMENTS, quest_scripts
+
+# Tab screens are imported on first use (see src/screens/final/__init__.py)
+from src.screens import final as tabs
+
+
+TAB_CLASSES = {
+    "home": "HomeTab",
+    "learn": "LearnTab",
+    "tools": "ToolsTab",
+    "guides": "GuidesTab",
+    "progress": "ProgressTab",
+    "reflection": "ReflectionTab",
+    "shield": "ShieldTab",
+    "settings": "SettingsTab"
+}
+
+# Tabs whose data is loaded in the background once the app goes idle
+PREFETCH_TABS = ("progress", "reflection")
+PREFETCH_IDLE_MS = 1500
+
+# The speech engine is created once the window is up; fixed audio scripts
+# are rendered into the TTS cache a little later
+AUDIO_START_DELAY_MS = 500
+AUDIO_WARMUP_DELAY_MS = 3000
+
+
+# Quick access buttons per tab: (text, width, fg_color or None for default)
+QUICK_ACTIONS = {
+    "home": [
+        ("⚡ Start Quest", 120, None),
+        ("🛡️ Shield", 100, "#666666")
+    ],
+    "learn": [
+        ("💡 Review Cards", 140, None),
+        ("🎯 Take Quiz", 120, None)
+    ],
+    "shield": [
+        ("🆘 Crisis Line", 130, "#CC0000"),
+        ("🧘 Ground Now", 130, None)
+    ]
+}
+
+
+def get_tab_class(tab_id):
+    """Tab class for tab_id, importing its module on first use"""
+    return getattr(tabs, TAB_CLASSES[tab_id])
 
 
 class BackToLifeFinal(ctk.CTk):
@@ -52,9 +90,17 @@ class BackToLifeFinal(ctk.CTk):
         self.context_engine = ContextEngine(self.db)
         self.audio = get_audio_service()
 
-        # Current tab tracking
+        # Current tab tracking. Built tabs stay alive and are hidden with
+        # grid_remove(); tab_versions holds the cache versions of each tab's
+        # DATA_NAMESPACES when it was last built, to spot stale tabs.
         self.current_tab = "home"
         self.tab_widgets = {}
+        self.tab_versions = {}
+
+        # Background data loading for likely-next tabs
+        self.prefetcher = Prefetcher(self, self.db.db_path)
+        self.prefetched = {}  # tab_id -> (cache generation, data)
+        self._prefetch_after_id = None
 
         # Setup UI
         self.setup_ui()
@@ -62,6 +108,10 @@ class BackToLifeFinal(ctk.CTk):
         # Show home by default
         self.show_tab("home")
 
+        # Start the speech engine once the window is up, then pre-render fixed speech
+        self.after(AUDIO_START_DELAY_MS, self.audio.start)
+        self.after(AUDIO_WARMUP_DELAY_MS, self.warm_up_audio)
+
     def setup_ui(self):
         """Setup main application UI with navigation"""
         # Configure grid
@@ -200,71 +250,54 @@ class BackToLifeFinal(ctk.CTk):
         self.quick_bar_buttons = ctk.CTkFrame(self.quick_bar, fg_color="transparent")
         self.quick_bar_buttons.pack(side="left", padx=20, pady=10)
 
-        # Will be populated based on current tab
+        # One button set per tab, built on first use and then just swapped
+        self.quick_bar_sets = {}
+        self.quick_bar_tab = None
         self.update_quick_bar()
 
     def update_quick_bar(self):
         """Update quick access bar based on current tab"""
-        # Clear existing buttons
-        for widget in self.quick_bar_buttons.winfo_children():
-            widget.destroy()
-
-        # Add context-appropriate buttons
-        if self.current_tab == "home":
-            ctk.CTkButton(
-                self.quick_bar_buttons,
-                text="⚡ Start Quest",
-                width=120,
-                height=40,
-                font=("Arial", 13)
-            ).pack(side="left", padx=5)
-
-            ctk.CTkButton(
-                self.quick_bar_buttons,
-                text="🛡️ Shield",
-                width=100,
-                height=40,
-                font=("Arial", 13),
-                fg_color="#666666"
-            ).pack(side="left", padx=5)
-
-        elif self.current_tab == "learn":
-            ctk.CTkButton(
-                self.quick_bar_buttons,
-                text="💡 Review Cards",
-                width=140,
-                height=40,
-                font=("Arial", 13)
-            ).pack(side="left", padx=5)
-
-            ctk.CTkButton(
-                self.quick_bar_buttons,
-                text="🎯 Take Quiz",
-                width=120,
-                height=40,
-                font=("Arial", 13)
-            ).pack(side="left", padx=5)
-
-        elif self.current_tab == "shield":
+        if self.quick_bar_tab == self.current_tab:
+            return
+
+        previous = self.quick_bar_sets.get(self.quick_bar_tab)
+        if previous is not None:
+            previous.pack_forget()
+        self.quick_bar_tab = self.current_tab
+
+        if self.current_tab not in self.quick_bar_sets:
+            self.quick_bar_sets[self.current_tab] = self.create_quick_bar_set(self.current_tab)
+
+        button_set = self.quick_bar_sets[self.current_tab]
+        if button_set is not None:
+            button_set.pack(side="left")
+
+    def create_quick_bar_set(self, tab_id):
+        """Build the quick action buttons for one tab (None if it has none)"""
+        actions = QUICK_ACTIONS.get(tab_id)
+        if not actions:
+            return None
+
+        button_set = ctk.CTkFrame(self.quick_bar_buttons, fg_color="transparent")
+        for text, width, color in actions:
+            options = {"fg_color": color} if color else {}
             ctk.CTkButton(
-                self.quick_bar_buttons,
-                text="🆘 Crisis Line",
-                width=130,
+                button_set,
+                text=text,
+                width=width,
                 height=40,
                 font=("Arial", 13),
-                fg_color="#CC0000"
-            ).pack(side="left", padx=5)
-
-            ctk.CTkButton(
-                self.quick_bar_buttons,
-                text="🧘 Ground Now",
-                width=130,
-                height=40,
-                font=("Arial", 13)
+                **options
             ).pack(side="left", padx=5)
+        return button_set
 
     def show_tab(self, tab_id):
         """Show selected tab"""
+        # Hide the previous tab; its widgets stay alive for next time
+        previous = self.tab_widgets.get(self.current_tab)
+        if previous is not None and self.current_tab != tab_id:
+            previous.grid_remove()
+
         # Update current tab
         self.current_tab = tab_id
 
@@ -275,13 +308,13 @@ class BackToLifeFinal(ctk.CTk):
             else:
                 btn.configure(fg_color="#2a2a2a" if btn_id != "settings" else "#444444")
 
-        # Clear content area
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Create or get tab widget
+        # Create the tab on first visit, refresh it only if a write made it stale
         if tab_id not in self.tab_widgets:
+            self.tab_versions[tab_id] = self.data_versions(tab_id)
             self.tab_widgets[tab_id] = self.create_tab_widget(tab_id)
+        elif self.is_tab_stale(tab_id):
+            self.tab_versions[tab_id] = self.data_versions(tab_id)
+            self.tab_widgets[tab_id].refresh(data=self.take_prefetched(tab_id))
 
         # Show tab widget
         tab_widget = self.tab_widgets[tab_id]
@@ -291,26 +324,75 @@ class BackToLifeFinal(ctk.CTk):
         # Update quick access bar
         self.update_quick_bar()
 
+        # Warm up likely-next tabs once the user settles here
+        self.schedule_prefetch()
+
     def create_tab_widget(self, tab_id):
         """Create widget for specified tab"""
+        if tab_id not in TAB_CLASSES:
+            return None
+
+        tab_class = get_tab_class(tab_id)
         if tab_id == "home":
-            return HomeTab(self.content_frame, self.db, self.context_engine, self.audio)
-        elif tab_id == "learn":
-            return LearnTab(self.content_frame, self.db, self.audio)
-        elif tab_id == "tools":
-            return ToolsTab(self.content_frame, self.db, self.audio)
-        elif tab_id == "guides":
-            return GuidesTab(self.content_frame, self.db, self.audio)
-        elif tab_id == "progress":
-            return ProgressTab(self.content_frame, self.db, self.audio)
-        elif tab_id == "reflection":
-            return ReflectionTab(self.content_frame, self.db, self.audio)
-        elif tab_id == "shield":
-            return ShieldTab(self.content_frame, self.db, self.audio)
-        elif tab_id == "settings":
-            return SettingsTab(self.content_frame, self.db, self.audio)
+            return tab_class(self.content_frame, self.db, self.context_engine, self.audio)
+
+        data = self.take_prefetched(tab_id)
+        if data is not None:
+            return tab_class(self.content_frame, self.db, self.audio, data=data)
+        return tab_class(self.content_frame, self.db, self.audio)
+
+    def data_versions(self, tab_id):
+        """Current cache versions of the namespaces a tab reads"""
+        namespaces = getattr(get_tab_class(tab_id), 'DATA_NAMESPACES', ())
+        return self.db.cache.versions(*namespaces)
+
+    def is_tab_stale(self, tab_id):
+        """True if a built tab reads data that has been written since"""
+        tab_widget = self.tab_widgets.get(tab_id)
+        if tab_widget is None or not hasattr(tab_widget, 'refresh'):
+            return False
+        return self.tab_versions.get(tab_id) != self.data_versions(tab_id)
+
+    def schedule_prefetch(self):
+        """(Re)start the idle timer for background prefetching"""
+        if self._prefetch_after_id is not None:
+            self.after_cancel(self._prefetch_after_id)
+        self._prefetch_after_id = self.after(PREFETCH_IDLE_MS, self.prefetch_tabs)
+
+    def prefetch_tabs(self):
+        """Load data for tabs the user is likely to open next"""
+        self._prefetch_after_id = None
+        for tab_id in PREFETCH_TABS:
+            if tab_id == self.current_tab:
+                continue
+            if tab_id in self.tab_widgets and not self.is_tab_stale(tab_id):
+                continue
+            cached = self.prefetched.get(tab_id)
+            if cached and self.prefetcher.is_fresh(cached[0]):
+                continue
+            # The worker imports the tab module too, keeping that off the UI thread
+            self.prefetcher.submit(
+                tab_id,
+                lambda db, t=tab_id: get_tab_class(t).prefetch(db),
+                lambda data, generation, t=tab_id: self.store_prefetched(t, data, generation)
+            )
+
+    def store_prefetched(self, tab_id, data, generation):
+        """Keep prefetched data until the tab is built (runs on the UI thread)"""
+        self.prefetched[tab_id] = (generation, data)
+
+    def take_prefetched(self, tab_id):
+        """Prefetched data for tab_id, or None if missing or stale"""
+        generation, data = self.prefetched.pop(tab_id, (None, None))
+        if data is not None and self.prefetcher.is_fresh(generation):
+            return data
         return None
 
+    def warm_up_audio(self):
+        """Pre-render fixed speech: crisis announcements first, then quest scripts"""
+        self.audio.warm_up(ANNOUNCEMENTS.values())
+        self.audio.warm_up(quest_scripts(), streamed=True)
+
     def toggle_audio(self):
         """Toggle audio on/off"""
         enabled = self.audio.toggle()
@@ -327,7 +409,10 @@ class BackToLifeFinal(ctk.CTk):
 
     def run(self):
         """Start the application"""
-        self.mainloop()
+        try:
+            self.mainloop()
+        finally:
+            self.prefetcher.close()
 
 
 if __name__ == "__main__":
@@ -3,5 +3,6 @@ BackToLife Components
 """
 from .flashcard import FlashcardWidget, FlashcardManager
 from .quiz import QuizWidget
+from .virtual_list import VirtualList
 
-__all__ = ['FlashcardWidget', 'FlashcardManager', 'QuizWidget']
+__all__ = ['FlashcardWidget', 'FlashcardManager', 'QuizWidget', 'VirtualList']
@@ -150,63 +150,18 @@ class FlashcardWidget(ctk.CTkFrame):
 class FlashcardManager:
     """
     Manages flashcard database and spaced repetition
+
+    Scheduling is SM-2 (see src/services/spaced_repetition.py): each card
+    has a state row that a review updates in place.
     """
 
     def __init__(self, db):
         self.db = db
-        self._init_flashcard_table()
-
-    def _init_flashcard_table(self):
-        """Initialize flashcard tracking table"""
-        self.db.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS flashcard_reviews (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                flashcard_id TEXT,
-                review_date TEXT,
-                correct BOOLEAN,
-                next_review_date TEXT
-            )
-        ''')
-        self.db.conn.commit()
 
     def record_review(self, flashcard_id, correct=True):
         """Record that user reviewed a flashcard"""
-        from datetime import datetime, timedelta
-
-        # Simple spaced repetition: show again tomorrow, then in 3 days, then in 7 days
-        self.db.cursor.execute('''
-            SELECT COUNT(*) FROM flashcard_reviews
-            WHERE flashcard_id = ?
-        ''', (flashcard_id,))
-
-        review_count = self.db.cursor.fetchone()[0]
-
-        # Calculate next review date
-        if review_count == 0:
-            days_until_next = 1  # Tomorrow
-        elif review_count == 1:
-            days_until_next = 3  # 3 days
-        else:
-            days_until_next = 7  # Weekly
-
-        next_review = (datetime.now() + timedelta(days=days_until_next)).isoformat()
-
-        self.db.cursor.execute('''
-            INSERT INTO flashcard_reviews (flashcard_id, review_date, correct, next_review_date)
-            VALUES (?, ?, ?, ?)
-        ''', (flashcard_id, datetime.now().isoformat(), correct, next_review))
-
-        self.db.conn.commit()
+        return self.db.record_flashcard_review(flashcard_id, correct)
 
     def get_due_flashcards(self):
         """Get flashcards that are due for review"""
-        from datetime import datetime
-
-        self.db.cursor.execute('''
-            SELECT flashcard_id, next_review_date
-            FROM flashcard_reviews
-            WHERE next_review_date <= ?
-            ORDER BY next_review_date
-        ''', (datetime.now().isoformat(),))
-
-        return self.db.cursor.fetchall()
+        return self.db.get_due_flashcards()
@@ -0,0 +1,230 @@
+"""
+Virtual List Component - Scrolling list that only builds what is visible
+Keeps a small pool of row widgets and rebinds them to data while scrolling,
+so a list of hundreds of items costs about one screenful of widgets
+"""
+import sys
+import tkinter
+from bisect import bisect_left, bisect_right
+
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Virtualized, pooled replacement for a CTkScrollableFrame of cards
+
+    Rows are embedded in a canvas at known offsets. Only rows inside the
+    viewport (plus `buffer` rows on each side) are placed; rows that
+    scroll out go back to a per-kind pool and are rebound to new items.
+
+    - create_row(parent, kind) builds one reusable row widget
+    - bind_row(row, item) fills a row with an item's data
+    - row_height is a number or a function of the item
+    - row_kind(item) picks the pool for lists mixing row layouts
+    - on_reach_end() is called once the last item is rendered, for paging
+    """
+
+    SCROLL_STEP = 30  # pixels per wheel "unit"
+
+    def __init__(self, parent, create_row, bind_row, row_height, row_kind=None,
+                 row_gap=0, buffer=2, empty_text=None, on_reach_end=None,
+                 height=400, fg_color="transparent", **kwargs):
+        super().__init__(parent, fg_color=fg_color, **kwargs)
+
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.row_kind = row_kind
+        self.row_gap = row_gap
+        self.buffer = buffer
+        self.on_reach_end = on_reach_end
+
+        self._items = []
+        self._offsets = [0]  # _offsets[i] is the top of row i
+        self._active = {}  # item index -> row widget
+        self._pool = {}  # kind -> free row widgets
+        self._all_rows = []
+        self._end_notified = False
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._canvas = tkinter.Canvas(
+            self,
+            height=height,
+            highlightthickness=0,
+            borderwidth=0,
+            bg=self._canvas_color(),
+            yscrollincrement=self.SCROLL_STEP
+        )
+        self._canvas.grid(row=0, column=0, sticky="nsew")
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._canvas.yview)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+        self._canvas.configure(yscrollcommand=self._on_yview)
+        self._canvas.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self._canvas)
+
+        self._empty_label = None
+        if empty_text:
+            self._empty_label = ctk.CTkLabel(
+                self,
+                text=empty_text,
+                font=("Arial", 14),
+                text_color="#888888"
+            )
+
+    def set_items(self, items):
+        """Show a new list of items, scrolled to the top"""
+        for index in list(self._active):
+            self._release(index)
+        self._items = list(items)
+        self._offsets = [0]
+        self._extend_offsets(self._items)
+        self._end_notified = False
+        self._update_scrollregion()
+        self._canvas.yview_moveto(0)
+
+        if self._empty_label is not None:
+            if self._items:
+                self._empty_label.place_forget()
+            else:
+                self._empty_label.place(relx=0.5, y=40, anchor="n")
+
+        self._render()
+
+    def append_items(self, items):
+        """Add items at the end, keeping the scroll position"""
+        items = list(items)
+        if not items:
+            return
+        self._items.extend(items)
+        self._extend_offsets(items)
+        self._end_notified = False
+        if self._empty_label is not None:
+            self._empty_label.place_forget()
+        self._update_scrollregion()
+        self._render()
+
+    def __len__(self):
+        return len(self._items)
+
+    def _height_of(self, item):
+        """Row height for item, gap included"""
+        if callable(self.row_height):
+            return self.row_height(item)
+        return self.row_height
+
+    def _kind_of(self, item):
+        """Pool key for item"""
+        return self.row_kind(item) if self.row_kind else None
+
+    def _extend_offsets(self, items):
+        """Append running offsets for newly added items"""
+        top = self._offsets[-1]
+        for item in items:
+            top += self._height_of(item)
+            self._offsets.append(top)
+
+    def _update_scrollregion(self):
+        """Make the canvas scroll over the full (virtual) list height"""
+        self._canvas.configure(scrollregion=(0, 0, 1, self._offsets[-1]))
+
+    def _render(self):
+        """Place pooled rows over the visible range, release the rest"""
+        count = len(self._items)
+        if count:
+            top = self._canvas.canvasy(0)
+            bottom = top + self._canvas.winfo_height()
+            first = max(0, bisect_right(self._offsets, top) - 1 - self.buffer)
+            last = min(count, bisect_left(self._offsets, bottom) + self.buffer)
+        else:
+            first = last = 0
+
+        for index in [i for i in self._active if not first <= i < last]:
+            self._release(index)
+
+        for index in range(first, last):
+            if index in self._active:
+                continue
+            item = self._items[index]
+            row = self._acquire(self._kind_of(item))
+            self.bind_row(row, item)
+            self._canvas.coords(row.virtual_item, 0, self._offsets[index])
+            self._canvas.itemconfigure(
+                row.virtual_item,
+                height=max(1, self._offsets[index + 1] - self._offsets[index] - self.row_gap)
+            )
+            self._active[index] = row
+
+        if (self.on_reach_end and count and last == count
+                and not self._end_notified):
+            self._end_notified = True
+            self.after_idle(self.on_reach_end)
+
+    def _acquire(self, kind):
+        """Free row of this kind, building one if the pool is empty"""
+        pool = self._pool.setdefault(kind, [])
+        if pool:
+            return pool.pop()
+
+        row = self.create_row(self._canvas, kind)
+        row.virtual_kind = kind
+        row.virtual_item = self._canvas.create_window(
+            0, 0, window=row, anchor="nw", width=max(1, self._canvas.winfo_width())
+        )
+        self._all_rows.append(row)
+        self._bind_wheel(row)
+        return row
+
+    def _release(self, index):
+        """Park a row off-screen and return it to its pool"""
+        row = self._active.pop(index)
+        self._canvas.coords(row.virtual_item, 0, -10000)
+        self._pool[row.virtual_kind].append(row)
+
+    def _on_yview(self, first, last):
+        """Canvas scrolled or resized: sync the scrollbar and rows"""
+        self._scrollbar.set(first, last)
+        self._render()
+
+    def _on_resize(self, event):
+        """Stretch every row to the canvas width"""
+        for row in self._all_rows:
+            self._canvas.itemconfigure(row.virtual_item, width=event.width)
+        self._render()
+
+    def _bind_wheel(self, widget):
+        """Scroll this list from the wheel over widget or any descendant"""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            # tkinter's own bind: CTk widgets redirect bind() to inner parts
+            tkinter.Misc.bind(widget, sequence, self._on_mousewheel, add="+")
+        for child in widget.winfo_children():
+            self._bind_wheel(child)
+
+    def _on_mousewheel(self, event):
+        """Scroll by wheel units; let outer scrollers have it if nothing to scroll"""
+        if self._canvas.yview() == (0.0, 1.0):
+            return None
+
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        elif sys.platform == "darwin":
+            steps = -event.delta
+        else:
+            steps = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._canvas.yview_scroll(steps, "units")
+        return "break"
+
+    def _canvas_color(self):
+        """Background matching this frame (or its parent when transparent)"""
+        color = self._bg_color if self._fg_color == "transparent" else self._fg_color
+        return self._apply_appearance_mode(color)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        if hasattr(self, "_canvas"):
+            self._canvas.configure(bg=self._canvas_color())
@@ -0,0 +1,33 @@
+"""
+Audio Scripts - Fixed spoken phrases
+Texts that never change, gathered so they can be pre-rendered for instant playback
+"""
+from src.data.enhanced_quests import DEMO_QUEST
+
+# Announcements for crisis tools, where speech should start without delay
+ANNOUNCEMENTS = {
+    'grounding_54321': "Starting 5-4-3-2-1 grounding exercise. Let's bring you back to the present moment.",
+    'grounding_tool': "Let's ground you with the 5-4-3-2-1 exercise. Go at your own pace. Start by noticing 5 things you can see.",
+    'box_breathing': "Starting box breathing. Follow the pattern: breathe in for 4, hold for 4, out for 4, hold for 4.",
+    'ice_water': "Ice water dive activates your mammalian dive reflex, which quickly calms your nervous system.",
+    'pmr': "Starting progressive muscle relaxation. We'll tense and release each muscle group.",
+    'safety_plan': "Opening safety plan customization."
+}
+
+
+def collect_audio_scripts(data):
+    """Every 'audio_script' string nested anywhere in data"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == 'audio_script' and isinstance(value, str):
+                yield value
+            else:
+                yield from collect_audio_scripts(value)
+    elif isinstance(data, (list, tuple)):
+        for value in data:
+            yield from collect_audio_scripts(value)
+
+
+def quest_scripts():
+    """Guided quest scripts (long, so they are played as sentence streams)"""
+    return list(collect_audio_scripts(DEMO_QUEST))
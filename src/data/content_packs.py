@@ -0,0 +1,396 @@
+"""
+BackToLife Content Packs
+Guides, tools, courses, flashcard collections and quests loaded from
+versioned JSON packs, validated once and served as immutable views
+
+Built-in packs live in src/data/packs/; extra packs can be dropped into
+~/.backtolife/packs/. A user pack that fails to load is skipped with a
+warning (only a broken built-in pack stops startup). The validated result
+is kept in a marshal cache so later startups skip JSON parsing and
+validation entirely.
+"""
+import json
+import marshal
+import os
+import sys
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+PACK_FORMAT = 1
+
+BUILTIN_PACK_DIR = Path(__file__).parent / "packs"
+
+# Bump when validation or normalization changes, to drop stale caches
+CACHE_VERSION = 2
+
+# Quest ids are permanent (quest_history points at them). Ids below this
+# belong to the built-in packs; user packs add quests from here up and may
+# only use a lower id to replace an existing quest.
+USER_QUEST_ID_START = 10000
+
+# Required fields per section and their types. Unknown fields are kept.
+SCHEMAS = {
+    'guides': {
+        'id': str, 'title': str, 'icon': str, 'category': str,
+        'description': str, 'steps': int, 'time': int
+    },
+    'tools': {
+        'id': str, 'name': str, 'icon': str, 'description': str,
+        'category': str, 'moods': list, 'action': str
+    },
+    'courses': {
+        'id': str, 'title': str, 'icon': str, 'description': str,
+        'lessons': int, 'duration': int, 'progress': int
+    },
+    'flashcard_collections': {
+        'title': str, 'icon': str, 'cards': int, 'description': str
+    },
+    'quests': {
+        'id': int, 'category': str, 'title': str, 'description': str,
+        'duration_minutes': int, 'xp_value': int, 'difficulty_level': int,
+        'tier': int, 'why_text': str, 'instructions': str
+    }
+}
+
+# Field that identifies an item, so a later pack can replace it
+ITEM_KEYS = {
+    'guides': 'id',
+    'tools': 'id',
+    'courses': 'id',
+    'flashcard_collections': 'title',
+    'quests': 'id'
+}
+
+# Placeholder steps for guides whose pack gives no 'content'
+GUIDE_PLACEHOLDER_CONTENT = [
+    {"step": 1, "title": "Step 1", "content": "Content here..."},
+    {"step": 2, "title": "Step 2", "content": "Content here..."},
+]
+
+
+class ContentPackError(ValueError):
+    """A pack file is malformed or fails validation"""
+
+
+TYPE_NAMES = {str: 'a string', int: 'an integer', list: 'a list'}
+
+
+def _check_item(pack, section, index, item):
+    """Raise ContentPackError unless item matches SCHEMAS[section]"""
+    where = f"{pack}: {section}[{index}]"
+    if not isinstance(item, dict):
+        raise ContentPackError(f"{where} must be an object")
+
+    for field, expected in SCHEMAS[section].items():
+        if field not in item:
+            raise ContentPackError(f"{where} is missing '{field}'")
+        value = item[field]
+        # bool is an int subclass but never a valid count
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise ContentPackError(f"{where}.{field} must be {TYPE_NAMES[expected]}")
+
+    if section == 'tools' and not all(isinstance(m, str) for m in item['moods']):
+        raise ContentPackError(f"{where}.moods must be a list of strings")
+    if section == 'quests' and item['id'] < 1:
+        raise ContentPackError(f"{where}.id must be positive")
+    if section == 'quests' and not 1 <= item['difficulty_level'] <= 5:
+        raise ContentPackError(f"{where}.difficulty_level must be 1-5")
+
+
+def validate_pack(pack, name="pack"):
+    """Check one parsed pack; returns it unchanged or raises ContentPackError"""
+    if not isinstance(pack, dict):
+        raise ContentPackError(f"{name}: top level must be an object")
+    if pack.get('format') != PACK_FORMAT:
+        raise ContentPackError(
+            f"{name}: unsupported format {pack.get('format')!r} (expected {PACK_FORMAT})"
+        )
+    for field in ('name', 'version'):
+        if not isinstance(pack.get(field), str):
+            raise ContentPackError(f"{name}: '{field}' must be a string")
+
+    categories = pack.get('quest_categories', {})
+    if not isinstance(categories, dict):
+        raise ContentPackError(f"{name}: quest_categories must be an object")
+
+    for section, key in ITEM_KEYS.items():
+        items = pack.get(section, [])
+        if not isinstance(items, list):
+            raise ContentPackError(f"{name}: {section} must be a list")
+        seen = set()
+        for index, item in enumerate(items):
+            _check_item(name, section, index, item)
+            if item[key] in seen:
+                raise ContentPackError(f"{name}: duplicate {section} {key} {item[key]!r}")
+            seen.add(item[key])
+    return pack
+
+
+def check_user_pack(pack, name, base):
+    """
+    Check a validated user pack against the merged packs loaded before it
+
+    Its quests must use known categories, and new quests must take ids
+    from USER_QUEST_ID_START up so built-in quests added later never
+    collide with them.
+    """
+    categories = set(base['quest_categories']) | set(pack.get('quest_categories', {}))
+    known_ids = {quest['id'] for quest in base['quests']}
+    for index, quest in enumerate(pack.get('quests', [])):
+        if quest['category'] not in categories:
+            raise ContentPackError(
+                f"{name}: quests[{index}] uses unknown category {quest['category']!r}"
+            )
+        if quest['id'] < USER_QUEST_ID_START and quest['id'] not in known_ids:
+            raise ContentPackError(
+                f"{name}: quests[{index}].id must be {USER_QUEST_ID_START} or above "
+                f"(lower ids are reserved for built-in quests)"
+            )
+    return pack
+
+
+def merge_packs(packs):
+    """
+    Combine validated packs in load order
+
+    Items from later packs replace earlier ones with the same key in
+    place; new items are appended.
+    """
+    merged = {section: [] for section in ITEM_KEYS}
+    merged['quest_categories'] = {}
+    merged['packs'] = []
+    positions = {section: {} for section in ITEM_KEYS}
+
+    for pack in packs:
+        merged['packs'].append([pack['name'], pack['version']])
+        merged['quest_categories'].update(pack.get('quest_categories', {}))
+        for section, key in ITEM_KEYS.items():
+            for item in pack.get(section, []):
+                if section == 'guides' and 'content' not in item:
+                    item = dict(item, content=GUIDE_PLACEHOLDER_CONTENT)
+                if item[key] in positions[section]:
+                    merged[section][positions[section][item[key]]] = item
+                    continue
+                positions[section][item[key]] = len(merged[section])
+                merged[section].append(item)
+
+    for index, quest in enumerate(merged['quests']):
+        if quest['category'] not in merged['quest_categories']:
+            raise ContentPackError(
+                f"quests[{index}] uses unknown category {quest['category']!r}"
+            )
+    return merged
+
+
+def freeze(value):
+    """Read-only copy with interned strings: dict -> mappingproxy, list -> tuple"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class ContentView:
+    """
+    Immutable, indexed view over one section of content
+
+    Items are read-only mappings. get() looks up by the section's key;
+    by(field, value) uses an index built at load time (list-valued fields
+    such as a tool's moods are indexed per value).
+    """
+
+    def __init__(self, items, key=None, indexed=()):
+        self.items = tuple(items)
+        self._by_key = {item[key]: item for item in self.items} if key else {}
+        self._indexes = {}
+        for field in indexed:
+            index = {}
+            for item in self.items:
+                values = item.get(field)
+                for value in values if isinstance(values, tuple) else (values,):
+                    index.setdefault(value, []).append(item)
+            self._indexes[field] = {value: tuple(group) for value, group in index.items()}
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key, default=None):
+        """Item by key, or default"""
+        return self._by_key.get(key, default)
+
+    def by(self, field, value):
+        """Items whose indexed field equals (or contains) value"""
+        return self._indexes[field].get(value, ())
+
+    def values_of(self, field):
+        """Distinct values of an indexed field, in first-seen order"""
+        return tuple(self._indexes[field])
+
+
+def group_by(items, field):
+    """{value: items} for one field, in first-seen order"""
+    groups = {}
+    for item in items:
+        groups.setdefault(item[field], []).append(item)
+    return MappingProxyType({value: tuple(group) for value, group in groups.items()})
+
+
+def index_tools_by_mood(tools):
+    """
+    {mood: {category: tools}} for every mood a tool lists
+
+    The 'all' entry holds every tool, matching the tool library's
+    "Show All Tools" view rather than only tools tagged 'all'.
+    """
+    index = {mood: group_by(tools.by('moods', mood), 'category')
+             for mood in tools.values_of('moods')}
+    index['all'] = group_by(tools, 'category')
+    return MappingProxyType(index)
+
+
+class ContentLibrary(NamedTuple):
+    """Everything loaded from the content packs"""
+    guides: ContentView
+    tools: ContentView
+    tools_by_mood: MappingProxyType  # mood -> category -> tools
+    courses: ContentView
+    flashcard_collections: ContentView
+    quests: ContentView
+    quest_categories: MappingProxyType
+    packs: tuple  # (name, version) in load order
+    skipped: tuple  # why each skipped user pack failed to load
+
+
+def pack_paths(user_dir=None):
+    """Built-in packs, then user packs, each sorted by file name"""
+    if user_dir is None:
+        user_dir = Path.home() / ".backtolife" / "packs"
+    paths = sorted(BUILTIN_PACK_DIR.glob("*.json"))
+    if Path(user_dir).is_dir():
+        paths += sorted(Path(user_dir).glob("*.json"))
+    return paths
+
+
+def _signature(paths):
+    """What the cache must match: loader version plus each pack's path, mtime, size"""
+    entries = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # e.g. a dangling link; loading reports it
+            entries.append((str(path), None, None))
+            continue
+        entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return (CACHE_VERSION, PACK_FORMAT, tuple(entries))
+
+
+def _read_cache(cache_path, signature):
+    """Merged data from the cache, or None if missing, stale or unreadable"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_signature, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return data if cached_signature == signature else None
+
+
+def _write_cache(cache_path, signature, data):
+    """Atomically replace the cache file; failures only cost the next startup"""
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            marshal.dump((signature, data), f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Content pack cache not written: {e}")
+
+
+def read_pack(path):
+    """Parse and validate one pack file; raises ContentPackError"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            pack = json.load(f)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ContentPackError(f"{path}: {e}") from e
+    return validate_pack(pack, name=str(path))
+
+
+def load_content(paths=None, cache_path=None):
+    """
+    Load, validate and merge packs into a ContentLibrary
+
+    Built-in packs must load; a user pack that doesn't is left out and
+    reported (on every load, cached or not). Uses the marshal cache when
+    every pack file is unchanged. Pass cache_path=False to skip the cache.
+    """
+    if paths is None:
+        paths = pack_paths()
+    if cache_path is None:
+        cache_path = Path.home() / ".backtolife" / "cache" / "content_packs.bin"
+
+    signature = _signature(paths)
+    data = _read_cache(cache_path, signature) if cache_path else None
+    if data is None:
+        packs = []
+        skipped = []
+        for path in paths:
+            try:
+                pack = read_pack(path)
+                if Path(path).parent != BUILTIN_PACK_DIR:
+                    check_user_pack(pack, str(path), merge_packs(packs))
+            except ContentPackError as e:
+                if Path(path).parent == BUILTIN_PACK_DIR:
+                    raise
+                skipped.append(str(e))
+                continue
+            packs.append(pack)
+        data = merge_packs(packs)
+        data['skipped'] = skipped
+        if cache_path:
+            _write_cache(cache_path, signature, data)
+
+    for reason in data['skipped']:
+        print(f"Content pack skipped: {reason}")
+
+    tools = ContentView(freeze(data['tools']), key='id', indexed=('category', 'moods'))
+    return ContentLibrary(
+        guides=ContentView(freeze(data['guides']), key='id', indexed=('category',)),
+        tools=tools,
+        tools_by_mood=index_tools_by_mood(tools),
+        courses=ContentView(freeze(data['courses']), key='id'),
+        flashcard_collections=ContentView(freeze(data['flashcard_collections']), key='title'),
+        quests=ContentView(freeze(data['quests']), key='id', indexed=('category',)),
+        quest_categories=freeze(data['quest_categories']),
+        packs=freeze(data['packs']),
+        skipped=freeze(data['skipped'])
+    )
+
+
+# Global content library, loaded on first use
+_content_library = None
+_content_lock = threading.Lock()
+
+
+def get_content_library():
+    """Get the shared ContentLibrary (loads packs on first call)"""
+    global _content_library
+    with _content_lock:
+        if _content_library is None:
+            _content_library = load_content()
+        return _content_library
+
+
+def get_guide_content(guide_id):
+    """Steps of a guide (empty if the guide is unknown)"""
+    guide = get_content_library().guides.get(guide_id)
+    return guide['content'] if guide else ()
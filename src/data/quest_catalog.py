@@ -0,0 +1,117 @@
+"""
+BackToLife Quest Catalog
+Immutable in-memory index over the quests table
+The catalog only changes when initialize_quest_database re-seeds, so
+quest lookups and random picks never need to touch SQLite
+"""
+import random
+from bisect import bisect_right
+from typing import NamedTuple
+
+
+class Quest(NamedTuple):
+    """
+    One row of the quests table
+
+    A NamedTuple costs the same as the plain sqlite3 tuple it replaces and
+    still unpacks/indexes like one, so older callers keep working.
+    """
+    id: int
+    category: str
+    title: str
+    description: str
+    duration_minutes: int
+    xp_value: int
+    difficulty_level: int
+    tier: int
+    why_text: str
+    instructions: str
+
+
+# Column list matching Quest's field order
+QUEST_SELECT = f'SELECT {", ".join(Quest._fields)} FROM quests'
+
+
+def quest_row_factory(cursor, row):
+    """sqlite3 row factory producing Quest records"""
+    return Quest._make(row)
+
+
+class QuestCatalog:
+    """
+    Read-only quest index over shared Quest records
+
+    Per category, quests are kept sorted by (difficulty_level, tier) with a
+    parallel list of difficulties. "difficulty <= n" is then the prefix
+    ending at bisect_right(difficulties, n), and a random pick is a single
+    randrange into that prefix.
+    """
+
+    def __init__(self, rows):
+        self._by_id = {quest.id: quest for quest in rows}
+
+        grouped = {}
+        for quest in rows:
+            grouped.setdefault(quest.category, []).append(quest)
+
+        self._by_category = {}
+        self._difficulties = {}
+        self._by_key = {}
+        for category, quests in grouped.items():
+            quests.sort(key=lambda q: (q.difficulty_level, q.tier, q.id))
+            self._by_category[category] = tuple(quests)
+            self._difficulties[category] = tuple(q.difficulty_level for q in quests)
+            for quest in quests:
+                key = (category, quest.difficulty_level)
+                self._by_key.setdefault(key, []).append(quest)
+
+        self._by_key = {key: tuple(quests) for key, quests in self._by_key.items()}
+
+    @classmethod
+    def load(cls, db):
+        """Build a catalog from the quests table"""
+        return cls(db.query_quests(QUEST_SELECT))
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def get(self, quest_id):
+        """Quest by id, or None"""
+        return self._by_id.get(quest_id)
+
+    def categories(self):
+        """Categories that have at least one quest"""
+        return tuple(self._by_category)
+
+    def by_category(self, category):
+        """All quests in a category, easiest first"""
+        return self._by_category.get(category, ())
+
+    def by_difficulty(self, category, difficulty):
+        """Quests in a category at exactly this difficulty"""
+        return self._by_key.get((category, difficulty), ())
+
+    def up_to_difficulty(self, category, max_difficulty):
+        """Quests in a category with difficulty_level <= max_difficulty"""
+        end = bisect_right(self._difficulties.get(category, ()), max_difficulty)
+        return self._by_category.get(category, ())[:end]
+
+    def random_quest(self, category, max_difficulty=3, rng=random):
+        """Random quest with difficulty_level <= max_difficulty, or None"""
+        end = bisect_right(self._difficulties.get(category, ()), max_difficulty)
+        if not end:
+            return None
+        return self._by_category[category][rng.randrange(end)]
+
+
+def get_quest_catalog(db):
+    """
+    Catalog for this database, loaded on first use
+
+    Held in the database's shared query cache under 'quest_catalog';
+    initialize_quest_database drops it when the seed hash changes.
+    """
+    return db.cache.get('quest_catalog', None, lambda: QuestCatalog.load(db))
@@ -1,9 +1,22 @@
-"""
-BackToLife Screens Module
-"""
-from .home_screen import HomeScreen
-from .progress_screen import ProgressScreen
-from .reflection_screen import ReflectionScreen
-from .shield_mode_screen import ShieldModeScreen
-
-__all__ = ['HomeScreen', 'ProgressScreen', 'ReflectionScreen', 'ShieldModeScreen']
+"""
+BackToLife Screens Module
+Screens are imported on first access, so importing src.screens.final
+doesn't load the classic screens as well
+"""
+from importlib import import_module
+
+_SCREEN_MODULES = {
+    'HomeScreen': 'home_screen',
+    'ProgressScreen': 'progress_screen',
+    'ReflectionScreen': 'reflection_screen',
+    'ShieldModeScreen': 'shield_mode_screen'
+}
+
+__all__ = list(_SCREEN_MODULES)
+
+
+def __getattr__(name):
+    """Import a screen class the first time it is asked for"""
+    if name in _SCREEN_MODULES:
+        return getattr(import_module(f'.{_SCREEN_MODULES[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
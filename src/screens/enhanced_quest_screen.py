@@ -37,6 +37,10 @@ class EnhancedQuestScreen(ctk.CTkFrame):
         self.current_step = 0
         self.quest_start_time = None
 
+        # Long scripts play as sentence streams, so they can be paused and resumed
+        self.audio_stream = None
+        self.audio_pause_btn = None
+
         # Flow stages
         self.stage = 'intro'  # intro -> steps -> flashcard -> quiz -> complete
 
@@ -91,7 +95,7 @@ class EnhancedQuestScreen(ctk.CTkFrame):
         ctk.CTkButton(
             psychoed_frame,
             text="🔊 Listen to This",
-            command=lambda: self.audio.speak(psychoed['audio_script']),
+            command=lambda: self.play_script(psychoed['audio_script']),
             width=180,
             height=45,
             font=("Arial", 14),
@@ -148,7 +152,7 @@ Pattern: {insights['correlation']}"""
 
         # Auto-play intro audio
         if self.audio.is_enabled():
-            self.audio.speak(psychoed['audio_script'])
+            self.play_script(psychoed['audio_script'])
 
     def start_quest_steps(self):
         """Begin step-by-step guided quest"""
@@ -226,7 +230,7 @@ Pattern: {insights['correlation']}"""
         ctk.CTkButton(
             audio_frame,
             text="🔊 Hear Step Guidance",
-            command=lambda: self.audio.speak(step['audio_script']),
+            command=lambda: self.play_script(step['audio_script']),
             width=200,
             height=50,
             font=("Arial", 14),
@@ -234,16 +238,17 @@ Pattern: {insights['correlation']}"""
             hover_color="#0088EE"
         ).pack(side="left", padx=10)
 
-        ctk.CTkButton(
+        self.audio_pause_btn = ctk.CTkButton(
             audio_frame,
-            text="⏸️ Stop Audio",
-            command=self.audio.stop,
+            text="⏸️ Pause Audio",
+            command=self.toggle_audio_pause,
             width=140,
             height=50,
             font=("Arial", 14),
             fg_color="#444444",
             hover_color="#666666"
-        ).pack(side="left", padx=10)
+        )
+        self.audio_pause_btn.pack(side="left", padx=10)
 
         # Navigation buttons
         nav_frame = ctk.CTkFrame(container, fg_color="transparent")
@@ -284,7 +289,7 @@ Pattern: {insights['correlation']}"""
 
         # Auto-play step audio
         if self.audio.is_enabled():
-            self.audio.speak(step['audio_script'])
+            self.play_script(step['audio_script'])
 
     def next_step(self):
         """Move to next step"""
@@ -355,7 +360,7 @@ Pattern: {insights['correlation']}"""
         ctk.CTkButton(
             psychoed_frame,
             text="🔊 Listen to This",
-            command=lambda: self.audio.speak(psychoed['audio_script']),
+            command=lambda: self.play_script(psychoed['audio_script']),
             width=180,
             height=45,
             font=("Arial", 14),
@@ -377,7 +382,7 @@ Pattern: {insights['correlation']}"""
 
         # Auto-play audio
         if self.audio.is_enabled():
-            self.audio.speak(psychoed['audio_script'])
+            self.play_script(psychoed['audio_script'])
 
     def show_flashcard(self):
         """Show flashcard for spaced repetition learning"""
@@ -521,8 +526,30 @@ Pattern: {insights['correlation']}"""
             message = f"Amazing work, champion. You earned {total_xp} experience points total. You just leveled up your {skill['skill_name']} skill. You're not the same person who started this quest. The champion is waking up."
             self.audio.speak(message)
 
+    def play_script(self, text):
+        """Speak an audio script as a stream, replacing any script playing now"""
+        if self.audio_stream is not None:
+            self.audio_stream.cancel()
+        self.audio_stream = self.audio.speak_stream(text)
+        if self.audio_pause_btn is not None and self.audio_pause_btn.winfo_exists():
+            self.audio_pause_btn.configure(text="⏸️ Pause Audio")
+
+    def toggle_audio_pause(self):
+        """Pause the current script, or resume it where it stopped"""
+        stream = self.audio_stream
+        if stream is None or stream.finished.is_set():
+            return
+        if stream.is_paused:
+            stream.resume()
+            self.audio_pause_btn.configure(text="⏸️ Pause Audio")
+        else:
+            stream.pause()
+            self.audio_pause_btn.configure(text="▶️ Resume Audio")
+
     def complete_enhanced_quest(self):
         """Complete the enhanced quest and return to home"""
+        if self.audio_stream is not None:
+            self.audio_stream.cancel()
         self.audio.stop()
         # In real app, would record completion to database
         # For demo, just go back
@@ -1,22 +1,26 @@
 """
 Final App Screens - Complete Tab System
+Each tab module is imported on first access, so opening one tab doesn't
+pay for loading the other seven
 """
-from .home_tab import HomeTab
-from .learn_tab import LearnTab
-from .tools_tab import ToolsTab
-from .guides_tab import GuidesTab
-from .progress_tab import ProgressTab
-from .reflection_tab import ReflectionTab
-from .shield_tab import ShieldTab
-from .settings_tab import SettingsTab
+from importlib import import_module
 
-__all__ = [
-    'HomeTab',
-    'LearnTab',
-    'ToolsTab',
-    'GuidesTab',
-    'ProgressTab',
-    'ReflectionTab',
-    'ShieldTab',
-    'SettingsTab'
-]
+_TAB_MODULES = {
+    'HomeTab': 'home_tab',
+    'LearnTab': 'learn_tab',
+    'ToolsTab': 'tools_tab',
+    'GuidesTab': 'guides_tab',
+    'ProgressTab': 'progress_tab',
+    'ReflectionTab': 'reflection_tab',
+    'ShieldTab': 'shield_tab',
+    'SettingsTab': 'settings_tab'
+}
+
+__all__ = list(_TAB_MODULES)
+
+
+def __getattr__(name):
+    """Import a tab class the first time it is asked for"""
+    if name in _TAB_MODULES:
+        return getattr(import_module(f'.{_TAB_MODULES[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
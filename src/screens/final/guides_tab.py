@@ -4,6 +4,14 @@ Practical guides for common challenges
 """
 import customtkinter as ctk
 
+from src.components.virtual_list import VirtualList
+from src.data.content_packs import get_content_library, get_guide_content
+from src.services.search import Debouncer, get_search_index, is_search_query
+
+
+# Fixed slot per guide card in the virtual list, gap included
+GUIDE_CARD_HEIGHT = 210
+
 
 class GuidesTab(ctk.CTkFrame):
     """
@@ -58,6 +66,8 @@ class GuidesTab(ctk.CTkFrame):
             font=("Arial", 14)
         )
         self.search_entry.pack(side="left", padx=(0, 10))
+        self.search_entry.bind("<KeyRelease>", Debouncer(self.search_entry, self.search_guides))
+        self.search_entry.bind("<Return>", lambda event: self.search_guides())
 
         ctk.CTkButton(
             search_frame,
@@ -97,13 +107,16 @@ class GuidesTab(ctk.CTkFrame):
 
         self.cat_buttons["all"].configure(fg_color="#0066CC")
 
-        # Guides list
-        self.guides_scroll = ctk.CTkScrollableFrame(
+        # Guides list (virtualized: only visible cards exist)
+        self.guides_list = VirtualList(
             self,
-            fg_color="transparent"
+            create_row=self.create_guide_card,
+            bind_row=self.bind_guide_card,
+            row_height=GUIDE_CARD_HEIGHT,
+            row_gap=20,
+            empty_text="No guides found."
         )
-        self.guides_scroll.grid(row=1, column=0, sticky="nsew")
-        self.guides_scroll.grid_columnconfigure(0, weight=1)
+        self.guides_list.grid(row=1, column=0, sticky="nsew")
 
         self.display_guides()
 
@@ -118,259 +131,123 @@ class GuidesTab(ctk.CTkFrame):
             else:
                 btn.configure(fg_color="#2a2a2a")
 
-        self.display_guides()
+        self.display_guides(search_query=self.search_entry.get())
 
     def search_guides(self):
-        """Search guides"""
-        query = self.search_entry.get().lower()
-        if query:
-            self.display_guides(search_query=query)
+        """Search guides (called as the user types)"""
+        self.display_guides(search_query=self.search_entry.get())
 
     def display_guides(self, search_query=None):
         """Display guides list"""
-        # Clear existing
-        for widget in self.guides_scroll.winfo_children():
-            widget.destroy()
-
-        guides = self.get_all_guides()
+        if is_search_query(search_query):
+            # Ranked matches from the shared search index, best first
+            hits = get_search_index(self.db).search(search_query, kinds={'guide'}, limit=len(self.get_all_guides()))
+            guides = [hit.item for hit in hits]
+        else:
+            guides = self.get_all_guides()
 
         # Filter by category
         if self.current_category != "all":
             guides = [g for g in guides if g['category'] == self.current_category]
 
-        # Filter by search
-        if search_query:
-            guides = [g for g in guides if
-                     search_query in g['title'].lower() or
-                     search_query in g['description'].lower()]
+        # Rebinds pooled cards instead of building one per guide
+        self.guides_list.set_items(guides)
 
-        if not guides:
-            ctk.CTkLabel(
-                self.guides_scroll,
-                text="No guides found.",
-                font=("Arial", 14),
-                text_color="#888888"
-            ).pack(pady=40)
-            return
-
-        # Display guides
-        for i, guide in enumerate(guides):
-            self.create_guide_card(guide, i)
-
-    def create_guide_card(self, guide, row):
-        """Create guide card"""
+    def create_guide_card(self, parent, kind=None):
+        """Create an empty, reusable guide card (filled by bind_guide_card)"""
         card = ctk.CTkFrame(
-            self.guides_scroll,
+            parent,
             fg_color="#1a1a1a",
             corner_radius=12
         )
-        card.grid(row=row, column=0, sticky="ew", pady=10)
 
         # Header
         header = ctk.CTkFrame(card, fg_color="transparent")
         header.pack(fill="x", padx=20, pady=15)
 
-        ctk.CTkLabel(
+        card.icon_label = ctk.CTkLabel(
             header,
-            text=guide['icon'],
+            text="",
             font=("Arial", 28)
-        ).pack(side="left", padx=(0, 15))
+        )
+        card.icon_label.pack(side="left", padx=(0, 15))
 
         info_frame = ctk.CTkFrame(header, fg_color="transparent")
         info_frame.pack(side="left", fill="x", expand=True)
 
-        ctk.CTkLabel(
+        card.title_label = ctk.CTkLabel(
             info_frame,
-            text=guide['title'],
+            text="",
             font=("Arial", 17, "bold"),
             anchor="w"
-        ).pack(anchor="w")
+        )
+        card.title_label.pack(anchor="w")
 
-        ctk.CTkLabel(
+        card.meta_label = ctk.CTkLabel(
             info_frame,
-            text=f"{guide['steps']} steps • {guide['time']} min",
+            text="",
             font=("Arial", 12),
             text_color="#888888",
             anchor="w"
-        ).pack(anchor="w")
+        )
+        card.meta_label.pack(anchor="w")
 
         # Description
-        ctk.CTkLabel(
+        card.description_label = ctk.CTkLabel(
             card,
-            text=guide['description'],
+            text="",
             font=("Arial", 13),
             text_color="#CCCCCC",
             wraplength=700,
             justify="left",
             anchor="w"
-        ).pack(fill="x", padx=20, pady=(0, 15))
+        )
+        card.description_label.pack(fill="x", padx=20, pady=(0, 15))
 
         # Action buttons
         btn_frame = ctk.CTkFrame(card, fg_color="transparent")
         btn_frame.pack(pady=(0, 15))
 
-        ctk.CTkButton(
+        card.read_button = ctk.CTkButton(
             btn_frame,
             text="📖 Read Guide",
-            command=lambda g=guide: self.open_guide(g),
             width=140,
             height=40,
             font=("Arial", 13),
             fg_color="#0066CC",
             hover_color="#0088EE"
-        ).pack(side="left", padx=5)
+        )
+        card.read_button.pack(side="left", padx=5)
 
-        ctk.CTkButton(
+        card.listen_button = ctk.CTkButton(
             btn_frame,
             text="🔊 Listen to Guide",
-            command=lambda g=guide: self.read_guide_aloud(g),
             width=160,
             height=40,
             font=("Arial", 13),
             fg_color="#00AA00",
             hover_color="#00CC00"
-        ).pack(side="left", padx=5)
+        )
+        card.listen_button.pack(side="left", padx=5)
+
+        return card
+
+    def bind_guide_card(self, card, guide):
+        """Show a guide on a pooled card"""
+        card.icon_label.configure(text=guide['icon'])
+        card.title_label.configure(text=guide['title'])
+        card.meta_label.configure(text=f"{guide['steps']} steps • {guide['time']} min")
+        card.description_label.configure(text=guide['description'])
+        card.read_button.configure(command=lambda g=guide: self.open_guide(g))
+        card.listen_button.configure(command=lambda g=guide: self.read_guide_aloud(g))
 
     def get_all_guides(self):
         """Get all available guides"""
-        return [
-            # Task Guides
-            {
-                'id': 'start_overwhelming_task',
-                'title': 'How to Start an Overwhelming Task',
-                'icon': '🎯',
-                'category': 'tasks',
-                'description': 'When a task feels impossible to start, use this step-by-step approach to break through the paralysis.',
-                'steps': 6,
-                'time': 10,
-                'content': self.get_guide_content('start_overwhelming_task')
-            },
-            {
-                'id': 'finish_started_task',
-                'title': 'How to Finish What You Started',
-                'icon': '✅',
-                'category': 'tasks',
-                'description': 'Strategies for completing tasks when your brain wants to jump to something new.',
-                'steps': 5,
-                'time': 8,
-                'content': self.get_guide_content('finish_started_task')
-            },
-            {
-                'id': 'organize_space',
-                'title': 'How to Organize a Messy Space',
-                'icon': '🧹',
-                'category': 'tasks',
-                'description': 'ADHD-friendly approach to cleaning and organizing without getting overwhelmed.',
-                'steps': 7,
-                'time': 15,
-                'content': self.get_guide_content('organize_space')
-            },
-
-            # Social Guides
-            {
-                'id': 'difficult_conversation',
-                'title': 'How to Have a Difficult Conversation',
-                'icon': '💬',
-                'category': 'social',
-                'description': 'Prepare for and navigate challenging conversations with confidence.',
-                'steps': 8,
-                'time': 12,
-                'content': self.get_guide_content('difficult_conversation')
-            },
-            {
-                'id': 'set_boundary',
-                'title': 'How to Set a Boundary',
-                'icon': '🛡️',
-                'category': 'social',
-                'description': 'Step-by-step guide to setting and maintaining healthy boundaries.',
-                'steps': 6,
-                'time': 10,
-                'content': self.get_guide_content('set_boundary')
-            },
-            {
-                'id': 'apologize_effectively',
-                'title': 'How to Apologize Effectively',
-                'icon': '🤝',
-                'category': 'social',
-                'description': 'Making genuine apologies that repair relationships.',
-                'steps': 5,
-                'time': 7,
-                'content': self.get_guide_content('apologize_effectively')
-            },
-
-            # Self-Care Guides
-            {
-                'id': 'morning_routine',
-                'title': 'How to Build a Morning Routine',
-                'icon': '☀️',
-                'category': 'selfcare',
-                'description': 'Create a sustainable morning routine that works with your brain.',
-                'steps': 6,
-                'time': 10,
-                'content': self.get_guide_content('morning_routine')
-            },
-            {
-                'id': 'handle_bad_day',
-                'title': 'How to Handle a Really Bad Day',
-                'icon': '🌧️',
-                'category': 'selfcare',
-                'description': 'Survival strategies for when everything feels terrible.',
-                'steps': 7,
-                'time': 12,
-                'content': self.get_guide_content('handle_bad_day')
-            },
-            {
-                'id': 'sleep_routine',
-                'title': 'How to Fix Your Sleep',
-                'icon': '😴',
-                'category': 'selfcare',
-                'description': 'Science-based approach to improving sleep with ADHD and depression.',
-                'steps': 8,
-                'time': 15,
-                'content': self.get_guide_content('sleep_routine')
-            },
-
-            # Crisis Guides
-            {
-                'id': 'crisis_moment',
-                'title': 'What to Do in a Crisis Moment',
-                'icon': '🆘',
-                'category': 'crisis',
-                'description': 'Immediate steps when you\'re in emotional crisis.',
-                'steps': 5,
-                'time': 5,
-                'content': self.get_guide_content('crisis_moment')
-            },
-            {
-                'id': 'panic_attack',
-                'title': 'How to Handle a Panic Attack',
-                'icon': '😰',
-                'category': 'crisis',
-                'description': 'Evidence-based techniques to manage panic attacks.',
-                'steps': 6,
-                'time': 8,
-                'content': self.get_guide_content('panic_attack')
-            },
-            {
-                'id': 'shutdown_recovery',
-                'title': 'How to Recover from Shutdown',
-                'icon': '🔋',
-                'category': 'crisis',
-                'description': 'Gentle steps to come back online after emotional shutdown.',
-                'steps': 5,
-                'time': 10,
-                'content': self.get_guide_content('shutdown_recovery')
-            }
-        ]
+        return get_content_library().guides.items
 
     def get_guide_content(self, guide_id):
-        """Get guide content (placeholder - would be full content)"""
-        # This would contain the full step-by-step content
-        # For now, return placeholder
-        return [
-            {"step": 1, "title": "Step 1", "content": "Content here..."},
-            {"step": 2, "title": "Step 2", "content": "Content here..."},
-        ]
+        """Get guide content (placeholder steps unless its pack provides them)"""
+        return get_guide_content(guide_id)
 
     def open_guide(self, guide):
         """Open guide in reader"""
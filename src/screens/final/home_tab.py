@@ -15,12 +15,16 @@ class HomeTab(ctk.CTkFrame):
     - Motivational message
     """
 
+    # Cache namespaces whose invalidation makes this tab stale
+    DATA_NAMESPACES = ('profile', 'insights')
+
     def __init__(self, parent, db, context_engine, audio):
         super().__init__(parent, fg_color="transparent")
 
         self.db = db
         self.context_engine = context_engine
         self.audio = audio
+        self.quest_screen = None
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -97,6 +101,14 @@ class HomeTab(ctk.CTkFrame):
         # Quick Actions
         self.show_quick_actions(main_scroll)
 
+    def refresh(self, data=None):
+        """Rebuild with current data (left alone while a quest is running)"""
+        if self.quest_screen is not None:
+            return
+        for widget in self.winfo_children():
+            widget.destroy()
+        self.setup_ui()
+
     def show_daily_quest(self, parent):
         """Display today's personalized quest"""
         quest_section = ctk.CTkFrame(parent, fg_color="#1a1a1a", corner_radius=15)
@@ -110,8 +122,10 @@ class HomeTab(ctk.CTkFrame):
         ).pack(pady=(20, 10))
 
         # Get daily quest
-        quest_data = self.context_engine.select_daily_quest()
-        quest = quest_data['quest']
+        selection = self.context_engine.select_for_context(
+            self.context_engine.capture_context()
+        )
+        quest = selection.quest
 
         # Quest card
         quest_card = ctk.CTkFrame(quest_section, fg_color="#2a2a2a", corner_radius=12)
@@ -120,14 +134,14 @@ class HomeTab(ctk.CTkFrame):
         # Quest title
         ctk.CTkLabel(
             quest_card,
-            text=quest[2],  # title
+            text=quest.title,
             font=("Arial", 20, "bold")
         ).pack(pady=(20, 5), padx=20)
 
         # Quest description
         ctk.CTkLabel(
             quest_card,
-            text=quest[3],  # description
+            text=quest.description,
             font=("Arial", 14),
             text_color="#AAAAAA",
             wraplength=500
@@ -138,9 +152,9 @@ class HomeTab(ctk.CTkFrame):
         details_frame.pack(pady=10)
 
         details = [
-            (f"⏱️ {quest[5]} min", "#00AAFF"),
-            (f"⭐ {quest[4]} XP", "#FFD700"),
-            (f"📊 Difficulty {quest[6]}/5", "#FF6600")
+            (f"⏱️ {quest.duration_minutes} min", "#00AAFF"),
+            (f"⭐ {quest.xp_value} XP", "#FFD700"),
+            (f"📊 Difficulty {quest.difficulty_level}/5", "#FF6600")
         ]
 
         for i, (text, color) in enumerate(details):
@@ -164,7 +178,7 @@ class HomeTab(ctk.CTkFrame):
 
         ctk.CTkLabel(
             why_frame,
-            text=quest_data['reason'],
+            text=selection.reason,
             font=("Arial", 12),
             text_color="#CCCCCC",
             wraplength=450,
@@ -175,7 +189,7 @@ class HomeTab(ctk.CTkFrame):
         ctk.CTkButton(
             quest_card,
             text="▶ Start Enhanced Quest",
-            command=lambda: self.start_quest(quest[0]),
+            command=lambda: self.start_quest(quest.id),
             width=250,
             height=50,
             font=("Arial", 16, "bold"),
@@ -265,25 +279,33 @@ class HomeTab(ctk.CTkFrame):
 
     def start_quest(self, quest_id):
         """Launch enhanced quest screen"""
-        # Clear parent and show quest screen
-        for widget in self.master.winfo_children():
-            widget.destroy()
+        # Cover the home content with the quest screen. It lives inside this
+        # tab, so switching tabs mid-quest hides and restores it with us.
+        for widget in self.winfo_children():
+            widget.grid_remove()
 
-        quest_screen = EnhancedQuestScreen(
-            self.master,
+        self.quest_screen = EnhancedQuestScreen(
+            self,
             self.db,
             self.on_quest_complete,
             self.on_quest_back
         )
-        quest_screen.grid(row=0, column=0, sticky="nsew")
+        self.quest_screen.grid(row=0, column=0, rowspan=2, sticky="nsew")
+
+    def close_quest(self):
+        """Drop the quest screen and rebuild home"""
+        if self.quest_screen is not None:
+            self.quest_screen.destroy()
+            self.quest_screen = None
+        self.refresh()
 
     def on_quest_complete(self, quest_id, xp_earned, was_primary):
         """Quest completed - rebuild home"""
-        self.setup_ui()
+        self.close_quest()
 
     def on_quest_back(self):
         """Back from quest - rebuild home"""
-        self.setup_ui()
+        self.close_quest()
 
     def open_shield(self):
         """Open shield mode"""
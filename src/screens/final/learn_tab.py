@@ -5,6 +5,8 @@ Courses, flashcards, quizzes, and psychoeducation library
 import customtkinter as ctk
 from src.components.flashcard import FlashcardWidget, FlashcardManager
 from src.components.quiz import QuizWidget
+from src.data.content_packs import get_content_library
+from src.services.search import Debouncer, get_search_index, is_search_query
 
 
 class LearnTab(ctk.CTkFrame):
@@ -110,15 +112,30 @@ class LearnTab(ctk.CTkFrame):
 
     def show_courses(self):
         """Display available courses"""
+        # Search bar (results update as you type)
+        search_entry = ctk.CTkEntry(
+            self.content_area,
+            placeholder_text="Search courses...",
+            height=40,
+            font=("Arial", 14)
+        )
+        search_entry.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        search_entry.bind(
+            "<KeyRelease>",
+            Debouncer(search_entry, lambda: self.filter_courses(search_entry.get()))
+        )
+
+        # Cards are built once; searching only re-grids them
+        self.course_cards = {}
         courses = self.get_all_courses()
 
-        for i, course in enumerate(courses):
+        for course in courses:
             course_card = ctk.CTkFrame(
                 self.content_area,
                 fg_color="#1a1a1a",
                 corner_radius=15
             )
-            course_card.grid(row=i, column=0, sticky="ew", pady=10)
+            self.course_cards[course['id']] = course_card
 
             # Course header
             header_frame = ctk.CTkFrame(course_card, fg_color="transparent")
@@ -188,6 +205,21 @@ class LearnTab(ctk.CTkFrame):
                 hover_color="#0088EE"
             ).pack(pady=(0, 20))
 
+        self.filter_courses("")
+
+    def filter_courses(self, query):
+        """Show courses matching query, best match first (all if it is too short)"""
+        if is_search_query(query):
+            hits = get_search_index(self.db).search(query, kinds={'course'}, limit=len(self.course_cards))
+            course_ids = [hit.doc_id for hit in hits]
+        else:
+            course_ids = list(self.course_cards)
+
+        for course_card in self.course_cards.values():
+            course_card.grid_remove()
+        for row, course_id in enumerate(course_ids, start=1):
+            self.course_cards[course_id].grid(row=row, column=0, sticky="ew", pady=10)
+
     def show_flashcards(self):
         """Display flashcard library"""
         ctk.CTkLabel(
@@ -242,38 +274,7 @@ class LearnTab(ctk.CTkFrame):
             font=("Arial", 18, "bold")
         ).grid(row=2, column=0, pady=(20, 10), sticky="w")
 
-        collections = [
-            {
-                'title': 'ADHD Fundamentals',
-                'icon': '🧠',
-                'cards': 15,
-                'description': 'Understanding how ADHD affects your brain'
-            },
-            {
-                'title': 'Executive Function',
-                'icon': '⚙️',
-                'cards': 12,
-                'description': 'Working memory, planning, task initiation'
-            },
-            {
-                'title': 'Depression Basics',
-                'icon': '🌧️',
-                'cards': 10,
-                'description': 'What depression is and how it works'
-            },
-            {
-                'title': 'Relationship Skills',
-                'icon': '❤️',
-                'cards': 8,
-                'description': 'Communication, boundaries, conflict resolution'
-            },
-            {
-                'title': 'Physical Recovery',
-                'icon': '💪',
-                'cards': 8,
-                'description': 'Rebuilding physical health step by step'
-            }
-        ]
+        collections = get_content_library().flashcard_collections
 
         collections_grid = ctk.CTkFrame(self.content_area, fg_color="transparent")
         collections_grid.grid(row=3, column=0, sticky="ew", pady=10)
@@ -522,53 +523,7 @@ class LearnTab(ctk.CTkFrame):
 
     def get_all_courses(self):
         """Get available courses"""
-        return [
-            {
-                'id': 'adhd_fundamentals',
-                'title': 'ADHD Fundamentals',
-                'icon': '🧠',
-                'description': 'Understanding how ADHD affects your brain, executive function, and daily life. Learn why simple tasks feel impossible and what you can do about it.',
-                'lessons': 8,
-                'duration': 45,
-                'progress': 0
-            },
-            {
-                'id': 'depression_basics',
-                'title': 'Understanding Depression',
-                'icon': '🌧️',
-                'description': 'What depression really is, how it affects motivation and energy, and evidence-based strategies that actually help.',
-                'lessons': 6,
-                'duration': 35,
-                'progress': 0
-            },
-            {
-                'id': 'executive_function',
-                'title': 'Executive Function Skills',
-                'icon': '⚙️',
-                'description': 'Building the skills your brain struggles with: planning, task initiation, working memory, and time management.',
-                'lessons': 10,
-                'duration': 60,
-                'progress': 0
-            },
-            {
-                'id': 'relationship_skills',
-                'title': 'Healthy Relationships',
-                'icon': '❤️',
-                'description': 'Communication, boundaries, conflict resolution, and maintaining relationships when your brain makes it hard.',
-                'lessons': 7,
-                'duration': 40,
-                'progress': 0
-            },
-            {
-                'id': 'physical_recovery',
-                'title': 'Physical Recovery Basics',
-                'icon': '💪',
-                'description': 'Rebuilding physical health from severe deconditioning. Start where you are, not where you think you should be.',
-                'lessons': 9,
-                'duration': 50,
-                'progress': 0
-            }
-        ]
+        return get_content_library().courses.items
 
     def start_course(self, course):
         """Launch course"""
@@ -5,6 +5,31 @@ Comprehensive progress tracking and insights
 import customtkinter as ctk
 from datetime import datetime, timedelta
 
+from src.components.virtual_list import VirtualList
+from src.data.quest_database import QUEST_CATEGORIES
+
+
+# Recent activity list: rows per page, slot height (gap included), rows in view
+ACTIVITY_PAGE_SIZE = 10
+ACTIVITY_ROW_HEIGHT = 74
+ACTIVITY_VISIBLE_ROWS = 5
+
+# Shown for completions whose quest is no longer defined
+REMOVED_QUEST_TITLE = "Quest (removed)"
+
+DOMAIN_ICONS = {
+    'BODY_RECOVERY': '💪',
+    'HYGIENE': '🚿',
+    'EATING_DRINKING': '🍎',
+    'ORGANIZATION': '📋',
+    'SOCIAL_RECOVERY': '👥',
+    'FINANCIAL': '💰',
+    'ACADEMIC': '📚',
+    'CREATIVE': '🎨',
+    'CRYPTO_AI': '🤖',
+    'FORTNITE': '🎮'
+}
+
 
 class ProgressTab(ctk.CTkFrame):
     """
@@ -16,19 +41,46 @@ class ProgressTab(ctk.CTkFrame):
     - Pattern insights
     """
 
-    def __init__(self, parent, db, audio):
+    # Cache namespaces whose invalidation makes this tab stale
+    DATA_NAMESPACES = ('profile', 'stats', 'domain_stats', 'insights')
+
+    def __init__(self, parent, db, audio, data=None):
         super().__init__(parent, fg_color="transparent")
 
         self.db = db
         self.audio = audio
+        self.data = data  # snapshot from prefetch(), loaded on demand if None
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
         self.setup_ui()
 
+    @classmethod
+    def prefetch(cls, db):
+        """Everything setup_ui reads, as one snapshot (safe off the UI thread)"""
+        return {
+            'profile': db.get_user_profile(),
+            'domain_stats': db.get_all_domain_stats(),
+            'activity': db.get_activity_feed(limit=ACTIVITY_PAGE_SIZE),
+            'insights': db.get_pattern_insights(),
+            'best_streak': db.get_best_streak(),
+            'week_count': cls.get_week_count(db),
+            'month_count': cls.get_month_count(db)
+        }
+
+    def refresh(self, data=None):
+        """Rebuild with current data (or a fresh prefetch() snapshot)"""
+        for widget in self.winfo_children():
+            widget.destroy()
+        self.data = data
+        self.setup_ui()
+
     def setup_ui(self):
         """Build progress UI"""
+        if self.data is None:
+            self.data = self.prefetch(self.db)
+
         # Scrollable main area
         scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
         scroll.grid(row=0, column=0, sticky="nsew")
@@ -45,7 +97,7 @@ class ProgressTab(ctk.CTkFrame):
             text_color="#00AAFF"
         ).pack(pady=(20, 5))
 
-        profile = self.db.get_user_profile()
+        profile = self.data['profile']
 
         ctk.CTkLabel(
             header,
@@ -89,8 +141,8 @@ class ProgressTab(ctk.CTkFrame):
             ("Current Level", profile['level'], "🎯", "#00AAFF"),
             ("Quest Streak", f"{profile['streak']} days", "🔥", "#FF6600"),
             ("Quests Done", profile['quests_completed'], "✅", "#00AA00"),
-            ("This Week", self.get_week_count(), "📅", "#00AAFF"),
-            ("This Month", self.get_month_count(), "📆", "#00AAFF")
+            ("This Week", self.data['week_count'], "📅", "#00AAFF"),
+            ("This Month", self.data['month_count'], "📆", "#00AAFF")
         ]
 
         for i, (label, value, icon, color) in enumerate(stats):
@@ -156,21 +208,11 @@ class ProgressTab(ctk.CTkFrame):
             font=("Arial", 20, "bold")
         ).pack(pady=(20, 15))
 
-        # Get domain stats
-        domains = [
-            ("BODY_RECOVERY", "💪", "Physical Recovery"),
-            ("BASIC_FUNCTION", "🧠", "Basic Function"),
-            ("RELATIONSHIP", "❤️", "Relationship"),
-            ("ACADEMIC", "📚", "Academic"),
-            ("EMOTIONAL", "😊", "Emotional"),
-            ("SOCIAL", "👥", "Social"),
-            ("EXECUTIVE", "⚙️", "Executive Function"),
-            ("CREATIVE", "🎨", "Creative"),
-            ("PROFESSIONAL", "💼", "Professional"),
-            ("LONG_TERM", "🎯", "Long-term Goals")
-        ]
+        # One grouped query for every domain
+        all_stats = self.data['domain_stats']
 
-        for domain_id, icon, domain_name in domains:
+        for domain_id, domain_name in QUEST_CATEGORIES.items():
+            icon = DOMAIN_ICONS.get(domain_id, "🎯")
             domain_card = ctk.CTkFrame(domain_section, fg_color="#2a2a2a", corner_radius=8)
             domain_card.pack(fill="x", padx=20, pady=5)
 
@@ -184,8 +226,7 @@ class ProgressTab(ctk.CTkFrame):
                 font=("Arial", 15, "bold")
             ).pack(side="left")
 
-            # Get domain stats from database
-            domain_stats = self.db.get_domain_stats(domain_id)
+            domain_stats = all_stats.get(domain_id, {})
             completed = domain_stats.get('completed', 0)
             total = domain_stats.get('total', 0)
 
@@ -325,45 +366,25 @@ class ProgressTab(ctk.CTkFrame):
             font=("Arial", 20, "bold")
         ).pack(pady=(20, 15))
 
-        # Get recent quest history
-        history = self.db.get_quest_history(limit=10)
+        # Get recent quest history (joined with quest titles in one query).
+        # Every row is kept, so the paging cursor always advances.
+        history = self.data['activity']
 
         if history:
-            for entry in history:
-                activity_card = ctk.CTkFrame(activity_section, fg_color="#2a2a2a", corner_radius=8)
-                activity_card.pack(fill="x", padx=20, pady=5)
-
-                # Quest info
-                quest = self.db.get_quest(entry['quest_id'])
-                if quest:
-                    info_frame = ctk.CTkFrame(activity_card, fg_color="transparent")
-                    info_frame.pack(fill="x", padx=15, pady=12)
-
-                    ctk.CTkLabel(
-                        info_frame,
-                        text="✅",
-                        font=("Arial", 18)
-                    ).pack(side="left", padx=(0, 10))
-
-                    text_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
-                    text_frame.pack(side="left", fill="x", expand=True)
-
-                    ctk.CTkLabel(
-                        text_frame,
-                        text=quest[2],  # title
-                        font=("Arial", 14, "bold"),
-                        anchor="w"
-                    ).pack(anchor="w")
-
-                    # Format timestamp
-                    time_ago = self.format_time_ago(entry['completed_at'])
-                    ctk.CTkLabel(
-                        text_frame,
-                        text=f"{time_ago} • +{entry['xp_earned']} XP",
-                        font=("Arial", 11),
-                        text_color="#888888",
-                        anchor="w"
-                    ).pack(anchor="w")
+            # Pooled rows; older pages load as the list is scrolled to the end
+            self.activity_exhausted = len(self.data['activity']) < ACTIVITY_PAGE_SIZE
+            self.activity_list = VirtualList(
+                activity_section,
+                create_row=self.create_activity_row,
+                bind_row=self.bind_activity_row,
+                row_height=ACTIVITY_ROW_HEIGHT,
+                row_gap=10,
+                height=ACTIVITY_ROW_HEIGHT * ACTIVITY_VISIBLE_ROWS,
+                on_reach_end=self.load_more_activity
+            )
+            self.activity_list.pack(fill="x", padx=20, pady=(0, 15))
+            self.activity_list.set_items(history)
+            self.activity_cursor = history[-1]['completed_at']
         else:
             ctk.CTkLabel(
                 activity_section,
@@ -372,6 +393,57 @@ class ProgressTab(ctk.CTkFrame):
                 text_color="#888888"
             ).pack(pady=(0, 20))
 
+    def create_activity_row(self, parent, kind=None):
+        """Create a reusable activity row (filled by bind_activity_row)"""
+        activity_card = ctk.CTkFrame(parent, fg_color="#2a2a2a", corner_radius=8)
+
+        info_frame = ctk.CTkFrame(activity_card, fg_color="transparent")
+        info_frame.pack(fill="x", padx=15, pady=12)
+
+        ctk.CTkLabel(
+            info_frame,
+            text="✅",
+            font=("Arial", 18)
+        ).pack(side="left", padx=(0, 10))
+
+        text_frame = ctk.CTkFrame(info_frame, fg_color="transparent")
+        text_frame.pack(side="left", fill="x", expand=True)
+
+        activity_card.title_label = ctk.CTkLabel(
+            text_frame,
+            text="",
+            font=("Arial", 14, "bold"),
+            anchor="w"
+        )
+        activity_card.title_label.pack(anchor="w")
+
+        activity_card.detail_label = ctk.CTkLabel(
+            text_frame,
+            text="",
+            font=("Arial", 11),
+            text_color="#888888",
+            anchor="w"
+        )
+        activity_card.detail_label.pack(anchor="w")
+        return activity_card
+
+    def bind_activity_row(self, activity_card, entry):
+        """Show one completion on a pooled row"""
+        # Completions of quests no longer in the packs have no title
+        activity_card.title_label.configure(text=entry['title'] or REMOVED_QUEST_TITLE)
+        time_ago = self.format_time_ago(entry['completed_at'])
+        activity_card.detail_label.configure(text=f"{time_ago} • +{entry['xp_earned']} XP")
+
+    def load_more_activity(self):
+        """Append the next page of older completions"""
+        if self.activity_exhausted:
+            return
+        page = self.db.get_activity_feed(limit=ACTIVITY_PAGE_SIZE, before=self.activity_cursor)
+        self.activity_exhausted = len(page) < ACTIVITY_PAGE_SIZE
+        if page:
+            self.activity_cursor = page[-1]['completed_at']
+            self.activity_list.append_items(page)
+
     def show_insights(self, parent):
         """Show pattern insights"""
         insights_section = ctk.CTkFrame(parent, fg_color="#1a1a1a", corner_radius=15)
@@ -383,27 +455,18 @@ class ProgressTab(ctk.CTkFrame):
             font=("Arial", 20, "bold")
         ).pack(pady=(20, 15))
 
-        # Sample insights (would come from context engine)
+        # Top insights from the running pattern counters
+        colors = ['#00AAFF', '#00AA00']
         insights = [
-            {
-                'icon': '📈',
-                'title': 'Completion Patterns',
-                'message': 'You complete more quests in the morning (65% vs 35% afternoon/evening)',
-                'color': '#00AAFF'
-            },
-            {
-                'icon': '💪',
-                'title': 'Strongest Domain',
-                'message': 'Physical Recovery is your most consistent domain with 80% completion rate',
-                'color': '#00AA00'
-            },
-            {
-                'icon': '🔥',
-                'title': 'Best Streak',
-                'message': f"Your best streak was {self.db.get_best_streak()} days. Current: {self.db.get_user_profile()['streak']} days",
-                'color': '#FF6600'
-            }
+            dict(insight, color=color)
+            for insight, color in zip(self.data['insights'], colors)
         ]
+        insights.append({
+            'icon': '🔥',
+            'title': 'Best Streak',
+            'message': f"Your best streak was {self.data['best_streak']} days. Current: {self.data['profile']['streak']} days",
+            'color': '#FF6600'
+        })
 
         for insight in insights:
             card = ctk.CTkFrame(insights_section, fg_color="#2a2a2a", corner_radius=10)
@@ -439,15 +502,17 @@ class ProgressTab(ctk.CTkFrame):
                 anchor="w"
             ).pack(anchor="w")
 
-    def get_week_count(self):
-        """Get quests completed this week"""
-        # TODO: Implement actual query
-        return 5
+    @staticmethod
+    def get_week_count(db):
+        """Get quests completed this week (since Monday)"""
+        today = datetime.now().date()
+        return db.count_completions(today - timedelta(days=today.weekday()), today)
 
-    def get_month_count(self):
+    @staticmethod
+    def get_month_count(db):
         """Get quests completed this month"""
-        # TODO: Implement actual query
-        return 18
+        today = datetime.now().date()
+        return db.count_completions(today.replace(day=1), today)
 
     def format_time_ago(self, timestamp):
         """Format timestamp as relative time"""
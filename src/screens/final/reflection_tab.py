@@ -15,19 +15,41 @@ class ReflectionTab(ctk.CTkFrame):
     - Reflection history
     """
 
-    def __init__(self, parent, db, audio):
+    # Cache namespaces whose invalidation makes this tab stale
+    DATA_NAMESPACES = ('reflection_history',)
+
+    def __init__(self, parent, db, audio, data=None):
         super().__init__(parent, fg_color="transparent")
 
         self.db = db
         self.audio = audio
+        self.data = data  # snapshot from prefetch(), loaded on demand if None
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
         self.setup_ui()
 
+    @staticmethod
+    def prefetch(db):
+        """Today's reflection and recent history (safe off the UI thread)"""
+        return {
+            'today': db.get_reflection_by_date(datetime.now().strftime("%Y-%m-%d")),
+            'history': db.get_reflection_history(limit=7)
+        }
+
+    def refresh(self, data=None):
+        """Rebuild with current data (or a fresh prefetch() snapshot)"""
+        for widget in self.winfo_children():
+            widget.destroy()
+        self.data = data
+        self.setup_ui()
+
     def setup_ui(self):
         """Build reflection UI"""
+        if self.data is None:
+            self.data = self.prefetch(self.db)
+
         # Header
         header = ctk.CTkFrame(self, fg_color="#1a1a1a", corner_radius=15)
         header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
@@ -55,7 +77,7 @@ class ReflectionTab(ctk.CTkFrame):
         self.content_scroll.grid_columnconfigure(0, weight=1)
 
         # Check if already reflected today
-        today_reflection = self.db.get_reflection_by_date(datetime.now().strftime("%Y-%m-%d"))
+        today_reflection = self.data['today']
 
         if today_reflection:
             self.show_completed_reflection(today_reflection)
@@ -276,7 +298,7 @@ class ReflectionTab(ctk.CTkFrame):
         ).pack(pady=(20, 15))
 
         # Get past reflections
-        history = self.db.get_reflection_history(limit=7)
+        history = self.data['history']
 
         if len(history) > 1:  # More than just today
             for reflection in history[1:]:  # Skip today's (already shown)
@@ -359,8 +381,8 @@ class ReflectionTab(ctk.CTkFrame):
         for widget in self.content_scroll.winfo_children():
             widget.destroy()
 
-        today_reflection = self.db.get_reflection_by_date(datetime.now().strftime("%Y-%m-%d"))
-        self.show_completed_reflection(today_reflection)
+        self.data = self.prefetch(self.db)
+        self.show_completed_reflection(self.data['today'])
 
     def get_mood_emoji(self, mood):
         """Get emoji for mood"""
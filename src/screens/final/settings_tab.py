@@ -3,6 +3,20 @@ Settings Tab - App Configuration
 """
 import customtkinter as ctk
 
+from src.services.audio_service import (
+    AUDIO_NOT_STARTED, AUDIO_READY, AUDIO_STARTING, AUDIO_UNAVAILABLE
+)
+
+
+# Speech engine status line: state -> (text, color)
+AUDIO_STATUS = {
+    AUDIO_NOT_STARTED: ("Voice engine: starts when first needed", "#888888"),
+    AUDIO_STARTING: ("Voice engine: loading...", "#FFAA00"),
+    AUDIO_READY: ("Voice engine: ready", "#00AA00"),
+    AUDIO_UNAVAILABLE: ("Voice engine: unavailable on this system", "#CC0000")
+}
+AUDIO_STATUS_POLL_MS = 300
+
 
 class SettingsTab(ctk.CTkFrame):
     """
@@ -74,7 +88,17 @@ class SettingsTab(ctk.CTkFrame):
             audio_section,
             text="🔊 Audio Settings",
             font=("Arial", 18, "bold")
-        ).pack(pady=(20, 15), padx=20, anchor="w")
+        ).pack(pady=(20, 5), padx=20, anchor="w")
+
+        # Speech engine readiness (it starts in the background)
+        self.audio_status_label = ctk.CTkLabel(
+            audio_section,
+            text="",
+            font=("Arial", 12),
+            text_color="#888888"
+        )
+        self.audio_status_label.pack(pady=(0, 10), padx=20, anchor="w")
+        self.update_audio_status()
 
         # Enable audio
         audio_toggle_frame = ctk.CTkFrame(audio_section, fg_color="transparent")
@@ -392,6 +416,14 @@ Your data never leaves your device.
             wraplength=650
         ).pack(pady=20, padx=20)
 
+    def update_audio_status(self):
+        """Show the speech engine state, re-checking until it settles"""
+        state = self.audio.state
+        text, color = AUDIO_STATUS.get(state, AUDIO_STATUS[AUDIO_NOT_STARTED])
+        self.audio_status_label.configure(text=text, text_color=color)
+        if state not in (AUDIO_READY, AUDIO_UNAVAILABLE):
+            self.after(AUDIO_STATUS_POLL_MS, self.update_audio_status)
+
     def toggle_audio(self):
         """Toggle audio on/off"""
         enabled = self.audio.toggle()
@@ -4,6 +4,8 @@ Shield Tab - Crisis Support and Emergency Tools
 import customtkinter as ctk
 from datetime import datetime
 
+from src.data.audio_scripts import ANNOUNCEMENTS
+
 
 class ShieldTab(ctk.CTkFrame):
     """
@@ -395,7 +397,7 @@ class ShieldTab(ctk.CTkFrame):
     def start_54321(self):
         """Start 5-4-3-2-1 grounding"""
         if self.audio.is_enabled():
-            self.audio.speak("Starting 5-4-3-2-1 grounding exercise. Let's bring you back to the present moment.")
+            self.audio.speak_urgent(ANNOUNCEMENTS['grounding_54321'])
 
         # Create grounding window
         window = ctk.CTkToplevel(self)
@@ -442,7 +444,7 @@ class ShieldTab(ctk.CTkFrame):
     def start_box_breathing(self):
         """Start box breathing"""
         if self.audio.is_enabled():
-            self.audio.speak("Starting box breathing. Follow the pattern: breathe in for 4, hold for 4, out for 4, hold for 4.")
+            self.audio.speak_urgent(ANNOUNCEMENTS['box_breathing'])
 
         # Create breathing window
         window = ctk.CTkToplevel(self)
@@ -484,7 +486,7 @@ class ShieldTab(ctk.CTkFrame):
     def show_ice_water(self):
         """Show ice water dive instructions"""
         if self.audio.is_enabled():
-            self.audio.speak("Ice water dive activates your mammalian dive reflex, which quickly calms your nervous system.")
+            self.audio.speak_urgent(ANNOUNCEMENTS['ice_water'])
 
         window = ctk.CTkToplevel(self)
         window.title("Ice Water Dive")
@@ -525,11 +527,11 @@ This works fast - you should feel calmer within 30 seconds."""
     def start_pmr(self):
         """Start progressive muscle relaxation"""
         if self.audio.is_enabled():
-            self.audio.speak("Starting progressive muscle relaxation. We'll tense and release each muscle group.")
+            self.audio.speak_urgent(ANNOUNCEMENTS['pmr'])
         # TODO: Implement guided PMR
 
     def customize_safety_plan(self):
         """Open safety plan customization"""
         if self.audio.is_enabled():
-            self.audio.speak("Opening safety plan customization.")
+            self.audio.speak_urgent(ANNOUNCEMENTS['safety_plan'])
         # TODO: Implement safety plan editor
@@ -4,6 +4,18 @@ Different tools for different feelings and situations
 """
 import customtkinter as ctk
 
+from src.components.virtual_list import VirtualList
+from src.data.audio_scripts import ANNOUNCEMENTS
+from src.data.content_packs import get_content_library, group_by
+from src.services.search import Debouncer, get_search_index, is_search_query
+
+
+# Slot heights in the virtual list, gap included
+TOOL_ROW_HEIGHTS = {
+    'header': 70,
+    'tools': 260
+}
+
 
 class ToolsTab(ctk.CTkFrame):
     """
@@ -20,6 +32,9 @@ class ToolsTab(ctk.CTkFrame):
         self.db = db
         self.audio = audio
         self.current_filter = "all"
+        self.mood_lists = {}  # mood -> prebuilt tool list, kept for swapping back
+        self.search_list = None
+        self.visible_list = None
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -44,7 +59,21 @@ class ToolsTab(ctk.CTkFrame):
             text="Different tools for different moments",
             font=("Arial", 14),
             text_color="#888888"
-        ).pack(pady=(0, 20))
+        ).pack(pady=(0, 15))
+
+        # Search bar (results update as you type)
+        self.search_entry = ctk.CTkEntry(
+            header,
+            placeholder_text="Search tools...",
+            width=400,
+            height=40,
+            font=("Arial", 14)
+        )
+        self.search_entry.pack(pady=(0, 20))
+        self.search_entry.bind(
+            "<KeyRelease>",
+            Debouncer(self.search_entry, lambda: self.display_tools(self.current_filter))
+        )
 
         # Mood selector
         mood_frame = ctk.CTkFrame(header, fg_color="#2a2a2a", corner_radius=10)
@@ -94,14 +123,6 @@ class ToolsTab(ctk.CTkFrame):
             hover_color="#666666"
         ).pack(pady=(10, 15))
 
-        # Scrollable tools area
-        self.tools_scroll = ctk.CTkScrollableFrame(
-            self,
-            fg_color="transparent"
-        )
-        self.tools_scroll.grid(row=1, column=0, sticky="nsew")
-        self.tools_scroll.grid_columnconfigure(0, weight=1)
-
         # Show all tools by default
         self.display_tools("all")
 
@@ -125,268 +146,154 @@ class ToolsTab(ctk.CTkFrame):
 
     def display_tools(self, filter_mood):
         """Display filtered tools"""
-        # Clear existing
-        for widget in self.tools_scroll.winfo_children():
-            widget.destroy()
-
-        # Tool database with mood mapping
-        all_tools = self.get_all_tools()
-
-        # Filter tools
-        if filter_mood == "all":
-            tools = all_tools
-        else:
-            tools = [t for t in all_tools if filter_mood in t['moods']]
-
-        if not tools:
-            ctk.CTkLabel(
-                self.tools_scroll,
-                text="No tools found for this mood.",
-                font=("Arial", 14),
-                text_color="#888888"
-            ).pack(pady=40)
+        query = self.search_entry.get().strip()
+        if is_search_query(query):
+            # Search results are ranked per query, so they get one shared list
+            hits = get_search_index(self.db).search(query, kinds={'tool'}, limit=len(self.get_all_tools()))
+            tools = [hit.item for hit in hits
+                     if filter_mood == "all" or filter_mood in hit.item['moods']]
+            if self.search_list is None:
+                self.search_list = self.create_tools_list()
+            self.search_list.set_items(self.build_tool_rows(group_by(tools, 'category')))
+            self.show_tools_list(self.search_list)
             return
 
-        # Display tools by category
-        categories = {}
-        for tool in tools:
-            cat = tool['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(tool)
+        # Each mood's list is built once from the precomputed index, then
+        # switching moods only swaps which list is gridded
+        tools_list = self.mood_lists.get(filter_mood)
+        if tools_list is None:
+            tools_list = self.mood_lists[filter_mood] = self.create_tools_list()
+            tools_list.set_items(self.build_tool_rows(self.get_tools_by_mood(filter_mood)))
+        self.show_tools_list(tools_list)
+
+    def create_tools_list(self):
+        """Scrollable tools area (virtualized: only visible rows exist)"""
+        return VirtualList(
+            self,
+            create_row=self.create_tool_row,
+            bind_row=self.bind_tool_row,
+            row_kind=lambda item: item[0],
+            row_height=lambda item: TOOL_ROW_HEIGHTS[item[0]],
+            row_gap=10,
+            empty_text="No tools match this mood or search."
+        )
 
-        row = 0
+    def show_tools_list(self, tools_list):
+        """Grid tools_list in place of the list currently shown"""
+        if tools_list is self.visible_list:
+            return
+        if self.visible_list is not None:
+            self.visible_list.grid_remove()
+        tools_list.grid(row=1, column=0, sticky="nsew")
+        self.visible_list = tools_list
+
+    def build_tool_rows(self, categories):
+        """Flatten {category: tools} into list rows: a header, then pairs of tools"""
+        rows = []
         for category, cat_tools in categories.items():
-            # Category header
-            cat_header = ctk.CTkFrame(
-                self.tools_scroll,
+            rows.append(("header", category))
+            for i in range(0, len(cat_tools), 2):
+                rows.append(("tools", cat_tools[i:i + 2]))
+        return rows
+
+    def create_tool_row(self, parent, kind):
+        """Create a reusable list row: a category header or two tool cards"""
+        if kind == "header":
+            row = ctk.CTkFrame(
+                parent,
                 fg_color="#1a1a1a",
                 corner_radius=10
             )
-            cat_header.grid(row=row, column=0, sticky="ew", pady=(0, 10))
-
-            ctk.CTkLabel(
-                cat_header,
-                text=f"{self.get_category_icon(category)} {category}",
+            row.title_label = ctk.CTkLabel(
+                row,
+                text="",
                 font=("Arial", 18, "bold"),
                 text_color="#FFD700"
-            ).pack(pady=15, padx=20, anchor="w")
-
-            row += 1
-
-            # Tools grid
-            tools_grid = ctk.CTkFrame(self.tools_scroll, fg_color="transparent")
-            tools_grid.grid(row=row, column=0, sticky="ew", pady=(0, 20))
-            tools_grid.grid_columnconfigure((0, 1), weight=1)
-
-            for i, tool in enumerate(cat_tools):
-                self.create_tool_card(tools_grid, tool, i // 2, i % 2)
+            )
+            row.title_label.pack(pady=15, padx=20, anchor="w")
+            return row
+
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        row.grid_columnconfigure((0, 1), weight=1, uniform="tools")
+        row.grid_rowconfigure(0, weight=1)
+        row.cards = [self.create_tool_card(row, col) for col in range(2)]
+        return row
+
+    def bind_tool_row(self, row, item):
+        """Show a header or a pair of tools on a pooled row"""
+        kind, value = item
+        if kind == "header":
+            row.title_label.configure(text=f"{self.get_category_icon(value)} {value}")
+            return
 
-            row += 1
+        for card, tool in zip(row.cards, value + (None,)):
+            if tool is None:
+                card.grid_remove()
+                continue
+            card.icon_label.configure(text=tool['icon'])
+            card.name_label.configure(text=tool['name'])
+            card.description_label.configure(text=tool['description'])
+            card.use_button.configure(
+                text=f"Use {tool['name']}",
+                command=lambda t=tool: self.use_tool(t)
+            )
+            card.grid()
 
-    def create_tool_card(self, parent, tool, row, col):
-        """Create individual tool card"""
+    def create_tool_card(self, parent, col):
+        """Create individual tool card (filled by bind_tool_row)"""
         card = ctk.CTkFrame(
             parent,
             fg_color="#2a2a2a",
             corner_radius=12
         )
-        card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
+        card.grid(row=0, column=col, padx=10, pady=10, sticky="nsew")
 
         # Tool icon and title
-        ctk.CTkLabel(
+        card.icon_label = ctk.CTkLabel(
             card,
-            text=tool['icon'],
+            text="",
             font=("Arial", 32)
-        ).pack(pady=(20, 5))
+        )
+        card.icon_label.pack(pady=(20, 5))
 
-        ctk.CTkLabel(
+        card.name_label = ctk.CTkLabel(
             card,
-            text=tool['name'],
+            text="",
             font=("Arial", 16, "bold")
-        ).pack(pady=(0, 5))
+        )
+        card.name_label.pack(pady=(0, 5))
 
         # Description
-        ctk.CTkLabel(
+        card.description_label = ctk.CTkLabel(
             card,
-            text=tool['description'],
+            text="",
             font=("Arial", 12),
             text_color="#AAAAAA",
             wraplength=220,
             justify="center"
-        ).pack(pady=(0, 15), padx=15)
+        )
+        card.description_label.pack(pady=(0, 15), padx=15)
 
         # Use button
-        ctk.CTkButton(
+        card.use_button = ctk.CTkButton(
             card,
-            text=f"Use {tool['name']}",
-            command=lambda t=tool: self.use_tool(t),
+            text="",
             width=180,
             height=40,
             font=("Arial", 13),
             fg_color="#0066CC",
             hover_color="#0088EE"
-        ).pack(pady=(0, 20))
+        )
+        card.use_button.pack(pady=(0, 20))
+        return card
 
     def get_all_tools(self):
         """Get complete tool database"""
-        return [
-            # Task Management Tools
-            {
-                'id': 'magic_todo',
-                'name': 'Magic To-Do',
-                'icon': '✨',
-                'description': 'Breaks big tasks into tiny steps (like Goblin Tools)',
-                'category': 'Task Management',
-                'moods': ['overwhelmed', 'stuck', 'all'],
-                'action': 'magic_todo'
-            },
-            {
-                'id': 'task_estimator',
-                'name': 'Time Estimator',
-                'icon': '⏱️',
-                'description': 'Helps estimate how long tasks really take',
-                'category': 'Task Management',
-                'moods': ['overwhelmed', 'confused', 'all'],
-                'action': 'time_estimator'
-            },
-            {
-                'id': 'priority_matrix',
-                'name': 'Priority Decider',
-                'icon': '🎯',
-                'description': 'Figures out what to do first when everything feels urgent',
-                'category': 'Task Management',
-                'moods': ['overwhelmed', 'confused', 'all'],
-                'action': 'priority_matrix'
-            },
-
-            # Emotion & Energy Tools
-            {
-                'id': 'mood_logger',
-                'name': 'Mood Logger',
-                'icon': '📊',
-                'description': 'Track patterns in how you feel',
-                'category': 'Emotional Support',
-                'moods': ['low_energy', 'frustrated', 'all'],
-                'action': 'mood_logger'
-            },
-            {
-                'id': 'energy_optimizer',
-                'name': 'Energy Optimizer',
-                'icon': '⚡',
-                'description': 'Matches tasks to your energy level',
-                'category': 'Emotional Support',
-                'moods': ['low_energy', 'all'],
-                'action': 'energy_optimizer'
-            },
-            {
-                'id': 'emotion_namer',
-                'name': 'Emotion Namer',
-                'icon': '🎭',
-                'description': 'Helps identify what you\'re actually feeling',
-                'category': 'Emotional Support',
-                'moods': ['confused', 'frustrated', 'all'],
-                'action': 'emotion_namer'
-            },
-
-            # Focus & Attention Tools
-            {
-                'id': 'focus_timer',
-                'name': 'Focus Timer',
-                'icon': '⏲️',
-                'description': 'Pomodoro timer with ADHD-friendly breaks',
-                'category': 'Focus Tools',
-                'moods': ['good', 'all'],
-                'action': 'focus_timer'
-            },
-            {
-                'id': 'distraction_blocker',
-                'name': 'Distraction Blocker',
-                'icon': '🚫',
-                'description': 'Gentle reminders when you drift',
-                'category': 'Focus Tools',
-                'moods': ['frustrated', 'stuck', 'all'],
-                'action': 'distraction_blocker'
-            },
-            {
-                'id': 'body_doubling',
-                'name': 'Virtual Body Double',
-                'icon': '👥',
-                'description': 'Simulated presence to help you start',
-                'category': 'Focus Tools',
-                'moods': ['stuck', 'low_energy', 'all'],
-                'action': 'body_doubling'
-            },
-
-            # Communication Tools
-            {
-                'id': 'text_formatter',
-                'name': 'Text Formatter',
-                'icon': '💬',
-                'description': 'Makes your messages clearer and more professional',
-                'category': 'Communication',
-                'moods': ['confused', 'frustrated', 'all'],
-                'action': 'text_formatter'
-            },
-            {
-                'id': 'conversation_helper',
-                'name': 'Conversation Helper',
-                'icon': '🗣️',
-                'description': 'Helps plan difficult conversations',
-                'category': 'Communication',
-                'moods': ['overwhelmed', 'confused', 'all'],
-                'action': 'conversation_helper'
-            },
-
-            # Crisis & Grounding Tools
-            {
-                'id': 'grounding_exercise',
-                'name': '5-4-3-2-1 Grounding',
-                'icon': '🌊',
-                'description': 'Quick sensory grounding when overwhelmed',
-                'category': 'Crisis Support',
-                'moods': ['overwhelmed', 'frustrated', 'all'],
-                'action': 'grounding_exercise'
-            },
-            {
-                'id': 'breathing_guide',
-                'name': 'Breathing Guide',
-                'icon': '🫁',
-                'description': 'Guided breathing with audio',
-                'category': 'Crisis Support',
-                'moods': ['overwhelmed', 'frustrated', 'low_energy', 'all'],
-                'action': 'breathing_guide'
-            },
-            {
-                'id': 'crisis_plan',
-                'name': 'Crisis Plan',
-                'icon': '🆘',
-                'description': 'Your personalized crisis support plan',
-                'category': 'Crisis Support',
-                'moods': ['overwhelmed', 'all'],
-                'action': 'crisis_plan'
-            },
-
-            # Organization Tools
-            {
-                'id': 'decision_helper',
-                'name': 'Decision Helper',
-                'icon': '🤔',
-                'description': 'Makes decisions when you\'re stuck choosing',
-                'category': 'Organization',
-                'moods': ['stuck', 'overwhelmed', 'all'],
-                'action': 'decision_helper'
-            },
-            {
-                'id': 'routine_builder',
-                'name': 'Routine Builder',
-                'icon': '📅',
-                'description': 'Creates sustainable routines',
-                'category': 'Organization',
-                'moods': ['good', 'all'],
-                'action': 'routine_builder'
-            }
-        ]
+        return get_content_library().tools.items
+
+    def get_tools_by_mood(self, mood_id):
+        """{category: tools} for a mood, from the index built at content load"""
+        return get_content_library().tools_by_mood.get(mood_id, {})
 
     def use_tool(self, tool):
         """Launch selected tool"""
@@ -526,7 +433,7 @@ class ToolsTab(ctk.CTkFrame):
             ).pack(pady=(0, 15), padx=20, anchor="w")
 
         if self.audio.is_enabled():
-            self.audio.speak("Let's ground you with the 5-4-3-2-1 exercise. Go at your own pace. Start by noticing 5 things you can see.")
+            self.audio.speak(ANNOUNCEMENTS['grounding_tool'])
 
     def launch_breathing(self):
         """Launch breathing guide"""
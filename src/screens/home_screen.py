@@ -119,7 +119,7 @@ class HomeScreen(ctk.CTkFrame):
         quest_card.grid(row=2, column=0, sticky="ew", pady=20, ipady=20)
 
         # Quest category badge
-        category_name = quest[1].replace('_', ' ').title()
+        category_name = quest.category.replace('_', ' ').title()
         ctk.CTkLabel(
             quest_card,
             text=f"🎯 {category_name}",
@@ -130,7 +130,7 @@ class HomeScreen(ctk.CTkFrame):
         # Quest title
         ctk.CTkLabel(
             quest_card,
-            text=quest[2],  # title
+            text=quest.title,
             font=("Arial", 32, "bold"),
             wraplength=600
         ).pack(pady=10)
@@ -138,7 +138,7 @@ class HomeScreen(ctk.CTkFrame):
         # Quest description
         ctk.CTkLabel(
             quest_card,
-            text=quest[3],  # description
+            text=quest.description,
             font=("Arial", 16),
             text_color="#CCCCCC",
             wraplength=600
@@ -173,7 +173,7 @@ class HomeScreen(ctk.CTkFrame):
 
         ctk.CTkLabel(
             instructions_frame,
-            text=quest[9],  # instructions (index 9)
+            text=quest.instructions,
             font=("Arial", 14),
             wraplength=550
         ).pack(pady=15, padx=15)
@@ -243,14 +243,14 @@ class HomeScreen(ctk.CTkFrame):
 
             ctk.CTkLabel(
                 info_frame,
-                text=quest[2],  # title
+                text=quest.title,
                 font=("Arial", 16, "bold"),
                 anchor="w"
             ).pack(anchor="w")
 
             ctk.CTkLabel(
                 info_frame,
-                text=f"{quest[1].replace('_', ' ').title()} • +{quest[5]} XP",
+                text=f"{quest.category.replace('_', ' ').title()} • +{quest.xp_value} XP",
                 font=("Arial", 12),
                 text_color="#888888",
                 anchor="w"
@@ -286,15 +286,15 @@ class HomeScreen(ctk.CTkFrame):
         completion_time = int(time.time() - self.quest_start_time)
 
         # Record completion
-        quest_id = self.current_quest[0]
-        xp_earned = self.current_quest[5]  # xp_value
+        quest_id = self.current_quest.id
+        xp_earned = self.current_quest.xp_value
 
         self.on_quest_complete(quest_id, xp_earned, was_primary=True)
 
     def complete_bonus_quest(self, quest):
         """Mark bonus quest as complete"""
-        quest_id = quest[0]
-        xp_earned = quest[5]
+        quest_id = quest.id
+        xp_earned = quest.xp_value
 
         self.on_quest_complete(quest_id, xp_earned, was_primary=False)
 
@@ -2,83 +2,182 @@
 Audio Service - Text-to-Speech for Accessibility
 Provides audio guidance for all content
 """
-import pyttsx3
-import threading
-from typing import Optional
+from typing import Iterable, Optional
+
+from src.services.tts_cache import TTSCache, WavPlayer
+from src.services.tts_worker import (
+    PRIORITY_NORMAL, PRIORITY_URGENT, CancelToken, SpeechStream, TTSWorker,
+    VoiceSettings, split_sentences
+)
+
+# Engine readiness, as shown in settings
+AUDIO_NOT_STARTED = 'not_started'
+AUDIO_STARTING = 'starting'
+AUDIO_READY = 'ready'
+AUDIO_UNAVAILABLE = 'unavailable'
 
 
 class AudioService:
+    """
+    Text-to-speech with a lazily created engine
+
+    Constructing the service is cheap: pyttsx3 is set up on the TTS worker
+    thread by start(), which the app calls once its window is showing (and
+    speak() calls if nothing has yet). Speech requested before the engine
+    is ready is queued and spoken as soon as it is.
+    """
+
     def __init__(self):
-        """Initialize TTS engine"""
+        """Set up the service; the engine is created later by start()"""
         self.engine = None
-        self.is_speaking = False
         self.enabled = True
-        self._init_engine()
-
-    def _init_engine(self):
-        """Initialize pyttsx3 engine"""
-        try:
-            self.engine = pyttsx3.init()
-
-            # Configure voice properties
-            self.engine.setProperty('rate', 150)  # Speed (words per minute)
-            self.engine.setProperty('volume', 0.9)  # Volume (0.0 to 1.0)
-
-            # Try to set a better voice if available
-            voices = self.engine.getProperty('voices')
-            if len(voices) > 0:
-                # Prefer first voice (usually better quality)
-                self.engine.setProperty('voice', voices[0].id)
 
-        except Exception as e:
-            print(f"TTS initialization warning: {e}")
+        # Current voice settings; the worker applies them to the engine
+        self.voice = None
+        self.rate = 150
+        self.volume = 0.9
+
+        # Rendered utterances on disk, replayed instead of re-synthesized
+        self.tts_cache = TTSCache()
+        self.player = WavPlayer()
+
+        # The worker thread owns the engine; everything else just queues requests
+        self.worker = TTSWorker(
+            self._create_engine,
+            self.voice_settings,
+            self.tts_cache,
+            self.player,
+            on_ready=self._on_engine_ready
+        )
+
+    def start(self):
+        """Create the engine in the background (safe to call more than once)"""
+        self.worker.start()
+
+    def _on_engine_ready(self):
+        """Worker finished creating the engine (runs on the worker thread)"""
+        self.engine = self.worker.engine
+        if self.engine is None:
+            print(f"TTS initialization warning: {self.worker.init_error}")
             print("Audio features will be disabled.")
             self.enabled = False
 
-    def speak(self, text: str, wait: bool = False):
+    @property
+    def state(self) -> str:
+        """AUDIO_NOT_STARTED, AUDIO_STARTING, AUDIO_READY or AUDIO_UNAVAILABLE"""
+        if not self.worker.started:
+            return AUDIO_NOT_STARTED
+        if not self.worker.ready.is_set():
+            return AUDIO_STARTING
+        return AUDIO_READY if self.engine is not None else AUDIO_UNAVAILABLE
+
+    def is_ready(self) -> bool:
+        """True once the engine exists and can speak"""
+        return self.state == AUDIO_READY
+
+    def _create_engine(self):
+        """Initialize pyttsx3 engine (runs on the worker thread)"""
+        # Imported here: loading the driver is part of the cost kept off the UI thread
+        import pyttsx3
+
+        engine = pyttsx3.init()
+
+        # Configure voice properties
+        engine.setProperty('rate', self.rate)  # Speed (words per minute)
+        engine.setProperty('volume', self.volume)  # Volume (0.0 to 1.0)
+
+        # Try to set a better voice if available
+        voices = engine.getProperty('voices')
+        if len(voices) > 0:
+            # Prefer first voice (usually better quality)
+            engine.setProperty('voice', voices[0].id)
+            self.voice = voices[0].id
+        return engine
+
+    @property
+    def is_speaking(self):
+        """True while something is being said"""
+        return self.worker.is_speaking
+
+    def voice_settings(self) -> VoiceSettings:
+        """Voice, rate and volume new speech should use"""
+        return VoiceSettings(self.voice, self.rate, self.volume)
+
+    def speak(self, text: str, wait: bool = False,
+              priority: int = PRIORITY_NORMAL) -> Optional[CancelToken]:
         """
         Speak text aloud
 
+        Speech replaces whatever is being said at the same or lower
+        priority. Text heard before is played from the TTS cache. Before
+        the engine is ready, speech is queued (starting the engine if
+        needed) and plays once it is.
+
         Args:
             text: Text to speak
             wait: If True, blocks until speech is complete
+            priority: PRIORITY_URGENT for speech that must cut in (Shield mode)
+
+        Returns:
+            Token to cancel this speech, or None if audio is off
         """
-        if not self.enabled or not self.engine:
-            return
+        if not self.enabled or self.state == AUDIO_UNAVAILABLE:
+            return None
+
+        self.start()
+        request = self.worker.speak(text, priority=priority)
+        if wait:
+            request.done.wait()
+        return request.token
+
+    def speak_stream(self, text: str, priority: int = PRIORITY_NORMAL) -> Optional[SpeechStream]:
+        """
+        Speak long text sentence by sentence
 
-        if self.is_speaking:
-            self.stop()
-
-        try:
-            if wait:
-                # Blocking mode - wait until done
-                self.is_speaking = True
-                self.engine.say(text)
-                self.engine.runAndWait()
-                self.is_speaking = False
-            else:
-                # Non-blocking mode - speak in background
-                def speak_background():
-                    self.is_speaking = True
-                    self.engine.say(text)
-                    self.engine.runAndWait()
-                    self.is_speaking = False
-
-                thread = threading.Thread(target=speak_background, daemon=True)
-                thread.start()
-
-        except Exception as e:
-            print(f"TTS error: {e}")
-            self.is_speaking = False
+        The first sentence starts playing as soon as it is rendered, while
+        the rest are rendered behind it. The returned stream can be paused
+        and resumed at sentence boundaries, or cancelled.
+
+        Args:
+            text: Text to speak (e.g. a multi-minute audio script)
+            priority: As for speak()
+
+        Returns:
+            SpeechStream handle, or None if audio is off
+        """
+        if not self.enabled or self.state == AUDIO_UNAVAILABLE:
+            return None
+
+        self.start()
+        return self.worker.stream(text, priority=priority)
+
+    def speak_urgent(self, text: str) -> Optional[CancelToken]:
+        """Speak text ahead of everything else, cutting off current speech"""
+        return self.speak(text, priority=PRIORITY_URGENT)
+
+    def cache_key(self, text: str) -> str:
+        """TTS cache key for text with the current voice settings"""
+        return TTSCache.key(text, *self.voice_settings())
+
+    def warm_up(self, texts: Iterable[str], streamed: bool = False):
+        """
+        Pre-render texts into the TTS cache in the background
+
+        Already cached texts are skipped, so calling this on every start
+        only costs synthesis the first time (or after a voice change).
+        Pass streamed=True for texts played with speak_stream(), which
+        caches them sentence by sentence.
+        """
+        if not self.enabled or self.state == AUDIO_UNAVAILABLE or not self.player.available:
+            return
+        self.start()
+        for text in texts:
+            for chunk in split_sentences(text) if streamed else (text,):
+                self.worker.render(chunk)
 
     def stop(self):
-        """Stop current speech"""
-        if self.enabled and self.engine:
-            try:
-                self.engine.stop()
-                self.is_speaking = False
-            except:
-                pass
+        """Stop current speech (and any still waiting for the engine)"""
+        self.worker.cancel_speech()
 
     def set_rate(self, rate: int):
         """
@@ -87,8 +186,8 @@ class AudioService:
         Args:
             rate: Words per minute (50-300, default 150)
         """
-        if self.enabled and self.engine:
-            self.engine.setProperty('rate', max(50, min(300, rate)))
+        if self.enabled:
+            self.rate = max(50, min(300, rate))
 
     def set_volume(self, volume: float):
         """
@@ -97,8 +196,8 @@ class AudioService:
         Args:
             volume: Volume level (0.0 to 1.0)
         """
-        if self.enabled and self.engine:
-            self.engine.setProperty('volume', max(0.0, min(1.0, volume)))
+        if self.enabled:
+            self.volume = max(0.0, min(1.0, volume))
 
     def toggle(self):
         """Toggle audio on/off"""
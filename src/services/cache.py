@@ -0,0 +1,114 @@
+"""
+Query Cache - Read-through memoization for Database reads
+Shared per database file so every tab sees the same cached results
+"""
+import threading
+from collections import Counter
+from typing import Dict, Optional
+
+
+class QueryCache:
+    """
+    Small read-through cache keyed by (namespace, args)
+
+    Writers invalidate whole namespaces (e.g. 'profile', 'domain_stats'),
+    so a write never has to know which argument combinations were cached.
+    Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._generation = 0  # bumped on every invalidation
+        self._versions = Counter()  # per namespace; '*' counts full clears
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+        self.invalidations = Counter()
+
+    def get(self, namespace, key, loader):
+        """Return the cached value, calling loader() on a miss"""
+        entry_key = (namespace, key)
+        with self._lock:
+            if entry_key in self._entries:
+                self.hits[namespace] += 1
+                return self._entries[entry_key]
+            self.misses[namespace] += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            # Don't store a value that a concurrent write already made stale
+            if generation == self._generation:
+                self._entries[entry_key] = value
+        return value
+
+    @property
+    def generation(self):
+        """Counter bumped by every invalidation; equal values mean no write in between"""
+        return self._generation
+
+    def versions(self, *namespaces):
+        """Invalidation counts for namespaces; any change means a write touched them"""
+        with self._lock:
+            return (self._versions['*'],) + tuple(self._versions[ns] for ns in namespaces)
+
+    def invalidate(self, *namespaces):
+        """Drop every entry in the given namespaces (all if none given)"""
+        with self._lock:
+            self._generation += 1
+            self._versions.update(namespaces or ('*',))
+            if not namespaces:
+                self.invalidations.update(ns for ns, _ in self._entries)
+                self._entries.clear()
+                return
+
+            stale = [k for k in self._entries if k[0] in namespaces]
+            for entry_key in stale:
+                del self._entries[entry_key]
+            self.invalidations.update(namespaces)
+
+    def stats(self):
+        """Hit/miss counters overall and per namespace"""
+        with self._lock:
+            hits = sum(self.hits.values())
+            misses = sum(self.misses.values())
+            lookups = hits + misses
+            namespaces = set(self.hits) | set(self.misses)
+            return {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'by_namespace': {
+                    ns: {
+                        'hits': self.hits[ns],
+                        'misses': self.misses[ns],
+                        'invalidations': self.invalidations[ns]
+                    }
+                    for ns in sorted(namespaces)
+                }
+            }
+
+    def reset_stats(self):
+        """Zero the counters without dropping cached entries"""
+        with self._lock:
+            self.hits.clear()
+            self.misses.clear()
+            self.invalidations.clear()
+
+
+# One cache per database file, shared across the process
+_caches: Dict[str, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_query_cache(db_path) -> QueryCache:
+    """Get or create the process-wide cache for a database file"""
+    key = str(db_path)
+    with _caches_lock:
+        cache: Optional[QueryCache] = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = QueryCache()
+        return cache
@@ -4,11 +4,55 @@ Manages all local data storage using SQLite
 """
 import sqlite3
 import os
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime
 from pathlib import Path
 
+from src.data.quest_catalog import get_quest_catalog, quest_row_factory
+from src.services import pattern_insights, spaced_repetition
+from src.services.cache import get_query_cache
+
+
+_EPOCH = date(1970, 1, 1)
+
+
+def epoch_day(value=None):
+    """
+    Convert a date/datetime (default: today) to an integer day number.
+
+    quest_history stores this next to completed_date so date filters can be
+    plain integer range lookups on an index instead of DATE() over every row.
+    """
+    if value is None:
+        value = date.today()
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - _EPOCH).days
+
 
 class Database:
+    # Applied to every new connection. WAL lets reads proceed during a
+    # commit and, with synchronous=NORMAL, needs no fsync per transaction.
+    CONNECTION_PRAGMAS = (
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('temp_store', 'MEMORY'),
+        ('mmap_size', 64 * 1024 * 1024),
+        ('cache_size', -8000),  # negative = KiB, so ~8 MB
+    )
+
+    # SQL turning daily_stats.completed_day into the first day of its
+    # bucket. Day 0 (1970-01-01) was a Thursday, so weeks start on Monday
+    # by stepping back (day + 3) % 7 days.
+    COUNT_BUCKETS = {
+        'day': "date(completed_day * 86400, 'unixepoch')",
+        'week': "date((completed_day - (completed_day + 3) % 7) * 86400, 'unixepoch')",
+        'month': "date(completed_day * 86400, 'unixepoch', 'start of month')",
+        'year': "date(completed_day * 86400, 'unixepoch', 'start of year')",
+    }
+
     def __init__(self, db_path="backtolife_data.db"):
         """Initialize database connection"""
         # Store in user's home directory
@@ -18,23 +62,121 @@ class Database:
         self.db_path = self.db_dir / db_path
         self.conn = None
         self.cursor = None
+        self._transaction_depth = 0
+        self._pending_invalidations = []
+        self.cache = get_query_cache(self.db_path)
         self.init_database()
 
     def connect(self):
         """Connect to database"""
         self.conn = sqlite3.connect(self.db_path)
         self.cursor = self.conn.cursor()
+        self._transaction_depth = 0
+        self._pending_invalidations = []
+        self.configure_connection()
         return self.conn
 
+    def configure_connection(self):
+        """Apply CONNECTION_PRAGMAS to the open connection"""
+        for name, value in self.CONNECTION_PRAGMAS:
+            try:
+                self.cursor.execute(f'PRAGMA {name} = {value}')
+            except sqlite3.DatabaseError as e:
+                # e.g. WAL is unavailable on some network filesystems
+                print(f"Database pragma warning ({name}): {e}")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Run a block of writes as one atomic commit.
+
+        Nested blocks join the outermost transaction, so write methods can
+        call each other and still produce a single commit. Any exception
+        rolls the whole transaction back.
+        """
+        if self._transaction_depth:
+            self._transaction_depth += 1
+            try:
+                yield self.cursor
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        if not self.conn.in_transaction:
+            self.cursor.execute('BEGIN')
+        self._transaction_depth = 1
+        try:
+            yield self.cursor
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._transaction_depth = 0
+            pending, self._pending_invalidations = self._pending_invalidations, []
+            for namespaces in pending:
+                self.cache.invalidate(*namespaces)
+
+    def _cached(self, namespace, key, loader):
+        """
+        Read through the shared query cache.
+
+        Reads inside a transaction may see uncommitted rows, so they go
+        straight to SQLite and are never stored.
+        """
+        if self._transaction_depth:
+            return loader()
+        return self.cache.get(namespace, key, loader)
+
+    def invalidate(self, *namespaces):
+        """
+        Drop cached reads for these namespaces (all if none given).
+
+        Inside a transaction the drop is repeated once it commits, so a
+        reader on another connection can't re-cache pre-commit rows in
+        between.
+        """
+        self.cache.invalidate(*namespaces)
+        if self._transaction_depth:
+            self._pending_invalidations.append(namespaces)
+
     def close(self):
         """Close database connection"""
         if self.conn:
             self.conn.close()
 
     def init_database(self):
-        """Initialize all database tables"""
+        """Connect and bring the schema up to the current version"""
         self.connect()
-
+        self.migrate()
+
+    def get_schema_version(self):
+        """Schema version recorded in the database file"""
+        self.cursor.execute('PRAGMA user_version')
+        return self.cursor.fetchone()[0]
+
+    def migrate(self):
+        """
+        Apply pending schema migrations in order.
+
+        Each step runs in its own transaction together with the
+        user_version bump, so a failed step leaves the database at the
+        previous version and is retried on the next launch. Databases
+        created before versioning report user_version 0 and replay every
+        step; the steps are written to tolerate that.
+        """
+        current = self.get_schema_version()
+        for version, step in enumerate(self.MIGRATIONS, start=1):
+            if version <= current:
+                continue
+            with self.transaction():
+                step(self)
+                # PRAGMA does not accept bound parameters
+                self.cursor.execute(f'PRAGMA user_version = {int(version)}')
+
+    def _migration_001_base_schema(self):
+        """Original tables and the single user profile row"""
         # User profile table
         self.cursor.execute('''
             CREATE TABLE IF NOT EXISTS user_profile (
@@ -142,8 +284,6 @@ class Database:
             )
         ''')
 
-        self.conn.commit()
-
         # Initialize user profile if not exists
         self.cursor.execute('SELECT COUNT(*) FROM user_profile')
         if self.cursor.fetchone()[0] == 0:
@@ -151,20 +291,220 @@ class Database:
                 INSERT INTO user_profile (id, created_date, current_level, total_xp)
                 VALUES (1, ?, 1, 0)
             ''', (datetime.now().isoformat(),))
-            self.conn.commit()
 
-    def update_user_xp(self, xp_amount):
-        """Add XP and check for level up"""
-        profile = self.get_user_profile()
-        new_xp = profile['xp'] + xp_amount
-        new_level = self.calculate_level(new_xp)
+    def _migration_002_completed_day(self):
+        """Add and backfill quest_history.completed_day plus its indexes"""
+        self.cursor.execute('PRAGMA table_info(quest_history)')
+        columns = [row[1] for row in self.cursor.fetchall()]
+        if 'completed_day' not in columns:
+            self.cursor.execute(
+                'ALTER TABLE quest_history ADD COLUMN completed_day INTEGER'
+            )
+            # julianday('1970-01-01') == 2440587.5
+            self.cursor.execute('''
+                UPDATE quest_history
+                SET completed_day = CAST(
+                    julianday(DATE(completed_date)) - 2440587.5 AS INTEGER
+                )
+                WHERE completed_date IS NOT NULL
+            ''')
+
+        # Covering indexes for the date-window queries
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_quest_history_day_quest
+            ON quest_history (completed_day, quest_id)
+        ''')
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_quest_history_primary_day
+            ON quest_history (was_primary_quest, completed_day)
+        ''')
+
+    def _migration_003_rollups(self):
+        """Materialized completion counts maintained by complete_quest"""
+        self.cursor.execute('PRAGMA table_info(user_profile)')
+        columns = [row[1] for row in self.cursor.fetchall()]
+        if 'quests_completed' not in columns:
+            self.cursor.execute('''
+                ALTER TABLE user_profile
+                ADD COLUMN quests_completed INTEGER NOT NULL DEFAULT 0
+            ''')
+
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS category_stats (
+                category TEXT PRIMARY KEY,
+                quests_completed INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
 
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                completed_day INTEGER PRIMARY KEY,
+                quests_completed INTEGER NOT NULL DEFAULT 0,
+                xp_earned INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+
+        self._rebuild_completion_rollups()
+
+    def _migration_004_metadata(self):
+        """Key/value store for app bookkeeping such as content hashes"""
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS app_metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
+
+    def _migration_005_insight_counters(self):
+        """Running aggregates for pattern insights"""
+        pattern_insights.create_tables(self.cursor)
+        pattern_insights.rebuild(self.cursor)
+
+    def _migration_006_history_timeline_index(self):
+        """Index for newest-first keyset pagination over quest_history"""
+        self.cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_quest_history_completed_date
+            ON quest_history (completed_date)
+        ''')
+
+    def _migration_007_quest_stats(self):
+        """Per-quest completion counts for distinct-completion rollups"""
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS quest_stats (
+                quest_id INTEGER PRIMARY KEY,
+                times_completed INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        self._rebuild_quest_stats()
+
+    def _migration_008_flashcard_state(self):
+        """Per-card spaced repetition state, seeded from the review log"""
+        spaced_repetition.create_tables(self.cursor)
+        spaced_repetition.rebuild(self.cursor)
+
+    # Ordered schema steps; position + 1 is the user_version it produces.
+    # Append new steps at the end, never reorder or edit released ones.
+    MIGRATIONS = (
+        _migration_001_base_schema,
+        _migration_002_completed_day,
+        _migration_003_rollups,
+        _migration_004_metadata,
+        _migration_005_insight_counters,
+        _migration_006_history_timeline_index,
+        _migration_007_quest_stats,
+        _migration_008_flashcard_state,
+    )
+
+    def get_metadata(self, key, default=None):
+        """Read a value from app_metadata"""
+        self.cursor.execute(
+            'SELECT value FROM app_metadata WHERE key = ?', (key,)
+        )
+        row = self.cursor.fetchone()
+        return row[0] if row else default
+
+    def set_metadata(self, key, value):
+        """Insert or replace a value in app_metadata"""
+        with self.transaction():
+            self.cursor.execute('''
+                INSERT INTO app_metadata (key, value) VALUES (?, ?)
+                ON CONFLICT (key) DO UPDATE SET value = excluded.value
+            ''', (key, value))
+
+    def rebuild_rollups(self):
+        """
+        Recompute the rollup counts, insight counters and flashcard
+        schedules from history.
+
+        complete_quest and save_reflection keep them current on their own;
+        this is the repair path for databases edited by hand or restored
+        from backup.
+        """
+        with self.transaction():
+            self._rebuild_completion_rollups()
+            self._rebuild_quest_stats()
+            pattern_insights.rebuild(self.cursor)
+            spaced_repetition.rebuild(self.cursor)
+            self.invalidate('profile', 'stats', 'domain_stats', 'insights', 'flashcards')
+
+    def _rebuild_completion_rollups(self):
+        """Recompute user_profile.quests_completed, category_stats and daily_stats"""
+        self.cursor.execute('''
+            UPDATE user_profile
+            SET quests_completed = (SELECT COUNT(*) FROM quest_history)
+        ''')
+
+        self.cursor.execute('DELETE FROM category_stats')
+        self.cursor.execute('''
+            INSERT INTO category_stats (category, quests_completed)
+            SELECT q.category, COUNT(*)
+            FROM quest_history qh
+            JOIN quests q ON qh.quest_id = q.id
+            GROUP BY q.category
+        ''')
+
+        self.cursor.execute('DELETE FROM daily_stats')
+        self.cursor.execute('''
+            INSERT INTO daily_stats (completed_day, quests_completed, xp_earned)
+            SELECT completed_day, COUNT(*), COALESCE(SUM(xp_earned), 0)
+            FROM quest_history
+            WHERE completed_day IS NOT NULL
+            GROUP BY completed_day
+        ''')
+
+    def _rebuild_quest_stats(self):
+        """Recompute quest_stats from quest_history"""
+        self.cursor.execute('DELETE FROM quest_stats')
+        self.cursor.execute('''
+            INSERT INTO quest_stats (quest_id, times_completed)
+            SELECT quest_id, COUNT(*)
+            FROM quest_history
+            WHERE quest_id IS NOT NULL
+            GROUP BY quest_id
+        ''')
+
+    def _record_completion_rollups(self, quest_id, xp_earned, day):
+        """Bump the rollup counters for one new quest_history row"""
         self.cursor.execute('''
             UPDATE user_profile
-            SET total_xp = ?, current_level = ?
+            SET quests_completed = quests_completed + 1
             WHERE id = 1
-        ''', (new_xp, new_level))
-        self.conn.commit()
+        ''')
+
+        self.cursor.execute('''
+            INSERT INTO category_stats (category, quests_completed)
+            SELECT category, 1 FROM quests WHERE id = ?
+            ON CONFLICT (category)
+            DO UPDATE SET quests_completed = quests_completed + 1
+        ''', (quest_id,))
+
+        self.cursor.execute('''
+            INSERT INTO quest_stats (quest_id, times_completed) VALUES (?, 1)
+            ON CONFLICT (quest_id)
+            DO UPDATE SET times_completed = times_completed + 1
+        ''', (quest_id,))
+
+        self.cursor.execute('''
+            INSERT INTO daily_stats (completed_day, quests_completed, xp_earned)
+            VALUES (?, 1, ?)
+            ON CONFLICT (completed_day)
+            DO UPDATE SET quests_completed = quests_completed + 1,
+                          xp_earned = xp_earned + excluded.xp_earned
+        ''', (day, xp_earned or 0))
+
+    def update_user_xp(self, xp_amount):
+        """Add XP and check for level up"""
+        with self.transaction():
+            profile = self.get_user_profile()
+            new_xp = profile['xp'] + xp_amount
+            new_level = self.calculate_level(new_xp)
+
+            self.cursor.execute('''
+                UPDATE user_profile
+                SET total_xp = ?, current_level = ?
+                WHERE id = 1
+            ''', (new_xp, new_level))
+            self.invalidate('profile', 'stats')
 
         return new_level > profile['level']  # True if leveled up
 
@@ -178,104 +518,128 @@ class Database:
         next_level_xp = current_level * 100
         return next_level_xp - current_xp
 
-    def complete_quest(self, quest_id, xp_earned, completion_time=0, was_primary=True):
-        """Record quest completion"""
-        today = datetime.now().date().isoformat()
-
-        # Add to history
-        self.cursor.execute('''
-            INSERT INTO quest_history (
-                quest_id, completed_date, completion_time_seconds,
-                xp_earned, was_primary_quest
-            )
-            VALUES (?, ?, ?, ?, ?)
-        ''', (quest_id, datetime.now().isoformat(), completion_time, xp_earned, was_primary))
+    def complete_quest(self, quest_id, xp_earned, completion_time=0, was_primary=True,
+                       completed_at=None):
+        """
+        Record quest completion as a single atomic transaction
 
-        # Update XP
-        leveled_up = self.update_user_xp(xp_earned)
+        completed_at defaults to now; the simulator passes simulated times.
+        """
+        now = completed_at or datetime.now()
+        today = now.date().isoformat()
+        day = epoch_day(now)
 
-        # Update streak
-        profile = self.get_user_profile()
-        last_date = profile['last_quest_date']
-
-        if last_date:
-            last_date_obj = datetime.fromisoformat(last_date).date()
-            today_obj = datetime.now().date()
-            days_diff = (today_obj - last_date_obj).days
-
-            if days_diff == 1:
-                # Consecutive day
-                new_streak = profile['streak'] + 1
-            elif days_diff == 0:
-                # Same day
-                new_streak = profile['streak']
+        with self.transaction():
+            # Add to history
+            self.cursor.execute('''
+                INSERT INTO quest_history (
+                    quest_id, completed_date, completion_time_seconds,
+                    xp_earned, was_primary_quest, completed_day
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (quest_id, now.isoformat(), completion_time, xp_earned, was_primary, day))
+            self._record_completion_rollups(quest_id, xp_earned, day)
+
+            quest = get_quest_catalog(self).get(quest_id)
+            pattern_insights.record_completion(
+                self.cursor, now, quest.category if quest else None
+            )
+            self.invalidate('profile', 'stats', 'domain_stats', 'insights')
+
+            # Update XP
+            leveled_up = self.update_user_xp(xp_earned)
+
+            # Update streak
+            profile = self.get_user_profile()
+            last_date = profile['last_quest_date']
+            last_quest_date = today
+
+            if last_date:
+                last_date_obj = datetime.fromisoformat(last_date).date()
+                today_obj = now.date()
+                days_diff = (today_obj - last_date_obj).days
+
+                if days_diff == 1:
+                    # Consecutive day
+                    new_streak = profile['streak'] + 1
+                elif days_diff <= 0:
+                    # Same day, or dated before the last completion (clock
+                    # skew, a backdated entry): the streak stands
+                    new_streak = profile['streak']
+                    last_quest_date = max(today, last_date_obj.isoformat())
+                else:
+                    # Streak broken
+                    new_streak = 1
+                    if profile['streak'] > 0:
+                        pattern_insights.record_streak_break(
+                            self.cursor, profile['streak']
+                        )
             else:
-                # Streak broken
                 new_streak = 1
-        else:
-            new_streak = 1
 
-        # Update streak and last quest date
-        best_streak = max(profile['best_streak'], new_streak)
-        self.cursor.execute('''
-            UPDATE user_profile
-            SET current_streak = ?, best_streak = ?, last_quest_date = ?
-            WHERE id = 1
-        ''', (new_streak, best_streak, today))
+            # Update streak and last quest date
+            best_streak = max(profile['best_streak'], new_streak)
+            self.cursor.execute('''
+                UPDATE user_profile
+                SET current_streak = ?, best_streak = ?, last_quest_date = ?
+                WHERE id = 1
+            ''', (new_streak, best_streak, last_quest_date))
 
-        self.conn.commit()
         return leveled_up
 
     def get_today_completed_quests(self):
         """Check if primary quest completed today"""
-        today = datetime.now().date().isoformat()
         self.cursor.execute('''
-            SELECT COUNT(*) FROM quest_history
-            WHERE DATE(completed_date) = ? AND was_primary_quest = 1
-        ''', (today,))
-        return self.cursor.fetchone()[0] > 0
+            SELECT 1 FROM quest_history
+            WHERE was_primary_quest = 1 AND completed_day = ?
+            LIMIT 1
+        ''', (epoch_day(),))
+        return self.cursor.fetchone() is not None
 
     def record_shield_activation(self, trigger_reason=""):
         """Record Shield Mode activation"""
-        self.cursor.execute('''
-            INSERT INTO shield_activations (activation_time, trigger_reason)
-            VALUES (?, ?)
-        ''', (datetime.now().isoformat(), trigger_reason))
-        self.conn.commit()
-        return self.cursor.lastrowid
+        with self.transaction():
+            self.cursor.execute('''
+                INSERT INTO shield_activations (activation_time, trigger_reason)
+                VALUES (?, ?)
+            ''', (datetime.now().isoformat(), trigger_reason))
+            activation_id = self.cursor.lastrowid
+        return activation_id
 
     def update_shield_duration(self, activation_id, duration_seconds, helpful_rating=0):
         """Update Shield Mode session with duration and rating"""
-        self.cursor.execute('''
-            UPDATE shield_activations
-            SET duration_seconds = ?, helpful_rating = ?
-            WHERE id = ?
-        ''', (duration_seconds, helpful_rating, activation_id))
-        self.conn.commit()
+        with self.transaction():
+            self.cursor.execute('''
+                UPDATE shield_activations
+                SET duration_seconds = ?, helpful_rating = ?
+                WHERE id = ?
+            ''', (duration_seconds, helpful_rating, activation_id))
 
     def get_stats(self):
         """Get comprehensive statistics"""
+        return self._cached('stats', None, self._load_stats)
+
+    def _load_stats(self):
+        """Uncached body of get_stats"""
         profile = self.get_user_profile()
 
         # Total quests completed
-        self.cursor.execute('SELECT COUNT(*) FROM quest_history')
-        total_quests = self.cursor.fetchone()[0]
+        total_quests = profile['quests_completed']
 
         # Quests by category
         self.cursor.execute('''
-            SELECT q.category, COUNT(*) as count
-            FROM quest_history qh
-            JOIN quests q ON qh.quest_id = q.id
-            GROUP BY q.category
-            ORDER BY count DESC
+            SELECT category, quests_completed
+            FROM category_stats
+            WHERE quests_completed > 0
+            ORDER BY quests_completed DESC
         ''')
         quests_by_category = self.cursor.fetchall()
 
         # This week's progress
         self.cursor.execute('''
-            SELECT COUNT(*) FROM quest_history
-            WHERE DATE(completed_date) >= DATE('now', '-7 days')
-        ''')
+            SELECT COALESCE(SUM(quests_completed), 0) FROM daily_stats
+            WHERE completed_day >= ?
+        ''', (epoch_day() - 7,))
         quests_this_week = self.cursor.fetchone()[0]
 
         return {
@@ -285,10 +649,57 @@ class Database:
             'quests_this_week': quests_this_week
         }
 
+    def get_completion_counts(self, bucket='day', start=None, end=None):
+        """
+        Quests and XP per day/week/month/year between start and end
+
+        start and end are dates (inclusive, default: all time / today).
+        Returns [(bucket_start 'YYYY-MM-DD', quests, xp)] oldest first;
+        buckets with no completions are left out. Served from daily_stats,
+        so the cost depends on the number of active days, not history rows.
+        """
+        if bucket not in self.COUNT_BUCKETS:
+            raise ValueError(f"Unknown bucket {bucket!r}, expected one of "
+                             f"{', '.join(self.COUNT_BUCKETS)}")
+        first = epoch_day(start) if start is not None else None
+        last = epoch_day(end)
+        return self._cached(
+            'stats', ('counts', bucket, first, last),
+            lambda: self._load_completion_counts(bucket, first, last)
+        )
+
+    def _load_completion_counts(self, bucket, first, last):
+        """Uncached body of get_completion_counts"""
+        where = 'completed_day <= ?'
+        params = [last]
+        if first is not None:
+            where += ' AND completed_day >= ?'
+            params.append(first)
+
+        self.cursor.execute(f'''
+            SELECT {self.COUNT_BUCKETS[bucket]} AS bucket,
+                   SUM(quests_completed), SUM(xp_earned)
+            FROM daily_stats
+            WHERE {where}
+            GROUP BY bucket
+            ORDER BY bucket
+        ''', params)
+        return self.cursor.fetchall()
+
+    def count_completions(self, start=None, end=None):
+        """Total quests completed between start and end (inclusive dates)"""
+        return sum(quests for _, quests, _ in
+                   self.get_completion_counts('year', start, end))
+
     def get_quest(self, quest_id):
         """Get quest by ID"""
-        self.cursor.execute('SELECT * FROM quests WHERE id = ?', (quest_id,))
-        return self.cursor.fetchone()
+        return get_quest_catalog(self).get(quest_id)
+
+    def query_quests(self, sql, params=()):
+        """Run a query over the quests table and return Quest records"""
+        cursor = self.conn.cursor()
+        cursor.row_factory = quest_row_factory
+        return cursor.execute(sql, params).fetchall()
 
     def get_quest_history(self, limit=10):
         """Get recent quest completions with details"""
@@ -317,24 +728,84 @@ class Database:
             })
         return results
 
+    def get_activity_feed(self, limit=10, before=None):
+        """
+        Recent completions joined with their quest, newest first
+
+        Pass the last entry's 'completed_at' as before= to fetch the next
+        page; each page is one indexed range scan regardless of depth.
+        """
+        # Separate statements so the paged form is a true index range seek
+        if before is None:
+            where, params = '', (limit,)
+        else:
+            where, params = 'WHERE qh.completed_date < ?', (before, limit)
+
+        self.cursor.execute(f'''
+            SELECT
+                qh.id,
+                qh.quest_id,
+                qh.completed_date,
+                qh.completion_time_seconds,
+                qh.xp_earned,
+                qh.was_primary_quest,
+                q.title,
+                q.category,
+                q.difficulty_level
+            FROM quest_history qh
+            LEFT JOIN quests q ON qh.quest_id = q.id
+            {where}
+            ORDER BY qh.completed_date DESC
+            LIMIT ?
+        ''', params)
+
+        results = []
+        for row in self.cursor.fetchall():
+            results.append({
+                'id': row[0],
+                'quest_id': row[1],
+                'completed_at': row[2],
+                'completion_time': row[3],
+                'xp_earned': row[4],
+                'was_primary': row[5],
+                'title': row[6],
+                'category': row[7],
+                'difficulty': row[8]
+            })
+        return results
+
     def get_user_profile(self):
         """Get current user profile data"""
-        self.cursor.execute('SELECT COUNT(*) FROM quest_history')
-        quests_completed = self.cursor.fetchone()[0]
+        return self._cached('profile', None, self._load_user_profile)
 
-        self.cursor.execute('SELECT * FROM user_profile WHERE id = 1')
+    def _load_user_profile(self):
+        """Uncached body of get_user_profile"""
+        self.cursor.execute('''
+            SELECT current_level, total_xp, current_streak, best_streak,
+                   last_quest_date, quests_completed
+            FROM user_profile WHERE id = 1
+        ''')
         row = self.cursor.fetchone()
         if row:
             return {
-                'level': row[2],
-                'xp': row[3],
-                'streak': row[4],
-                'best_streak': row[5],
-                'last_quest_date': row[6],
-                'quests_completed': quests_completed
+                'level': row[0],
+                'xp': row[1],
+                'streak': row[2],
+                'best_streak': row[3],
+                'last_quest_date': row[4],
+                'quests_completed': row[5]
             }
         return None
 
+    def get_pattern_insights(self):
+        """Ranked pattern insights read from the running counters"""
+        return self._cached('insights', None, self._load_pattern_insights)
+
+    def _load_pattern_insights(self):
+        """Uncached body of get_pattern_insights"""
+        counters = pattern_insights.load_counters(self.cursor)
+        return pattern_insights.rank_insights(counters)
+
     def get_best_streak(self):
         """Get best streak"""
         profile = self.get_user_profile()
@@ -342,35 +813,41 @@ class Database:
 
     def get_domain_stats(self, domain):
         """Get stats for specific domain"""
-        # Get total quests in domain
-        self.cursor.execute('''
-            SELECT COUNT(*) FROM quests WHERE category = ?
-        ''', (domain,))
-        total = self.cursor.fetchone()[0]
+        return self.get_all_domain_stats().get(domain, {'total': 0, 'completed': 0})
 
-        # Get completed quests in domain
-        self.cursor.execute('''
-            SELECT COUNT(DISTINCT qh.quest_id)
-            FROM quest_history qh
-            JOIN quests q ON qh.quest_id = q.id
-            WHERE q.category = ?
-        ''', (domain,))
-        completed = self.cursor.fetchone()[0]
+    def get_all_domain_stats(self):
+        """
+        Stats for every quest category in one query
 
+        Returns {category: {'total': quests in category,
+                            'completed': distinct quests ever completed}}
+        """
+        return self._cached('domain_stats', None, self._load_all_domain_stats)
+
+    def _load_all_domain_stats(self):
+        """Uncached body of get_all_domain_stats"""
+        self.cursor.execute('''
+            SELECT q.category, COUNT(*), COUNT(qs.quest_id)
+            FROM quests q
+            LEFT JOIN quest_stats qs ON qs.quest_id = q.id
+            GROUP BY q.category
+        ''')
         return {
-            'total': total,
-            'completed': completed
+            category: {'total': total, 'completed': completed}
+            for category, total, completed in self.cursor.fetchall()
         }
 
     def save_reflection(self, date, mood, energy_level, sleep_quality, gratitude, notes=None):
         """Save daily reflection (updated signature)"""
-        self.cursor.execute('''
-            INSERT INTO reflections (
-                date, mood_rating, energy_level, grateful_for, notes
-            )
-            VALUES (?, ?, ?, ?, ?)
-        ''', (date, mood, energy_level, gratitude, notes))
-        self.conn.commit()
+        with self.transaction():
+            self.cursor.execute('''
+                INSERT INTO reflections (
+                    date, mood_rating, energy_level, grateful_for, notes
+                )
+                VALUES (?, ?, ?, ?, ?)
+            ''', (date, mood, energy_level, gratitude, notes))
+            pattern_insights.record_reflection(self.cursor, mood, energy_level)
+            self.invalidate('reflection_history', 'insights')
 
     def get_reflection_by_date(self, date):
         """Get reflection for specific date"""
@@ -392,6 +869,13 @@ class Database:
 
     def get_reflection_history(self, limit=7):
         """Get recent reflections"""
+        return self._cached(
+            'reflection_history', limit,
+            lambda: self._load_reflection_history(limit)
+        )
+
+    def _load_reflection_history(self, limit):
+        """Uncached body of get_reflection_history"""
         self.cursor.execute('''
             SELECT * FROM reflections
             ORDER BY date DESC
@@ -411,29 +895,63 @@ class Database:
             })
         return results
 
+    def record_flashcard_review(self, flashcard_id, correct=True, grade=None, reviewed_at=None):
+        """
+        Log a flashcard review and reschedule the card (SM-2)
+
+        grade is 0-5 when the caller has one; otherwise it comes from
+        correct. Returns the card's new CardState.
+        """
+        if grade is None:
+            grade = spaced_repetition.grade_for(correct)
+        with self.transaction():
+            state = spaced_repetition.record_review(
+                self.cursor, flashcard_id, grade, reviewed_at or datetime.now()
+            )
+            self.invalidate('flashcards')
+        return state
+
+    def get_flashcard_state(self, flashcard_id):
+        """Scheduling state of one card"""
+        return self._cached(
+            'flashcards', flashcard_id,
+            lambda: spaced_repetition.load_state(self.cursor, flashcard_id)
+        )
+
+    def get_due_flashcards(self, now=None):
+        """(flashcard_id, due_date) for cards due for review, most overdue first"""
+        return spaced_repetition.due_cards(self.cursor, now or datetime.now())
+
     def log_shield_activation(self):
         """Log shield mode activation"""
         return self.record_shield_activation()
 
     def clear_all_data(self):
         """Clear all user data (DANGEROUS!)"""
-        # Clear all tables
-        self.cursor.execute('DELETE FROM quest_history')
-        self.cursor.execute('DELETE FROM reflections')
-        self.cursor.execute('DELETE FROM domain_tracking')
-        self.cursor.execute('DELETE FROM context_data')
-        self.cursor.execute('DELETE FROM shield_activations')
-        self.cursor.execute('DELETE FROM achievements')
-
-        # Reset user profile
-        self.cursor.execute('''
-            UPDATE user_profile
-            SET current_level = 1,
-                total_xp = 0,
-                current_streak = 0,
-                best_streak = 0,
-                last_quest_date = NULL
-            WHERE id = 1
-        ''')
-
-        self.conn.commit()
+        with self.transaction():
+            # Clear all tables
+            self.cursor.execute('DELETE FROM quest_history')
+            self.cursor.execute('DELETE FROM reflections')
+            self.cursor.execute('DELETE FROM domain_tracking')
+            self.cursor.execute('DELETE FROM context_data')
+            self.cursor.execute('DELETE FROM shield_activations')
+            self.cursor.execute('DELETE FROM achievements')
+            self.cursor.execute('DELETE FROM category_stats')
+            self.cursor.execute('DELETE FROM daily_stats')
+            self.cursor.execute('DELETE FROM quest_stats')
+            self.cursor.execute('DELETE FROM insight_counters')
+            self.cursor.execute('DELETE FROM flashcard_state')
+            self.cursor.execute('DELETE FROM flashcard_reviews')
+
+            # Reset user profile
+            self.cursor.execute('''
+                UPDATE user_profile
+                SET current_level = 1,
+                    total_xp = 0,
+                    current_streak = 0,
+                    best_streak = 0,
+                    last_quest_date = NULL,
+                    quests_completed = 0
+                WHERE id = 1
+            ''')
+            self.invalidate()
@@ -0,0 +1,230 @@
+"""
+Pattern Insights - Running aggregates behind the insight cards
+Counters are bumped in the same transaction as the write they describe,
+so ranking insights never rescans quest_history or reflections
+"""
+from src.data.content_packs import get_content_library
+
+
+# Reflection tab mood labels, best first, scored for the average check-in mood
+REFLECTION_MOOD_SCORES = {
+    'great': 5,
+    'good': 4,
+    'okay': 3,
+    'not great': 2,
+    'struggling': 1
+}
+
+WEEKDAYS = ('Sunday', 'Monday', 'Tuesday', 'Wednesday',
+            'Thursday', 'Friday', 'Saturday')
+
+# Same boundaries as ContextEngine.get_time_of_day
+PERIODS = (
+    ('morning', range(5, 12)),
+    ('afternoon', range(12, 17)),
+    ('evening', range(17, 22)),
+    ('night', tuple(range(22, 24)) + tuple(range(0, 5)))
+)
+
+# Minimum samples before an insight is shown
+MIN_COMPLETIONS = 5
+MIN_REFLECTIONS = 3
+
+
+def create_tables(cursor):
+    """Create the counter table (used by the schema migration)"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS insight_counters (
+            metric TEXT NOT NULL,
+            bucket TEXT NOT NULL,
+            value REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric, bucket)
+        ) WITHOUT ROWID
+    ''')
+
+
+def bump(cursor, metric, bucket, amount=1):
+    """Add amount to one counter"""
+    cursor.execute('''
+        INSERT INTO insight_counters (metric, bucket, value) VALUES (?, ?, ?)
+        ON CONFLICT (metric, bucket) DO UPDATE SET value = value + excluded.value
+    ''', (metric, str(bucket), amount))
+
+
+def raise_to(cursor, metric, bucket, value):
+    """Keep the larger of the stored and given value"""
+    cursor.execute('''
+        INSERT INTO insight_counters (metric, bucket, value) VALUES (?, ?, ?)
+        ON CONFLICT (metric, bucket) DO UPDATE SET value = MAX(value, excluded.value)
+    ''', (metric, str(bucket), value))
+
+
+def record_completion(cursor, completed_at, category):
+    """Update counters for one quest completion"""
+    bump(cursor, 'hour', completed_at.hour)
+    bump(cursor, 'weekday', completed_at.strftime('%w'))
+    if category:
+        bump(cursor, 'category', category)
+
+
+def record_streak_break(cursor, lost_streak):
+    """Update counters when a streak of lost_streak days ends"""
+    bump(cursor, 'streak_break', 'count')
+    bump(cursor, 'streak_break', 'lost_days', lost_streak)
+    raise_to(cursor, 'streak_break', 'longest', lost_streak)
+
+
+def record_reflection(cursor, mood, energy_level):
+    """Update counters for one saved reflection"""
+    if mood:
+        bump(cursor, 'reflection_mood', str(mood).lower())
+    if isinstance(energy_level, (int, float)):
+        bump(cursor, 'reflection_energy', 'count')
+        bump(cursor, 'reflection_energy', 'sum', energy_level)
+
+
+def rebuild(cursor):
+    """Recompute every counter from quest_history and reflections"""
+    cursor.execute('DELETE FROM insight_counters')
+
+    cursor.execute('''
+        INSERT INTO insight_counters (metric, bucket, value)
+        SELECT 'hour', CAST(CAST(strftime('%H', completed_date) AS INTEGER) AS TEXT), COUNT(*)
+        FROM quest_history WHERE completed_date IS NOT NULL
+        GROUP BY 2
+    ''')
+    cursor.execute('''
+        INSERT INTO insight_counters (metric, bucket, value)
+        SELECT 'weekday', strftime('%w', completed_date), COUNT(*)
+        FROM quest_history WHERE completed_date IS NOT NULL
+        GROUP BY 2
+    ''')
+    cursor.execute('''
+        INSERT INTO insight_counters (metric, bucket, value)
+        SELECT 'category', q.category, COUNT(*)
+        FROM quest_history qh JOIN quests q ON qh.quest_id = q.id
+        GROUP BY q.category
+    ''')
+    # Streak breaks: walk the distinct completion days once
+    cursor.execute('''
+        SELECT DISTINCT completed_day FROM quest_history
+        WHERE completed_day IS NOT NULL
+        ORDER BY completed_day
+    ''')
+    run = 0
+    previous = None
+    for (day,) in cursor.fetchall():
+        if previous is not None and day - previous > 1:
+            record_streak_break(cursor, run)
+            run = 0
+        run += 1
+        previous = day
+
+    cursor.execute('SELECT mood_rating, energy_level FROM reflections')
+    for mood, energy_level in cursor.fetchall():
+        record_reflection(cursor, mood, energy_level)
+
+
+def load_counters(cursor):
+    """All counters as {metric: {bucket: value}}"""
+    cursor.execute('SELECT metric, bucket, value FROM insight_counters')
+    counters = {}
+    for metric, bucket, value in cursor.fetchall():
+        counters.setdefault(metric, {})[bucket] = value
+    return counters
+
+
+def rank_insights(counters):
+    """
+    Turn counters into insight dicts, most relevant first
+
+    Each insight has 'title', 'message', 'icon' and a 'score'; scores
+    measure how far a pattern stands out from an even spread.
+    """
+    insights = []
+
+    hours = counters.get('hour', {})
+    total = sum(hours.values())
+    if total >= MIN_COMPLETIONS:
+        by_period = {
+            name: sum(hours.get(str(h), 0) for h in period_hours)
+            for name, period_hours in PERIODS
+        }
+        period, count = max(by_period.items(), key=lambda item: item[1])
+        share = count / total
+        insights.append({
+            'icon': '📈',
+            'title': 'Completion Patterns',
+            'message': (f"You complete most quests in the {period} "
+                        f"({share:.0%} of {int(total)} completions)."),
+            'score': share - 1 / len(PERIODS)
+        })
+
+    weekdays = counters.get('weekday', {})
+    total = sum(weekdays.values())
+    if total >= MIN_COMPLETIONS:
+        ranked = sorted(weekdays.items(), key=lambda item: item[1], reverse=True)
+        day, count = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        share = count / total
+        # Only a clear winner: a tie would pick a day by iteration order
+        if count > runner_up and share > 1 / 7:
+            insights.append({
+                'icon': '📅',
+                'title': 'Strongest Day',
+                'message': (f"{WEEKDAYS[int(day)]} is your strongest day "
+                            f"with {int(count)} {'quest' if count == 1 else 'quests'} completed."),
+                'score': share - 1 / 7
+            })
+
+    categories = counters.get('category', {})
+    total = sum(categories.values())
+    if total >= MIN_COMPLETIONS:
+        category, count = max(categories.items(), key=lambda item: item[1])
+        share = count / total
+        # Looked up here so importing the storage layer doesn't load content packs
+        quest_categories = get_content_library().quest_categories
+        name = quest_categories.get(category, category.replace('_', ' ').title())
+        insights.append({
+            'icon': '💪',
+            'title': 'Strongest Domain',
+            'message': (f"{name} is your most consistent domain "
+                        f"({share:.0%} of completed quests)."),
+            'score': share - 1 / max(len(quest_categories), 1)
+        })
+
+    breaks = counters.get('streak_break', {})
+    if breaks.get('count'):
+        count = int(breaks['count'])
+        average = breaks.get('lost_days', 0) / count
+        insights.append({
+            'icon': '🔥',
+            'title': 'Comebacks',
+            'message': (f"You've restarted after {count} streak break"
+                        f"{'s' if count != 1 else ''}. Streaks ran {average:.1f} days "
+                        f"on average, longest {int(breaks.get('longest', 0))}."),
+            'score': 0.3
+        })
+
+    moods = counters.get('reflection_mood', {})
+    total = sum(moods.values())
+    if total >= MIN_REFLECTIONS:
+        mood, count = max(moods.items(), key=lambda item: item[1])
+        energy = counters.get('reflection_energy', {})
+        message = f"Your most common check-in mood is \"{mood}\" ({int(count)} of {int(total)})."
+        scored = {m: n for m, n in moods.items() if m in REFLECTION_MOOD_SCORES}
+        if scored:
+            average = (sum(REFLECTION_MOOD_SCORES[m] * n for m, n in scored.items())
+                       / sum(scored.values()))
+            message += f" Average mood: {average:.1f}/5."
+        if energy.get('count'):
+            message += f" Average energy: {energy['sum'] / energy['count']:.1f}/10."
+        insights.append({
+            'icon': '📝',
+            'title': 'Check-in Trends',
+            'message': message,
+            'score': 0.2
+        })
+
+    insights.sort(key=lambda insight: insight['score'], reverse=True)
+    return insights
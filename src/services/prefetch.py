@@ -0,0 +1,109 @@
+"""
+Prefetch Service - Background reads for tabs the user is likely to open
+sqlite3 connections belong to the thread that opened them, so the worker
+keeps its own Database on the same file and shares its query cache
+"""
+import queue
+import threading
+
+from src.services.cache import get_query_cache
+from src.services.database import Database
+
+
+class Prefetcher:
+    """
+    Runs read-only jobs on one worker thread, hands results to the UI thread
+
+    A job is a function of a Database. Finished results wait in a queue
+    that the UI thread drains with widget.after(), so callbacks are free to
+    touch widgets. Every result carries the cache generation seen before
+    the job ran; is_fresh() says whether a write has landed since.
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, widget, db_path):
+        self.widget = widget
+        self.db_path = db_path
+        self.cache = get_query_cache(db_path)
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._pending = set()
+        self._thread = None
+        self._poll_id = None
+
+    def submit(self, name, job, callback):
+        """
+        Run job(db) in the background, then callback(result, generation)
+
+        Ignored while a job with the same name is still pending.
+        """
+        if name in self._pending:
+            return False
+        self._pending.add(name)
+
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="backtolife-prefetch", daemon=True
+            )
+            self._thread.start()
+
+        self._jobs.put((name, job, callback))
+        if self._poll_id is None:
+            self._poll_id = self.widget.after(self.POLL_MS, self._poll)
+        return True
+
+    def is_fresh(self, generation):
+        """True if no cached data was invalidated since generation"""
+        return generation == self.cache.generation
+
+    def close(self):
+        """Stop the worker and its connection"""
+        if self._poll_id is not None:
+            self.widget.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def _run(self):
+        """Worker loop (owns the worker's Database)"""
+        try:
+            db = Database(self.db_path)
+        except Exception as e:
+            print(f"Prefetch worker could not open database: {e}")
+            db = None
+
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                break
+            name, job, callback = item
+
+            generation = self.cache.generation
+            result = None
+            if db is not None:
+                try:
+                    result = job(db)
+                except Exception as e:
+                    print(f"Prefetch '{name}' failed: {e}")
+            self._results.put((name, callback, generation, result))
+
+        if db is not None:
+            db.close()
+
+    def _poll(self):
+        """Deliver finished results on the UI thread"""
+        self._poll_id = None
+        while True:
+            try:
+                name, callback, generation, result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending.discard(name)
+            if result is not None:
+                callback(result, generation)
+
+        if self._pending:
+            self._poll_id = self.widget.after(self.POLL_MS, self._poll)
@@ -0,0 +1,294 @@
+"""
+Search Service - Inverted index over guides, tools, courses, flashcards and quests
+Prefix-aware so results can update on every keystroke
+"""
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from typing import Any, NamedTuple
+
+from src.data.content_packs import get_content_library
+from src.data.quest_catalog import get_quest_catalog
+
+
+# Score multiplier per field a term was found in
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'description': 1.0,
+    'body': 0.5
+}
+
+# The last query word is matched as a prefix once it is this long
+MIN_PREFIX_LENGTH = 2
+PREFIX_MATCH_FACTOR = 0.7
+
+# Search-as-you-type waits this long after the last keystroke
+SEARCH_DEBOUNCE_MS = 120
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase words of text ("Self-Care" -> ['self', 'care'])"""
+    return _TOKEN_RE.findall(str(text).lower().replace("'", ""))
+
+
+def is_search_query(query):
+    """
+    True if query is long enough to filter by
+
+    Shorter input (nothing, or a first letter) shows the full list rather
+    than an empty one, since single letters don't prefix-match.
+    """
+    return bool(query) and len(query.strip()) >= MIN_PREFIX_LENGTH
+
+
+class SearchResult(NamedTuple):
+    """One ranked hit"""
+    kind: str
+    doc_id: Any
+    score: float
+    item: Any
+
+
+class SearchIndex:
+    """
+    Incremental inverted index with prefix matching
+
+    Each term maps to {doc_key: weight}, where weight sums FIELD_WEIGHTS
+    over every occurrence. A sorted term list turns "terms starting with
+    x" into one bisect. Queries are AND across words, scored by
+    weight * idf, with the last word also matching as a prefix.
+    Per-word match sets are memoized until the next add/remove, so typing
+    one more letter only expands the newest word.
+    """
+
+    MATCH_CACHE_SIZE = 256
+
+    def __init__(self):
+        self._docs = {}  # (kind, doc_id) -> (item, terms)
+        self._postings = {}  # term -> {(kind, doc_id): weight}
+        self._terms = []  # sorted keys of _postings
+        self._match_cache = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, kind, doc_id, item, **fields):
+        """Index item under (kind, doc_id), replacing any previous version"""
+        weights = {}
+        for field, text in fields.items():
+            if not text:
+                continue
+            if isinstance(text, (list, tuple)):
+                text = " ".join(str(part) for part in text)
+            field_weight = FIELD_WEIGHTS.get(field, 1.0)
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0.0) + field_weight
+
+        key = (kind, doc_id)
+        with self._lock:
+            self._remove(key)
+            self._docs[key] = (item, tuple(weights))
+            for term, weight in weights.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = {}
+                    insort(self._terms, term)
+                postings[key] = weight
+            self._match_cache.clear()
+
+    def remove(self, kind, doc_id):
+        """Drop a document (no-op if absent)"""
+        with self._lock:
+            if self._remove((kind, doc_id)):
+                self._match_cache.clear()
+
+    def _remove(self, key):
+        """Unlink key from its postings; True if it was indexed"""
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return False
+        for term in entry[1]:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+        return True
+
+    def get(self, kind, doc_id):
+        """Indexed item, or None"""
+        entry = self._docs.get((kind, doc_id))
+        return entry[0] if entry else None
+
+    def doc_ids(self, kind):
+        """Ids currently indexed for a kind"""
+        with self._lock:
+            return {doc_id for k, doc_id in self._docs if k == kind}
+
+    def search(self, query, kinds=None, limit=20):
+        """Ranked SearchResults for query, best first"""
+        words = tokenize(query)
+        if not words:
+            return []
+
+        with self._lock:
+            scores = None
+            for position, word in enumerate(words):
+                prefix = position == len(words) - 1 and len(word) >= MIN_PREFIX_LENGTH
+                matches = self._match(word, prefix)
+                if scores is None:
+                    scores = dict(matches)
+                else:
+                    scores = {key: score + matches[key]
+                              for key, score in scores.items() if key in matches}
+                if not scores:
+                    return []
+
+            if kinds is not None:
+                scores = {key: score for key, score in scores.items() if key[0] in kinds}
+
+            best = heapq.nsmallest(
+                limit, scores.items(),
+                key=lambda entry: (-entry[1], entry[0][0], str(entry[0][1]))
+            )
+            return [
+                SearchResult(kind, doc_id, score, self._docs[(kind, doc_id)][0])
+                for (kind, doc_id), score in best
+            ]
+
+    def _match(self, word, prefix):
+        """{doc_key: score} for one query word (memoized)"""
+        cache_key = (word, prefix)
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if prefix:
+            start = bisect_left(self._terms, word)
+            end = bisect_left(self._terms, word + "\uffff", start)
+            terms = self._terms[start:end]
+        else:
+            terms = [word] if word in self._postings else []
+
+        total = len(self._docs)
+        matches = {}
+        for term in terms:
+            postings = self._postings[term]
+            factor = math.log(1 + total / len(postings))
+            if term != word:
+                factor *= PREFIX_MATCH_FACTOR
+            for key, weight in postings.items():
+                score = weight * factor
+                if score > matches.get(key, 0.0):
+                    matches[key] = score
+
+        if len(self._match_cache) >= self.MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[cache_key] = matches
+        return matches
+
+
+class Debouncer:
+    """
+    Calls callback once input has been quiet for delay_ms
+
+    Bind an instance to <KeyRelease>: every event restarts the timer with
+    widget.after(), and nothing runs once the widget has been destroyed.
+    """
+
+    def __init__(self, widget, callback, delay_ms=SEARCH_DEBOUNCE_MS):
+        self.widget = widget
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._after_id = None
+
+    def __call__(self, event=None):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+        self._after_id = self.widget.after(self.delay_ms, self._fire)
+
+    def _fire(self):
+        self._after_id = None
+        if self.widget.winfo_exists():
+            self.callback()
+
+
+def index_content_library(index):
+    """Add the guides, tools, courses and flashcard collections from the content packs"""
+    library = get_content_library()
+    for guide in library.guides:
+        index.add(
+            'guide', guide['id'], guide,
+            title=guide['title'],
+            description=guide['description'],
+            tags=guide['category'],
+            body=[f"{step['title']} {step['content']}" for step in guide.get('content', ())]
+        )
+    for tool in library.tools:
+        index.add(
+            'tool', tool['id'], tool,
+            title=tool['name'],
+            description=tool['description'],
+            tags=[tool['category']] + [m for m in tool['moods'] if m != 'all']
+        )
+    for course in library.courses:
+        index.add(
+            'course', course['id'], course,
+            title=course['title'],
+            description=course['description']
+        )
+    for collection in library.flashcard_collections:
+        index.add(
+            'flashcards', collection['title'], collection,
+            title=collection['title'],
+            description=collection['description']
+        )
+
+
+def sync_quests(index, catalog):
+    """Bring indexed quests in line with a quest catalog, touching only changes"""
+    current = {quest.id: quest for quest in catalog}
+    for quest_id in index.doc_ids('quest') - current.keys():
+        index.remove('quest', quest_id)
+    for quest_id, quest in current.items():
+        if index.get('quest', quest_id) != quest:
+            index.add(
+                'quest', quest_id, quest,
+                title=quest.title,
+                description=quest.description,
+                tags=quest.category.replace('_', ' '),
+                body=[quest.why_text, quest.instructions]
+            )
+
+
+# Global index: static content is added once, quests are re-synced
+# whenever the quest catalog has been reloaded
+_search_index = None
+_synced_catalog = None
+_index_lock = threading.Lock()
+
+
+def get_search_index(db=None):
+    """
+    Get the shared search index
+
+    With a db, quests are included and kept in step with its catalog.
+    """
+    global _search_index, _synced_catalog
+    with _index_lock:
+        if _search_index is None:
+            _search_index = SearchIndex()
+            index_content_library(_search_index)
+
+        if db is not None:
+            catalog = get_quest_catalog(db)
+            if catalog is not _synced_catalog:
+                sync_quests(_search_index, catalog)
+                _synced_catalog = catalog
+        return _search_index
@@ -0,0 +1,174 @@
+"""
+Spaced Repetition - SM-2 scheduling for flashcards
+Each card keeps its own state row (ease, interval, due date, lapses) that
+a review updates in place; flashcard_reviews stays an append-only log
+"""
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+
+
+# SM-2 defaults (SuperMemo 2, Wozniak 1990)
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+FIRST_INTERVAL_DAYS = 1
+SECOND_INTERVAL_DAYS = 6
+
+# Answers are graded 0-5; below PASSING_GRADE the card lapses and restarts.
+# The flashcard widgets only report right/wrong, which map to these grades.
+PASSING_GRADE = 3
+GRADE_CORRECT = 4
+GRADE_INCORRECT = 1
+
+
+class CardState(NamedTuple):
+    """Scheduling state of one flashcard"""
+    ease: float = DEFAULT_EASE
+    interval_days: int = 0
+    repetitions: int = 0  # successful reviews in a row
+    lapses: int = 0
+    review_count: int = 0
+    due_date: Optional[str] = None
+    last_review_date: Optional[str] = None
+
+
+def grade_for(correct):
+    """SM-2 grade for a right/wrong answer (None counts as right, as in old logs)"""
+    return GRADE_INCORRECT if correct is not None and not correct else GRADE_CORRECT
+
+
+def schedule(state, grade, reviewed_at):
+    """
+    Next CardState after answering a card with grade 0-5 at reviewed_at
+
+    Passing grades grow the interval (1 day, 6 days, then times the ease);
+    failing ones reset it to a day and count a lapse. Ease moves by the
+    SM-2 formula and never drops below MIN_EASE.
+    """
+    grade = max(0, min(5, grade))
+    if grade >= PASSING_GRADE:
+        if state.repetitions == 0:
+            interval = FIRST_INTERVAL_DAYS
+        elif state.repetitions == 1:
+            interval = SECOND_INTERVAL_DAYS
+        else:
+            interval = max(1, round(state.interval_days * state.ease))
+        repetitions = state.repetitions + 1
+        lapses = state.lapses
+    else:
+        interval = FIRST_INTERVAL_DAYS
+        repetitions = 0
+        lapses = state.lapses + 1
+
+    miss = 5 - grade
+    ease = max(MIN_EASE, state.ease + 0.1 - miss * (0.08 + miss * 0.02))
+
+    return CardState(
+        ease=round(ease, 4),
+        interval_days=interval,
+        repetitions=repetitions,
+        lapses=lapses,
+        review_count=state.review_count + 1,
+        due_date=(reviewed_at + timedelta(days=interval)).isoformat(),
+        last_review_date=reviewed_at.isoformat()
+    )
+
+
+def create_tables(cursor):
+    """Create the review log and card state tables (used by the schema migration)"""
+    # Older builds created this from FlashcardManager; same definition
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS flashcard_reviews (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            flashcard_id TEXT,
+            review_date TEXT,
+            correct BOOLEAN,
+            next_review_date TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS flashcard_state (
+            flashcard_id TEXT PRIMARY KEY,
+            ease REAL NOT NULL DEFAULT 2.5,
+            interval_days INTEGER NOT NULL DEFAULT 0,
+            repetitions INTEGER NOT NULL DEFAULT 0,
+            lapses INTEGER NOT NULL DEFAULT 0,
+            review_count INTEGER NOT NULL DEFAULT 0,
+            due_date TEXT NOT NULL,
+            last_review_date TEXT
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_flashcard_state_due
+        ON flashcard_state (due_date)
+    ''')
+
+
+def load_state(cursor, flashcard_id):
+    """Stored CardState for a card (a fresh state if never reviewed)"""
+    cursor.execute('''
+        SELECT ease, interval_days, repetitions, lapses, review_count,
+               due_date, last_review_date
+        FROM flashcard_state
+        WHERE flashcard_id = ?
+    ''', (flashcard_id,))
+    row = cursor.fetchone()
+    return CardState(*row) if row else CardState()
+
+
+def save_state(cursor, flashcard_id, state):
+    """Insert or overwrite a card's state row"""
+    cursor.execute('''
+        INSERT INTO flashcard_state (
+            flashcard_id, ease, interval_days, repetitions, lapses,
+            review_count, due_date, last_review_date
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (flashcard_id) DO UPDATE SET
+            ease = excluded.ease,
+            interval_days = excluded.interval_days,
+            repetitions = excluded.repetitions,
+            lapses = excluded.lapses,
+            review_count = excluded.review_count,
+            due_date = excluded.due_date,
+            last_review_date = excluded.last_review_date
+    ''', (flashcard_id,) + tuple(state))
+
+
+def record_review(cursor, flashcard_id, grade, reviewed_at):
+    """Log one review and reschedule the card; returns its new CardState"""
+    state = schedule(load_state(cursor, flashcard_id), grade, reviewed_at)
+    save_state(cursor, flashcard_id, state)
+    cursor.execute('''
+        INSERT INTO flashcard_reviews (flashcard_id, review_date, correct, next_review_date)
+        VALUES (?, ?, ?, ?)
+    ''', (flashcard_id, reviewed_at.isoformat(), grade >= PASSING_GRADE, state.due_date))
+    return state
+
+
+def rebuild(cursor):
+    """Recompute flashcard_state by replaying the review log in order"""
+    cursor.execute('DELETE FROM flashcard_state')
+    cursor.execute('''
+        SELECT flashcard_id, review_date, correct
+        FROM flashcard_reviews
+        WHERE flashcard_id IS NOT NULL AND review_date IS NOT NULL
+        ORDER BY flashcard_id, review_date, id
+    ''')
+    states = {}
+    for flashcard_id, review_date, correct in cursor.fetchall():
+        state = states.get(flashcard_id, CardState())
+        states[flashcard_id] = schedule(
+            state, grade_for(correct), datetime.fromisoformat(review_date)
+        )
+    for flashcard_id, state in states.items():
+        save_state(cursor, flashcard_id, state)
+
+
+def due_cards(cursor, now):
+    """(flashcard_id, due_date) for cards due by now, most overdue first"""
+    cursor.execute('''
+        SELECT flashcard_id, due_date
+        FROM flashcard_state
+        WHERE due_date <= ?
+        ORDER BY due_date
+    ''', (now.isoformat(),))
+    return cursor.fetchall()
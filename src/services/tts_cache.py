@@ -0,0 +1,224 @@
+"""
+TTS Cache - Pre-rendered speech on disk
+Utterances are rendered to WAV once and replayed from the file afterwards,
+so text that has been heard before starts without any synthesis
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+import wave
+from collections import OrderedDict
+from pathlib import Path
+
+try:
+    import winsound
+except ImportError:  # not on Windows
+    winsound = None
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".backtolife" / "cache" / "tts"
+
+# Upper bound for the WAV files kept on disk (least recently played go first)
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Command-line players tried in order when winsound isn't available
+PLAYER_COMMANDS = (
+    ("afplay",),
+    ("aplay", "-q"),
+    ("paplay",),
+)
+
+
+class TTSCache:
+    """
+    Size-bounded LRU cache of rendered utterances
+
+    Files are named by a hash of (text, voice, rate, volume), so changing
+    any voice setting naturally misses. Last use is the file's mtime, which
+    keeps the LRU order across restarts.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> size, least recently used first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def key(text, voice, rate, volume):
+        """Cache key for one utterance with the given voice settings"""
+        payload = json.dumps([text, voice, rate, round(volume, 3)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def path(self, key):
+        """Where the WAV for key lives (whether or not it exists yet)"""
+        return self.cache_dir / f"{key}.wav"
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def _load(self):
+        """Index the files already on disk, oldest first"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            files = []
+            for path in self.cache_dir.iterdir():
+                if path.suffix == ".tmp":
+                    path.unlink()  # left over from an interrupted render
+                elif path.suffix == ".wav":
+                    stat = path.stat()
+                    files.append((stat.st_mtime_ns, path.stem, stat.st_size))
+        except OSError as e:
+            print(f"TTS cache unavailable: {e}")
+            return
+
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    def lookup(self, key):
+        """Path of the cached WAV for key, marking it recently used; None on a miss"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            # Deleted behind our back
+            self._forget(key)
+            return None
+        return path
+
+    def store(self, key, render):
+        """
+        Render an utterance into the cache
+
+        render(path) must write a WAV file at path and return True, or
+        return False to discard it (e.g. when it was cut short). The file
+        is written under a temporary name and moved into place, so a crash
+        never leaves a truncated WAV behind. Returns the final path, or
+        None if nothing was stored.
+        """
+        path = self.path(key)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            complete = render(str(tmp_path))
+            size = tmp_path.stat().st_size if tmp_path.exists() else 0
+            if not complete or size == 0:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                return None
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"TTS cache write failed: {e}")
+            return None
+
+        with self._lock:
+            self._total_bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict()
+        return path
+
+    def _forget(self, key):
+        with self._lock:
+            self._total_bytes -= self._entries.pop(key, 0)
+
+    def _evict(self):
+        """Delete least recently used files until under max_bytes (keeps the newest)"""
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                self.path(key).unlink()
+            except OSError:
+                pass
+
+    def clear(self):
+        """Delete every cached file"""
+        with self._lock:
+            for key in self._entries:
+                try:
+                    self.path(key).unlink()
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+def wav_duration(path):
+    """Length of a WAV file in seconds (0.0 if it can't be read)"""
+    try:
+        with wave.open(str(path), 'rb') as wav:
+            return wav.getnframes() / float(wav.getframerate() or 1)
+    except (OSError, EOFError, wave.Error):
+        return 0.0
+
+
+class WavPlayer:
+    """
+    Plays cached WAV files, one at a time
+
+    Uses winsound on Windows and the first command-line player found
+    elsewhere. play() blocks until the sound ends or stop() is called
+    from another thread.
+    """
+
+    def __init__(self):
+        self._command = None
+        if winsound is None:
+            for command in PLAYER_COMMANDS:
+                if shutil.which(command[0]):
+                    self._command = command
+                    break
+        self._process = None
+        self._stopped = threading.Event()
+
+    @property
+    def available(self):
+        """True if this platform can play WAV files"""
+        return winsound is not None or self._command is not None
+
+    def play(self, path):
+        """Play a WAV file; returns False if it was stopped early"""
+        self._stopped.clear()
+        if winsound is not None:
+            winsound.PlaySound(
+                str(path),
+                winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT
+            )
+            # Async playback has no completion signal; wait out its length
+            return not self._stopped.wait(wav_duration(path))
+
+        self._process = subprocess.Popen(
+            self._command + (str(path),),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        self._process.wait()
+        self._process = None
+        return not self._stopped.is_set()
+
+    def stop(self):
+        """Stop the sound currently playing, if any"""
+        self._stopped.set()
+        if winsound is not None:
+            winsound.PlaySound(None, 0)
+            return
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
@@ -0,0 +1,543 @@
+"""
+TTS Worker - The one thread that talks to the speech engine
+Speech and cache renders are queued by priority, newer speech replaces
+speech nobody has heard yet, and urgent speech cuts in immediately
+"""
+import heapq
+import itertools
+import queue
+import re
+import threading
+from typing import NamedTuple, Optional
+
+from src.services.tts_cache import TTSCache
+
+
+# Lower runs first. Urgent is for crisis (Shield) speech, background for
+# rendering text into the TTS cache.
+PRIORITY_URGENT = 0
+PRIORITY_NORMAL = 1
+PRIORITY_BACKGROUND = 2
+
+# Most speech requests waiting at once; the least important are dropped
+# beyond this. Cache renders don't count: they are deduplicated by text, so
+# their number is bounded by the static scripts and every one gets cached.
+MAX_PENDING = 32
+
+# Streamed speech: sentences shorter than this are joined with the next one
+# (except the first, which should reach the speaker as soon as possible),
+# and longer ones are split at commas or spaces
+MIN_CHUNK_CHARS = 60
+MAX_CHUNK_CHARS = 240
+
+_SENTENCE_END_RE = re.compile(r"""(?<=[.!?\u2026])["')\]]*\s+""")
+_CLAUSE_END_RE = re.compile(r'(?<=[,;:\u2014])\s+')
+
+
+def _split_long(sentence, max_chars):
+    """Break an overlong sentence at clause ends, then at spaces"""
+    pieces = []
+    current = ""
+    for part in _CLAUSE_END_RE.split(sentence):
+        for word in part.split(" ") if len(part) > max_chars else [part]:
+            candidate = f"{current} {word}" if current else word
+            if len(candidate) > max_chars and current:
+                pieces.append(current)
+                current = word
+            else:
+                current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_sentences(text, min_chars=MIN_CHUNK_CHARS, max_chars=MAX_CHUNK_CHARS):
+    """
+    Split text into speakable chunks of roughly one sentence
+
+    Lines and sentence punctuation both end a sentence. The first chunk
+    is kept as short as possible; later short sentences are merged so
+    chunk boundaries (and their small gaps) stay infrequent.
+    """
+    sentences = []
+    for line in text.splitlines():
+        for sentence in _SENTENCE_END_RE.split(line.strip()):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if len(sentence) > max_chars:
+                sentences.extend(_split_long(sentence, max_chars))
+            else:
+                sentences.append(sentence)
+
+    chunks = []
+    for sentence in sentences:
+        if (len(chunks) > 1 and len(chunks[-1]) < min_chars
+                and len(chunks[-1]) + len(sentence) < max_chars):
+            chunks[-1] = f"{chunks[-1]} {sentence}"
+        else:
+            chunks.append(sentence)
+    return chunks
+
+
+class VoiceSettings(NamedTuple):
+    """Engine properties an utterance is spoken with"""
+    voice: Optional[str]
+    rate: int
+    volume: float
+
+
+class CancelToken:
+    """Handle to one speech request; cancel() drops it or cuts it short"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._on_cancel = None
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        """Cancel the request (no-op if it already finished)"""
+        if self._event.is_set():
+            return
+        self._event.set()
+        if self._on_cancel is not None:
+            self._on_cancel()
+
+
+class SpeechStream:
+    """
+    Long text spoken sentence by sentence
+
+    The worker renders chunk N+1 while chunk N plays. pause() stops at
+    once and resume() picks up again at the start of the interrupted
+    chunk. A paused stream is off the queue entirely, so other speech can
+    run in the meantime.
+    """
+
+    def __init__(self, worker, chunks, priority):
+        self.worker = worker
+        self.chunks = tuple(chunks)
+        self.priority = priority
+        self.position = 0  # index of the next chunk to play
+        self.paused = False
+        self.request = None  # the SpeechRequest currently queued or running
+        self.finished = threading.Event()  # played to the end, or cancelled
+
+    @property
+    def is_paused(self):
+        return self.paused and not self.finished.is_set()
+
+    def pause(self):
+        """Stop playback, keeping the position for resume()"""
+        with self.worker._cond:
+            if self.paused or self.finished.is_set():
+                return
+            self.paused = True
+            running = self.request is self.worker._current
+        if running:
+            self.worker._interrupt()
+
+    def resume(self):
+        """Continue from the chunk that was interrupted by pause()"""
+        with self.worker._cond:
+            if not self.paused or self.finished.is_set():
+                return
+            self.paused = False
+            if self.request is not None and not self.request.done.is_set():
+                # Still queued, or winding down: the worker carries on with it
+                return
+            self.worker._submit_speech(self.worker._stream_request(self))
+
+    def cancel(self):
+        """End the stream for good"""
+        with self.worker._cond:
+            self.paused = False
+            self.finished.set()
+            request = self.request
+        if request is not None:
+            request.token.cancel()
+
+
+class SpeechRequest:
+    """
+    One queued utterance ('speak'), part of a SpeechStream ('stream') or
+    cache render ('render')
+
+    Voice settings and the cache key are filled in when the worker picks
+    the request up, so requests queued before the engine exists (or
+    before a rate change) use the settings in effect when they run.
+    """
+
+    def __init__(self, kind, text, priority, seq):
+        self.kind = kind
+        self.text = text
+        self.priority = priority
+        self.seq = seq
+        self.settings = None
+        self.key = None
+        self.token = CancelToken()
+        self.done = threading.Event()
+        self.preempted = False  # a render cut short by speech; it is re-queued
+        self.stream = None
+
+    @property
+    def is_speech(self):
+        return self.kind != 'render'
+
+    @property
+    def should_stop(self):
+        return (self.token.cancelled or self.preempted
+                or (self.stream is not None and self.stream.paused))
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class TTSWorker:
+    """
+    Long-lived thread that owns the pyttsx3 engine
+
+    Nothing else touches the engine, so calls never race. The engine is
+    created on this thread by create_engine(); requests queued before it
+    is ready simply wait. voice_settings() gives the VoiceSettings to use
+    for each request. Requests wait in a priority queue (bounded for speech):
+
+    - a new speak request supersedes pending speak requests of the same or
+      lower priority, and interrupts current speech of the same or lower
+      priority (the newest click wins)
+    - any speak request interrupts a cache render, which is queued again
+    - cancelling a request's token removes it, or stops it mid-sentence
+    """
+
+    def __init__(self, create_engine, voice_settings, tts_cache, player,
+                 max_pending=MAX_PENDING, on_ready=None):
+        self.create_engine = create_engine
+        self.voice_settings = voice_settings
+        self.on_ready = on_ready
+        self.tts_cache = tts_cache
+        self.player = player
+        self.max_pending = max_pending
+
+        self.engine = None
+        self.init_error = None
+        self.ready = threading.Event()
+
+        self._pending = []  # heap of SpeechRequest
+        self._pending_renders = set()  # texts of queued renders
+        self._current = None
+        self._applied = None  # VoiceSettings last set on the engine
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="tts-worker", daemon=True)
+
+    @property
+    def started(self):
+        return self._thread.ident is not None
+
+    def start(self):
+        """Start the thread (it creates the engine, then sets ready); idempotent"""
+        with self._cond:
+            if not self.started:
+                self._thread.start()
+
+    @property
+    def is_speaking(self):
+        """True while an utterance is being spoken or played"""
+        current = self._current
+        return current is not None and current.is_speech
+
+    def speak(self, text, priority=PRIORITY_NORMAL):
+        """Queue text to be spoken; returns its SpeechRequest"""
+        request = SpeechRequest('speak', text, priority, next(self._seq))
+        self._submit_speech(request)
+        return request
+
+    def stream(self, text, priority=PRIORITY_NORMAL):
+        """Queue text to be spoken in sentence chunks; returns its SpeechStream"""
+        stream = SpeechStream(self, split_sentences(text), priority)
+        if not stream.chunks:
+            stream.finished.set()
+            return stream
+        self._submit_speech(self._stream_request(stream))
+        return stream
+
+    def _stream_request(self, stream):
+        """Request that plays stream from its current position"""
+        request = SpeechRequest('stream', " ".join(stream.chunks[stream.position:]),
+                                stream.priority, next(self._seq))
+        request.stream = stream
+        stream.request = request
+        return request
+
+    def _submit_speech(self, request):
+        """Queue speech, superseding pending and current speech it outranks"""
+        with self._cond:
+            for pending in [r for r in self._pending
+                            if r.is_speech and r.priority >= request.priority]:
+                self._drop(pending)
+
+            current = self._current
+            if current is not None and (not current.is_speech
+                                        or current.priority >= request.priority):
+                if current.kind == 'render':
+                    current.preempted = True
+                    self._interrupt()
+                else:
+                    current.token.cancel()
+
+            self._push(request)
+
+    def render(self, text):
+        """Queue text to be rendered into the TTS cache (skipped if already there)"""
+        if self.ready.is_set() and TTSCache.key(text, *self.voice_settings()) in self.tts_cache:
+            return None
+        request = SpeechRequest('render', text, PRIORITY_BACKGROUND, next(self._seq))
+        with self._cond:
+            if text in self._pending_renders:
+                return None
+            self._push(request)
+        return request
+
+    def cancel_speech(self):
+        """Drop all pending speech and stop what is being said now"""
+        with self._cond:
+            for pending in [r for r in self._pending if r.is_speech]:
+                self._drop(pending)
+            current = self._current
+        if current is not None and current.is_speech:
+            current.token.cancel()
+
+    def close(self):
+        """Stop the thread once the current request is finished or interrupted"""
+        with self._cond:
+            self._closed = True
+            for pending in list(self._pending):
+                self._drop(pending)
+            current = self._current
+            self._cond.notify()
+        if current is not None:
+            current.token.cancel()
+
+    def _push(self, request):
+        """Add to the queue, making room by dropping the least important speech"""
+        if self._closed:
+            self._discard(request)
+            return
+        if request.is_speech:
+            speech = [r for r in self._pending if r.is_speech]
+            if len(speech) >= self.max_pending:
+                worst = max(speech, key=lambda r: (r.priority, r.seq))
+                if request.priority > worst.priority:
+                    self._discard(request)
+                    return
+                self._drop(worst)
+
+        request.token._on_cancel = lambda: self._on_cancel(request)
+        if request.kind == 'render':
+            self._pending_renders.add(request.text)
+        heapq.heappush(self._pending, request)
+        self._cond.notify()
+
+    def _drop(self, request):
+        """Remove a pending request and mark it finished (caller holds the lock)"""
+        self._pending.remove(request)
+        heapq.heapify(self._pending)
+        if request.kind == 'render':
+            self._pending_renders.discard(request.text)
+        self._discard(request)
+
+    def _discard(self, request):
+        """Mark a request that will never run as cancelled and finished"""
+        request.token._on_cancel = None
+        request.token.cancel()
+        if request.stream is not None:
+            request.stream.finished.set()
+        request.done.set()
+
+    def _on_cancel(self, request):
+        """A token was cancelled: unqueue its request, or cut it short if running"""
+        with self._cond:
+            if request in self._pending:
+                self._drop(request)
+                return
+            running = request is self._current
+        if running:
+            self._interrupt()
+
+    def _interrupt(self):
+        """Cut the current request short (engine speech stops at the next word)"""
+        self.player.stop()
+
+    def _on_word(self, name, location, length):
+        """Engine callback on the worker thread, the only safe place to stop it"""
+        current = self._current
+        if current is not None and current.should_stop:
+            self.engine.stop()
+
+    def _run(self):
+        """Create the engine, then serve requests until closed"""
+        try:
+            self.engine = self.create_engine()
+            self.engine.connect('started-word', self._on_word)
+        except Exception as e:
+            self.engine = None
+            self.init_error = e
+
+        if self.on_ready is not None:
+            self.on_ready()
+        self.ready.set()
+        if self.engine is None:
+            # Nothing will ever be spoken: release anyone waiting on a request
+            with self._cond:
+                self._closed = True
+                for pending in list(self._pending):
+                    self._drop(pending)
+            return
+
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                request = heapq.heappop(self._pending)
+                if request.kind == 'render':
+                    self._pending_renders.discard(request.text)
+                self._current = request
+
+            request.settings = self.voice_settings()
+            request.key = TTSCache.key(request.text, *request.settings)
+
+            try:
+                if not request.should_stop:
+                    if request.kind == 'speak':
+                        self._speak(request)
+                    elif request.kind == 'stream':
+                        self._stream(request)
+                    else:
+                        self._render(request)
+            except Exception as e:
+                print(f"TTS error: {e}")
+                request.token.cancel()
+            finally:
+                with self._cond:
+                    self._current = None
+                    if request.stream is not None:
+                        self._continue_stream(request)
+                    request.token._on_cancel = None
+                    request.done.set()
+
+            if request.preempted and not request.token.cancelled:
+                self.render(request.text)
+
+    def _apply(self, settings):
+        """Set voice, rate and volume on the engine if they changed"""
+        if settings == self._applied:
+            return
+        if settings.voice is not None:
+            self.engine.setProperty('voice', settings.voice)
+        self.engine.setProperty('rate', settings.rate)
+        self.engine.setProperty('volume', settings.volume)
+        self._applied = settings
+
+    def _speak(self, request):
+        """Play from the TTS cache, or say it live and queue a render"""
+        path = self.tts_cache.lookup(request.key) if self.player.available else None
+        if path is not None:
+            self.player.play(path)
+            return
+
+        self._apply(request.settings)
+        self.engine.say(request.text)
+        self.engine.runAndWait()
+        if self.player.available and not request.should_stop:
+            self.render(request.text)
+
+    def _stream(self, request):
+        """
+        Speak a stream from its position, rendering ahead of playback
+
+        Chunks are rendered into the TTS cache on this thread while a
+        playback thread plays the ones already rendered. Without a WAV
+        player, chunks are spoken live one by one instead.
+        """
+        stream = request.stream
+        if not self.player.available:
+            for chunk in stream.chunks[stream.position:]:
+                self._apply(request.settings)
+                self.engine.say(chunk)
+                self.engine.runAndWait()
+                if request.should_stop:
+                    return
+                stream.position += 1
+            return
+
+        rendered = queue.Queue()
+        playback = threading.Thread(
+            target=self._play_chunks, args=(request, rendered), name="tts-playback", daemon=True
+        )
+        playback.start()
+        try:
+            for index in range(stream.position, len(stream.chunks)):
+                chunk = stream.chunks[index]
+                key = TTSCache.key(chunk, *request.settings)
+                path = self.tts_cache.lookup(key)
+                if path is None:
+                    path = self._render_chunk(request, chunk, key)
+                if path is None:
+                    if not request.should_stop:
+                        print(f"TTS stream stopped: could not render chunk {index + 1}")
+                        request.token.cancel()
+                    break
+                rendered.put((index, path))
+        finally:
+            rendered.put(None)
+            playback.join()
+
+    def _render_chunk(self, request, chunk, key):
+        """Render one stream chunk into the cache; None if interrupted or failed"""
+        def render_to_file(path):
+            self.engine.save_to_file(chunk, path)
+            self.engine.runAndWait()
+            return not request.should_stop
+
+        self._apply(request.settings)
+        return self.tts_cache.store(key, render_to_file)
+
+    def _play_chunks(self, request, rendered):
+        """Playback thread: play rendered chunks in order until the end or a stop"""
+        stream = request.stream
+        while True:
+            item = rendered.get()
+            if item is None or request.should_stop:
+                return
+            index, path = item
+            if not self.player.play(path) or request.should_stop:
+                return
+            stream.position = index + 1
+
+    def _continue_stream(self, request):
+        """After a stream request ends: finish, stay paused, or carry on (caller holds the lock)"""
+        stream = request.stream
+        if stream.position >= len(stream.chunks) or request.token.cancelled:
+            stream.finished.set()
+        elif not stream.paused and not self._closed:
+            # resume() came while this request was winding down
+            self._push(self._stream_request(stream))
+
+    def _render(self, request):
+        """Synthesize into the TTS cache; an interrupted render is discarded"""
+        if request.key in self.tts_cache:
+            return
+
+        def render_to_file(path):
+            self.engine.save_to_file(request.text, path)
+            self.engine.runAndWait()
+            return not request.should_stop
+
+        self._apply(request.settings)
+        self.tts_cache.store(request.key, render_to_file)
@@ -5,45 +5,100 @@ Intelligently selects daily quests based on user patterns and current state
 """
 import random
 from datetime import datetime, timedelta
-from src.data.quest_database import get_quests_by_category, get_random_quest_by_difficulty
+from typing import Any, NamedTuple, Optional
+from src.data.quest_database import (
+    get_quests_by_category, get_quest_by_id, get_random_quest_by_difficulty
+)
+from src.services.database import epoch_day
+
+
+class SelectionContext(NamedTuple):
+    """Everything select_for_context needs about one user-day"""
+    profile: dict
+    quest_history: dict  # category -> completions in the last 7 days
+    last_reflection: Optional[dict]
+    now: datetime
+
+
+class QuestSelection(NamedTuple):
+    """Result of one daily quest selection"""
+    quest: Any
+    domain: str
+    difficulty: int
+    time_of_day: str
+    reason: str
 
 
 class ContextEngine:
-    def __init__(self, db):
+    def __init__(self, db, clock=None, rng=None):
+        """
+        Args:
+            db: Database instance
+            clock: Callable returning the current datetime (default: datetime.now)
+            rng: random.Random-compatible source (default: a fresh Random())
+
+        Pass a fixed clock and a seeded Random to make selections reproducible.
+        """
         self.db = db
+        self.clock = clock or datetime.now
+        self.rng = rng if rng is not None else random.Random()
 
     def select_daily_quest(self):
         """
         Main quest selection algorithm
         Analyzes user state and selects the most appropriate quest
         """
-        # Get current context
-        time_of_day = self.get_time_of_day()
-        day_of_week = datetime.now().strftime('%A')
-        user_profile = self.db.get_user_profile()
+        return self.select_for_context(self.capture_context()).quest
+
+    def capture_context(self):
+        """Snapshot the live user state for select_for_context"""
+        return SelectionContext(
+            profile=self.db.get_user_profile(),
+            quest_history=self.get_recent_quest_counts(),
+            last_reflection=self.get_last_reflection(),
+            now=self.clock()
+        )
 
-        # Get recent history
-        quest_history = self.get_recent_quest_counts()
-        last_reflection = self.get_last_reflection()
+    def select_for_context(self, context):
+        """
+        Select a quest for one snapshot
+
+        Uses only the snapshot, the engine's RNG and the quest catalog, so
+        the same inputs and RNG state always give the same selection.
+        """
+        time_of_day = self.get_time_of_day(context.now)
 
         # Determine priority domain
         priority_domain = self.determine_priority_domain(
-            quest_history, last_reflection, user_profile
+            context.quest_history, context.last_reflection, context.profile
         )
 
         # Calculate appropriate difficulty
-        difficulty = self.calculate_difficulty(user_profile, last_reflection)
+        difficulty = self.calculate_difficulty(
+            context.profile, context.last_reflection
+        )
 
         # Select specific quest
         quest = self.select_quest_from_domain(
             priority_domain, difficulty, time_of_day
         )
 
-        return quest
+        reason = (self.get_context_aware_why_message(quest, time_of_day)
+                  if quest else "")
+        return QuestSelection(quest, priority_domain, difficulty, time_of_day, reason)
+
+    def select_daily_quests(self, contexts):
+        """
+        Batch form of select_for_context
+
+        Takes an iterable of SelectionContext snapshots (e.g. replayed
+        user-days) and returns one QuestSelection per snapshot, in order.
+        """
+        return [self.select_for_context(context) for context in contexts]
 
-    def get_time_of_day(self):
+    def get_time_of_day(self, now=None):
         """Categorize current time"""
-        hour = datetime.now().hour
+        hour = (now or self.clock()).hour
         if 5 <= hour < 12:
             return 'morning'
         elif 12 <= hour < 17:
@@ -59,27 +114,30 @@ class ContextEngine:
             SELECT q.category, COUNT(*) as count
             FROM quest_history qh
             JOIN quests q ON qh.quest_id = q.id
-            WHERE DATE(qh.completed_date) >= DATE('now', '-7 days')
+            WHERE qh.completed_day >= ?
             GROUP BY q.category
-        ''')
+        ''', (epoch_day(self.clock()) - 7,))
         results = self.db.cursor.fetchall()
         return {row[0]: row[1] for row in results}
 
     def get_last_reflection(self):
         """Get most recent reflection data"""
         self.db.cursor.execute('''
-            SELECT * FROM reflections
+            SELECT date, mood_rating, energy_level, relationship_stress
+            FROM reflections
             ORDER BY date DESC
             LIMIT 1
         ''')
         row = self.db.cursor.fetchone()
         if row:
-            return {
-                'date': row[1],
-                'mood_rating': row[2],
-                'energy_level': row[5],
-                'relationship_stress': row[6]
+            reflection = {
+                'date': row[0],
+                'mood_rating': row[1],
+                'energy_level': row[2],
+                'relationship_stress': row[3]
             }
+            # Unanswered fields fall back to the callers' .get() defaults
+            return {k: v for k, v in reflection.items() if v is not None}
         return None
 
     def determine_priority_domain(self, quest_history, last_reflection, profile):
@@ -116,11 +174,11 @@ class ContextEngine:
 
             # Low energy = simple body or hygiene quest
             if energy <= 3:
-                return random.choice(['BODY_RECOVERY', 'EATING_DRINKING'])
+                return self.rng.choice(['BODY_RECOVERY', 'EATING_DRINKING'])
 
             # High relationship stress = boundary or self-care quest
             if relationship_stress >= 7:
-                return random.choice(['FINANCIAL', 'CREATIVE', 'SOCIAL_RECOVERY'])
+                return self.rng.choice(['FINANCIAL', 'CREATIVE', 'SOCIAL_RECOVERY'])
 
         # 5. Balance check - find least done category
         if quest_history:
@@ -167,20 +225,20 @@ class ContextEngine:
             difficulty = max(1, difficulty - 1)
             # Favor body, hydration, hygiene in morning
             if category not in ['BODY_RECOVERY', 'EATING_DRINKING', 'HYGIENE']:
-                if random.random() < 0.3:  # 30% chance to override
-                    category = random.choice(['BODY_RECOVERY', 'EATING_DRINKING'])
+                if self.rng.random() < 0.3:  # 30% chance to override
+                    category = self.rng.choice(['BODY_RECOVERY', 'EATING_DRINKING'])
 
         elif time_of_day == 'night':
             # Night is good for reflection, organization, creative work
             if category in ['SOCIAL_RECOVERY']:  # Avoid social quests at night
-                category = random.choice(['ORGANIZATION', 'CREATIVE', 'ACADEMIC'])
+                category = self.rng.choice(['ORGANIZATION', 'CREATIVE', 'ACADEMIC'])
 
         # Get quest from database
-        quest = get_random_quest_by_difficulty(self.db, category, difficulty)
+        quest = get_random_quest_by_difficulty(self.db, category, difficulty, self.rng)
 
         # If no quest found (shouldn't happen), get any easy quest
         if not quest:
-            quest = get_random_quest_by_difficulty(self.db, 'BODY_RECOVERY', 1)
+            quest = get_random_quest_by_difficulty(self.db, 'BODY_RECOVERY', 1, self.rng)
 
         return quest
 
@@ -189,7 +247,7 @@ class ContextEngine:
         Select optional bonus quests for the day
         Should be from different categories than primary
         """
-        primary_category = primary_quest[1]  # category is index 1
+        primary_category = primary_quest.category
 
         bonus_quests = []
         categories_to_try = [
@@ -202,7 +260,7 @@ class ContextEngine:
 
         # Get one quest from each category
         for category in categories_to_try[:count]:
-            quest = get_random_quest_by_difficulty(self.db, category, 2)
+            quest = get_random_quest_by_difficulty(self.db, category, 2, self.rng)
             if quest:
                 bonus_quests.append(quest)
 
@@ -231,6 +289,16 @@ class ContextEngine:
 
         return False
 
+    def get_pattern_insights(self, limit=None):
+        """
+        Ranked insights about the user's habits
+
+        Read from counters that Database maintains on every write, so this
+        never rescans quest_history or reflections.
+        """
+        insights = self.db.get_pattern_insights()
+        return insights[:limit] if limit else insights
+
     def get_champion_message(self, user_profile):
         """
         Generate personalized champion message based on progress
@@ -258,20 +326,18 @@ class ContextEngine:
         If user fails a quest, select an easier version next time
         This ensures quests stay in "impossible to fail" range
         """
-        quest = self.db.cursor.execute(
-            'SELECT * FROM quests WHERE id = ?', (quest_id,)
-        ).fetchone()
+        quest = get_quest_by_id(self.db, quest_id)
 
         if not quest:
             return None
 
-        category = quest[1]
-        current_difficulty = quest[5]
+        category = quest.category
+        current_difficulty = quest.difficulty_level
 
         # Get easier quest from same category
         new_difficulty = max(1, current_difficulty - 1)
         easier_quest = get_random_quest_by_difficulty(
-            self.db, category, new_difficulty
+            self.db, category, new_difficulty, self.rng
         )
 
         return easier_quest
@@ -280,8 +346,7 @@ class ContextEngine:
         """
         Enhance the quest's why message with context-aware details
         """
-        # Quest tuple structure: id, category, title, description, duration, xp, difficulty, tier, why_text, instructions
-        base_why = quest[8] if len(quest) > 8 else "You can do this."  # why_text is index 8
+        base_why = quest.why_text or "You can do this."
 
         # Add time-specific context
         if time_of_day == 'morning':
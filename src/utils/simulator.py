@@ -0,0 +1,294 @@
+"""
+BackToLife Simulator
+Headless replay of the daily quest loop against throwaway databases
+Reports per-step latency percentiles, database growth and category spread
+
+Usage:
+    python -m src.utils.simulator --users 3 --days 365 --seed 1
+
+No GUI or audio is touched, so it runs anywhere SQLite does.
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import NamedTuple
+
+from src.data.quest_database import initialize_quest_database
+from src.services.database import Database
+from src.utils.context_engine import ContextEngine
+
+
+class SyntheticUser(NamedTuple):
+    """Behaviour profile for one simulated user"""
+    name: str
+    completion_rate: float  # chance of finishing the daily quest
+    reflection_rate: float  # chance of writing a reflection
+    energy_mean: float  # 1-10 scale
+    active_hours: tuple  # (first, last) hour the user opens the app
+
+
+PERSONAS = (
+    SyntheticUser('steady', 0.9, 0.8, 6.5, (7, 21)),
+    SyntheticUser('struggling', 0.55, 0.4, 3.5, (11, 23)),
+    SyntheticUser('sporadic', 0.3, 0.2, 5.0, (0, 23)),
+)
+
+MOODS = ('great', 'good', 'okay', 'not great', 'struggling')
+SLEEP = ('great', 'good', 'okay', 'poor')
+
+STEPS = ('capture_context', 'select_quest', 'complete_quest', 'save_reflection')
+
+
+class LatencyRecorder:
+    """Collects per-step timings in milliseconds"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def time(self, step, func, *args, **kwargs):
+        """Call func, record how long it took under step, return its result"""
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        self.samples[step].append((time.perf_counter() - start) * 1000.0)
+        return result
+
+    def summary(self):
+        """count/mean/p50/p90/p99/max per step"""
+        report = {}
+        for step in STEPS:
+            values = sorted(self.samples.get(step, ()))
+            if not values:
+                continue
+            report[step] = {
+                'count': len(values),
+                'mean_ms': sum(values) / len(values),
+                'p50_ms': percentile(values, 50),
+                'p90_ms': percentile(values, 90),
+                'p99_ms': percentile(values, 99),
+                'max_ms': values[-1]
+            }
+        return report
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def database_bytes(db):
+    """Size on disk of the database file plus its WAL"""
+    total = 0
+    for suffix in ('', '-wal'):
+        path = f"{db.db_path}{suffix}"
+        if os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+
+class Simulator:
+    """
+    Drives ContextEngine -> complete_quest -> save_reflection for N days
+
+    Each synthetic user gets a fresh database file in a temporary
+    directory. Randomness comes from seeded Random instances and time
+    from a simulated clock, so a given (seed, users, days) always replays
+    the same run.
+    """
+
+    def __init__(self, days=90, users=len(PERSONAS), seed=0,
+                 start=datetime(2025, 1, 1), workdir=None, sample_every=30):
+        self.days = days
+        self.users = users
+        self.seed = seed
+        self.start = start
+        self.workdir = workdir
+        self.sample_every = max(1, sample_every)
+        self.latency = LatencyRecorder()
+
+    def run(self):
+        """Simulate every user and return the combined report"""
+        owns_workdir = self.workdir is None
+        workdir = self.workdir or tempfile.mkdtemp(prefix='backtolife_sim_')
+        try:
+            users = [
+                self.simulate_user(index, PERSONAS[index % len(PERSONAS)], workdir)
+                for index in range(self.users)
+            ]
+        finally:
+            if owns_workdir:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+        categories = Counter()
+        for user in users:
+            categories.update(user['categories'])
+
+        return {
+            'days': self.days,
+            'users': self.users,
+            'seed': self.seed,
+            'latency': self.latency.summary(),
+            'categories': dict(categories.most_common()),
+            'per_user': users
+        }
+
+    def simulate_user(self, index, persona, workdir):
+        """Replay self.days days for one synthetic user"""
+        behaviour = random.Random(f"{self.seed}:{index}:user")
+        sim_now = [self.start]
+
+        db = Database(os.path.join(workdir, f"user_{index}_{persona.name}.db"))
+        initialize_quest_database(db)
+        engine = ContextEngine(
+            db,
+            clock=lambda: sim_now[0],
+            rng=random.Random(f"{self.seed}:{index}:engine")
+        )
+
+        categories = Counter()
+        growth = [(0, database_bytes(db))]
+        completed = reflections = 0
+
+        for day in range(self.days):
+            first_hour, last_hour = persona.active_hours
+            sim_now[0] = self.start + timedelta(
+                days=day,
+                hours=behaviour.randint(first_hour, last_hour),
+                minutes=behaviour.randint(0, 59)
+            )
+
+            context = self.latency.time('capture_context', engine.capture_context)
+            selection = self.latency.time(
+                'select_quest', engine.select_for_context, context
+            )
+            quest = selection.quest
+
+            if quest and behaviour.random() < persona.completion_rate:
+                self.latency.time(
+                    'complete_quest', db.complete_quest,
+                    quest.id, quest.xp_value,
+                    completion_time=behaviour.randint(
+                        30, max(60, quest.duration_minutes * 120)
+                    ),
+                    was_primary=True,
+                    completed_at=sim_now[0]
+                )
+                categories[quest.category] += 1
+                completed += 1
+
+            if behaviour.random() < persona.reflection_rate:
+                energy = round(behaviour.gauss(persona.energy_mean, 2))
+                self.latency.time(
+                    'save_reflection', db.save_reflection,
+                    date=sim_now[0].strftime("%Y-%m-%d"),
+                    mood=behaviour.choice(MOODS),
+                    energy_level=max(1, min(10, energy)),
+                    sleep_quality=behaviour.choice(SLEEP),
+                    gratitude="Simulated gratitude entry"
+                )
+                reflections += 1
+
+            if (day + 1) % self.sample_every == 0:
+                growth.append((day + 1, database_bytes(db)))
+
+        db.cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        final_bytes = database_bytes(db)
+        db.close()
+
+        return {
+            'user': index,
+            'persona': persona.name,
+            'quests_completed': completed,
+            'reflections': reflections,
+            'db_bytes': final_bytes,
+            'db_bytes_per_day': final_bytes / self.days if self.days else 0.0,
+            'db_growth': growth,
+            'categories': dict(categories)
+        }
+
+
+def format_report(report):
+    """Human-readable rendering of Simulator.run()"""
+    lines = [
+        "=" * 60,
+        f"BackToLife simulation: {report['users']} users x {report['days']} days "
+        f"(seed {report['seed']})",
+        "=" * 60,
+        "",
+        f"{'step':<18}{'count':>8}{'mean':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}"
+    ]
+    for step, stats in report['latency'].items():
+        lines.append(
+            f"{step:<18}{stats['count']:>8}"
+            f"{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+            f"{stats['p90_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}"
+        )
+    lines.append("(times in ms)")
+
+    lines += ["", "Database growth"]
+    for user in report['per_user']:
+        lines.append(
+            f"  user {user['user']} ({user['persona']}): "
+            f"{user['quests_completed']} quests, {user['reflections']} reflections, "
+            f"{user['db_bytes'] / 1024:.1f} KiB "
+            f"({user['db_bytes_per_day']:.0f} B/day)"
+        )
+
+    total = sum(report['categories'].values())
+    lines += ["", "Category distribution"]
+    for category, count in report['categories'].items():
+        share = count / total * 100 if total else 0
+        lines.append(f"  {category:<18}{count:>7}  {share:5.1f}%")
+
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Replay the BackToLife quest loop headlessly"
+    )
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--users', type=int, default=len(PERSONAS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sample-every', type=int, default=30,
+                        help="days between database size samples")
+    parser.add_argument('--keep', metavar='DIR',
+                        help="write databases to DIR and keep them")
+    parser.add_argument('--json', action='store_true',
+                        help="print the raw report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.keep:
+        os.makedirs(args.keep, exist_ok=True)
+
+    simulator = Simulator(
+        days=args.days,
+        users=args.users,
+        seed=args.seed,
+        workdir=args.keep,
+        sample_every=args.sample_every
+    )
+    # Keep stdout pure JSON: progress messages (e.g. quest seeding) go to stderr
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        report = simulator.run()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+    return report
+
+
+if __name__ == "__main__":
+    main()